@@ -1,6 +1,21 @@
 import streamlit as st
 import nltk
-nltk.download('punkt')
+import numpy as np
+import pandas as pd
+
+from findash.correlation import correlation_view
+from findash.data import clean_indicators, coerce_year, load_indicators
+from findash.prefetch import Prefetcher
+from findash.scenarios import DEFAULT_SCENARIOS, growth_index
+from findash.sensitivity import contribution_growth_grid
+from findash.wealth import wealth_trajectory
+from findash.ui import begin_page, correlation_panel, end_page
+from findash.telemetry import span
+
+begin_page("Main")
+
+with span("nltk_download"):
+    nltk.download('punkt')
 
 st.title("📊 Financial Scenario Dashboard")
 
@@ -17,6 +32,57 @@ def prev_step():
     st.session_state.step -= 1
 
 
+# ---------------------------------------------
+# Step loaders
+# ---------------------------------------------
+# These run on a background worker while the user reads the previous step,
+# so they must not call Streamlit. token.check() stops a cancelled prefetch.
+def load_eda_step(token):
+    df = coerce_year(load_indicators())
+    token.check()
+    describe = df.describe(include="all")
+    token.check()
+    return {"data": df, "describe": describe, "corr": correlation_view(df)}
+
+def load_process_step(token):
+    raw = load_indicators()
+    token.check()
+    clean = clean_indicators(raw)
+    return {"rows": len(raw), "dropped": len(raw) - len(clean),
+            "first_year": int(clean["Year"].min()), "last_year": int(clean["Year"].max())}
+
+def load_modelling_step(token):
+    years = np.arange(2025, 2046)
+    scen = pd.DataFrame(growth_index(list(DEFAULT_SCENARIOS.values()), len(years)).T,
+                        index=years, columns=list(DEFAULT_SCENARIOS))
+    token.check()
+    contrib_rates, returns = [200, 400, 600], [0.05, 0.07, 0.09]
+    grid = contribution_growth_grid(contrib_rates, returns, len(years))
+    sens = pd.DataFrame({f"RM{c}/m @ {int(r*100)}%": grid[i, j, :]
+                         for i, c in enumerate(contrib_rates) for j, r in enumerate(returns)},
+                        index=years)
+    return {"scenarios": scen, "sensitivity": sens}
+
+def load_results_step(token):
+    years, buy, rent = wealth_trajectory()
+    return {"trajectory": pd.DataFrame({"Buy": buy, "Rent & Invest": rent}, index=2025 + years)}
+
+STEP_LOADERS = {3: load_eda_step, 4: load_process_step, 5: load_modelling_step, 6: load_results_step}
+
+# One prefetcher per session: keep the current step, warm the next one and
+# cancel anything still running for steps the user has left.
+if "prefetcher" not in st.session_state:
+    st.session_state.prefetcher = Prefetcher()
+prefetcher = st.session_state.prefetcher
+prefetcher.cancel_except({st.session_state.step, st.session_state.step + 1})
+if st.session_state.step + 1 in STEP_LOADERS:
+    prefetcher.prefetch(st.session_state.step + 1, STEP_LOADERS[st.session_state.step + 1])
+
+def step_data(step: int):
+    with span(f"step_{step}_data"):
+        return prefetcher.get(step, STEP_LOADERS[step])
+
+
 # --- Step 1: Hypotheses ---
 if st.session_state.step == 1:
     st.header("🧩 Hypotheses / Expected Outcome")
@@ -46,6 +112,9 @@ elif st.session_state.step == 3:
     - Word clouds, summary stats, and visuals.  
     - Patterns and anomalies before modelling.  
     """)
+    eda = step_data(3)
+    st.dataframe(eda["describe"], use_container_width=True)
+    correlation_panel(eda["data"], "main", view=eda["corr"])
     col1, col2 = st.columns(2)
     col1.button("← Back", on_click=prev_step)
     col2.button("Next →", on_click=next_step)
@@ -57,6 +126,11 @@ elif st.session_state.step == 4:
     st.markdown("""
     - Data cleaning, transformation, and feature engineering.  
     """)
+    proc = step_data(4)
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Records", proc["rows"])
+    c2.metric("Removed while cleaning", proc["dropped"])
+    c3.metric("Years", f"{proc['first_year']}–{proc['last_year']}")
     col1, col2 = st.columns(2)
     col1.button("← Back", on_click=prev_step)
     col2.button("Next →", on_click=next_step)
@@ -69,6 +143,9 @@ elif st.session_state.step == 5:
     - Scenario analysis (baseline / optimistic / pessimistic).  
     - Sensitivity analysis of contributions and returns.  
     """)
+    model = step_data(5)
+    st.line_chart(model["scenarios"])
+    st.line_chart(model["sensitivity"])
     col1, col2 = st.columns(2)
     col1.button("← Back", on_click=prev_step)
     col2.button("Next →", on_click=next_step)
@@ -81,6 +158,7 @@ elif st.session_state.step == 6:
     - Growth projections (2025–2045).  
     - Comparison between different strategies.  
     """)
+    st.line_chart(step_data(6)["trajectory"])
     col1, col2 = st.columns(2)
     col1.button("← Back", on_click=prev_step)
     col2.button("Next →", on_click=next_step)
@@ -108,3 +186,5 @@ elif st.session_state.step == 7:
     This tool is for educational purposes only and does **not** constitute financial advice.  
     """)
     st.button("← Back", on_click=prev_step)
+
+end_page()
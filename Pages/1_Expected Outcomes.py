@@ -1,6 +1,19 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
+import matplotlib.pyplot as plt
+
+from findash.charts import ChartSpec, line_chart
+from findash.data import clean_indicators, load_indicators
+from findash.diskcache import cached_call
+from findash.graph import wealth_graph
+from findash.optimize import optimize_financing
+from findash.variable_rate import amortize_variable, opr_linked_rates, simulate_opr_paths
+from findash.ui import begin_page, chart_backend, end_page, show_chart
+from findash.telemetry import span
+
+begin_page("Expected Outcomes")
+backend = chart_backend()
 
 # ---- Sidebar Navigation ----
 def navigation_guide(current_page: str):
@@ -11,7 +24,8 @@ def navigation_guide(current_page: str):
         "⚙️ Data Process",
         "📈 Modelling",
         "📖 Interpretation",
-        "🚀 Deployment"
+        "🚀 Deployment",
+        "🏘️ Portfolio"
     ]
     with st.sidebar:
         st.markdown("## 📌 Navigation Guide")
@@ -53,54 +67,6 @@ st.set_page_config(
 
 st.title("🏠 Buying vs Renting in Kuala Lumpur: 30-Year Wealth Simulation")
 
-# ---------------------------------------------
-# Core financial functions
-# ---------------------------------------------
-def monthly_mortgage_payment(principal: float, annual_rate: float, years: int) -> float:
-    """Calculate monthly mortgage payment."""
-    r = annual_rate / 12.0
-    n = years * 12
-    if annual_rate == 0:
-        return principal / n
-    return principal * (r * (1 + r) ** n) / ((1 + r) ** n - 1)
-
-def fv_lump_sum(pv: float, annual_rate: float, years: int) -> float:
-    """Future value of a lump sum investment."""
-    return pv * ((1 + annual_rate) ** years)
-
-def fv_monthly_annuity(pmt: float, annual_rate: float, years: int) -> float:
-    """Future value of monthly contributions."""
-    r = annual_rate / 12.0
-    n = years * 12
-    if annual_rate == 0:
-        return pmt * n
-    return pmt * (((1 + r) ** n - 1) / r)
-
-def buy_vs_rent_wealth(
-    house_price: float = 800_000.0,
-    down_pct: float = 0.10,
-    mortgage_rate: float = 0.04,
-    term_years: int = 30,
-    rent_yield: float = 0.045,
-    invest_return: float = 0.06,
-    home_appreciation: float = 0.02,
-):
-    """Compare long-term wealth between buying and renting."""
-    loan = house_price * (1 - down_pct)
-    down = house_price * down_pct
-
-    # Monthly mortgage and rent
-    m_mort = monthly_mortgage_payment(loan, mortgage_rate, term_years)
-    monthly_rent = (house_price * rent_yield) / 12.0
-    monthly_contribution = m_mort - monthly_rent
-
-    # Wealth calculations
-    buy_wealth = fv_lump_sum(house_price, home_appreciation, term_years)
-    rent_wealth = fv_lump_sum(down, invest_return, term_years) + \
-                  fv_monthly_annuity(monthly_contribution, invest_return, term_years)
-    diff = buy_wealth - rent_wealth
-    return buy_wealth, rent_wealth, diff
-
 # ---------------------------------------------
 # Sidebar — Inputs
 # ---------------------------------------------
@@ -115,17 +81,25 @@ term_years = st.sidebar.slider("Loan Term (years)", 5, 40, 30, 1)
 rent_yield = st.sidebar.slider("Rent Yield (% of property / year)", 0.0, 10.0, 4.5, 0.1) / 100.0
 invest_return = st.sidebar.slider("Investment Return (%)", 0.0, 15.0, 6.0, 0.1) / 100.0
 home_appreciation = st.sidebar.slider("Home Appreciation (%)", 0.0, 10.0, 2.0, 0.1) / 100.0
+rent_growth = st.sidebar.slider("Annual Rent Increase (%)", 0.0, 10.0, 0.0, 0.1) / 100.0
 
-# Compute base case
-buy_wealth, rent_wealth, diff = buy_vs_rent_wealth(
-    house_price=house_price,
-    down_pct=down_pct,
-    mortgage_rate=mortgage_rate,
-    term_years=term_years,
-    rent_yield=rent_yield,
-    invest_return=invest_return,
-    home_appreciation=home_appreciation,
-)
+# Compute base case. The session's graph only recomputes the intermediates
+# downstream of the slider that moved.
+if "wealth_graph" not in st.session_state:
+    st.session_state.wealth_graph = wealth_graph()
+
+with span("simulate"):
+    sim = st.session_state.wealth_graph.evaluate(
+        house_price=house_price,
+        down_pct=down_pct,
+        mortgage_rate=mortgage_rate,
+        term_years=term_years,
+        rent_yield=rent_yield,
+        invest_return=invest_return,
+        home_appreciation=home_appreciation,
+        rent_growth=rent_growth,
+    )
+buy_wealth, rent_wealth, diff = sim["buy_wealth"], sim["rent_wealth"], sim["diff"]
 
 # ---------------------------------------------
 # Results — Metrics
@@ -138,6 +112,109 @@ col3.metric("Buy − Rent (RM)", f"RM {diff:,.0f}",
 
 st.divider()
 
+# ---------------------------------------------
+# OPR-linked variable rate
+# ---------------------------------------------
+@st.cache_data(show_spinner=False)
+def variable_rate_paths(loan: float, spread: float, term_years: int, n_paths: int, seed: int = 7):
+    def summarise(history, loan, spread, term_years, n_paths, seed):
+        opr = simulate_opr_paths(history, n_paths, term_years, seed=seed)
+        schedule = amortize_variable(loan, opr_linked_rates(opr, spread))
+        months = np.arange(1, term_years * 12 + 1)
+        bands = np.percentile(schedule.payment, [5, 50, 95], axis=0)
+        return months, bands, schedule.interest.sum(axis=1)
+
+    history = clean_indicators(load_indicators())["OPR_avg"].to_numpy()
+    return cached_call("variable_rate_paths", summarise, history=history, loan=loan, spread=spread,
+                       term_years=term_years, n_paths=n_paths, seed=seed)
+
+st.subheader("📉 OPR-Linked Variable Rate")
+st.caption(
+    "Malaysian home loans float on BR/OPR. Simulate OPR paths by resampling the "
+    "historical year-on-year moves in the dataset and re-amortize the loan whenever the rate moves."
+)
+if st.toggle("Simulate floating-rate instalments", value=False):
+    vr_cols = st.columns(2)
+    spread = vr_cols[0].slider("Spread over OPR (%)", 0.0, 4.0, 1.5, 0.05)
+    n_paths = vr_cols[1].select_slider("Rate paths", options=[1_000, 5_000, 10_000], value=5_000)
+    loan = house_price * (1 - down_pct)
+    with span("variable_rate"):
+        months, bands, total_interest = variable_rate_paths(float(loan), spread, term_years, n_paths)
+
+    fixed = sim["payment"]
+    fixed_interest = fixed * term_years * 12 - loan
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Median first-year instalment (RM)", f"RM {bands[1][0]:,.0f}",
+              delta=f"{bands[1][0] - fixed:,.0f} vs fixed", delta_color="inverse")
+    m2.metric("Median total interest (RM)", f"RM {np.median(total_interest):,.0f}",
+              delta=f"{np.median(total_interest) - fixed_interest:,.0f} vs fixed", delta_color="inverse")
+    m3.metric("95th pct total interest (RM)", f"RM {np.percentile(total_interest, 95):,.0f}")
+
+    with span("figure"):
+        fig, ax = plt.subplots()
+        ax.fill_between(months / 12, bands[0], bands[2], alpha=0.3, label="5th–95th percentile")
+        ax.plot(months / 12, bands[1], label="Median instalment")
+        ax.axhline(fixed, color="red", linestyle="--", label=f"Fixed {mortgage_rate:.1%}")
+        ax.set_xlabel("Year of loan")
+        ax.set_ylabel("Monthly instalment (RM)")
+        ax.set_title(f"Instalment range across {n_paths:,} OPR paths")
+        ax.legend()
+        st.pyplot(fig)
+
+st.divider()
+
+# ---------------------------------------------
+# Financing optimizer
+# ---------------------------------------------
+st.subheader("🧮 Best Financing Choice")
+st.caption(
+    "For the loan term in the sidebar, find the down payment that maximizes Buy − Rent "
+    "at the end of that term. Terms are not compared with each other: each term would be "
+    "measured at a different end date."
+)
+if st.toggle("Find the best down payment", value=False):
+    opt_cols = st.columns(2)
+    max_payment = opt_cols[0].number_input(
+        "Max monthly instalment (RM, 0 = no limit)", min_value=0, value=0, step=100
+    )
+    max_down_cash = opt_cols[1].number_input(
+        "Max cash for down payment (RM, 0 = no limit)", min_value=0, value=0, step=10_000
+    )
+    with span("optimize"):
+        best = cached_call(
+            "optimize_financing", optimize_financing,
+            house_price=house_price,
+            mortgage_rate=mortgage_rate,
+            term_years=term_years,
+            rent_yield=rent_yield,
+            invest_return=invest_return,
+            home_appreciation=home_appreciation,
+            rent_growth=rent_growth,
+            max_payment=max_payment or None,
+            max_down_cash=max_down_cash or None,
+        )
+    if best is None:
+        st.warning(f"No down payment satisfies these limits on a {term_years}-year loan.")
+    else:
+        b1, b2, b3 = st.columns(3)
+        b1.metric("Down Payment", f"{best.down_pct:.1%}")
+        b2.metric("Monthly Instalment (RM)", f"RM {best.monthly_payment:,.0f}")
+        # Same term, so the same horizon as the sidebar result above.
+        b3.metric(f"Buy − Rent after {best.term_years} years (RM)", f"RM {best.buy_minus_rent:,.0f}",
+                  delta=f"{round(best.buy_minus_rent - diff):,} vs {down_pct:.0%} down")
+
+        curve = pd.DataFrame({"Down Payment (%)": best.down_grid * 100, "buy_minus_rent": best.curve}).dropna()
+        with span("figure"):
+            show_chart(line_chart(curve, "Down Payment (%)",
+                                  [ChartSpec("buy_minus_rent", "Buy − Rent", "Buy − Rent (RM)", marker=None)],
+                                  f"Buy − Rent across down payments ({best.term_years}-year loan)",
+                                  xlabel="Down Payment (%)", backend=backend))
+        st.caption(f"Down payments from {best.feasible[0]:.1%} to {best.feasible[1]:.1%} meet the limits. "
+                   "Buy − Rent moves in a straight line with the down payment, so the best choice is "
+                   "always one end of that range.")
+
+st.divider()
+
 # ---------------------------------------------
 # Expected Outcomes
 # ---------------------------------------------
@@ -198,3 +275,5 @@ for label, url in SOURCES:
     )
 
 st.caption("*App logic is based on the assumptions in the uploaded report for comparability.*")
+
+end_page()
@@ -3,6 +3,16 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
+from findash.charts import line_chart, scenario_specs
+from findash.diskcache import cached_call
+from findash.montecarlo import index_fan
+from findash.scenarios import DEFAULT_SCENARIOS, growth_index
+from findash.ui import begin_page, chart_backend, download_panel, end_page, show_chart
+from findash.telemetry import span
+
+begin_page("Analysis")
+backend = chart_backend()
+
 # ---- Sidebar Navigation ----
 def navigation_guide(current_page: str):
     pages = [
@@ -12,7 +22,8 @@ def navigation_guide(current_page: str):
         "⚙️ Data Process",
         "📈 Modelling",
         "📖 Interpretation",
-        "🚀 Deployment"
+        "🚀 Deployment",
+        "🏘️ Portfolio"
     ]
     with st.sidebar:
         st.markdown("## 📌 Navigation Guide")
@@ -38,34 +49,61 @@ with st.expander("ℹ️ Description", expanded=False):
     """)
 
 # --- Define Scenarios ---
-years = np.arange(2025, 2046)
-baseline = np.cumprod([1.05]*len(years)) * 100
-optimistic = np.cumprod([1.08]*len(years)) * 100
-pessimistic = np.cumprod([1.03]*len(years)) * 100
-
-df_scen = pd.DataFrame({
-    "Year": years.astype(int),
-    "Baseline (5%)": baseline,
-    "Optimistic (8%)": optimistic,
-    "Pessimistic (3%)": pessimistic
-})
+with span("scenarios"):
+    years = np.arange(2025, 2046)
+    index = growth_index(list(DEFAULT_SCENARIOS.values()), len(years))
+
+    df_scen = pd.DataFrame({"Year": years.astype(int)})
+    for name, values in zip(DEFAULT_SCENARIOS, index):
+        df_scen[name] = values
 
 # --- Chart ---
-fig, ax = plt.subplots()
-ax.plot(df_scen["Year"], df_scen["Baseline (5%)"], label="Baseline (5%)", color="blue")
-ax.plot(df_scen["Year"], df_scen["Optimistic (8%)"], label="Optimistic (8%)", color="green")
-ax.plot(df_scen["Year"], df_scen["Pessimistic (3%)"], label="Pessimistic (3%)", color="red")
-ax.set_xlabel("Year")
-ax.set_ylabel("Index Value (Relative Growth)")
-ax.set_title("Scenario Comparison")
-ax.legend()
-st.pyplot(fig)
+with span("figure"):
+    show_chart(line_chart(df_scen, "Year", scenario_specs(DEFAULT_SCENARIOS), "Scenario Comparison",
+                          ylabel="Index Value (Relative Growth)", backend=backend))
+
+# ---- Stochastic Projection ----
+st.markdown("### 🌪️ Stochastic Projection")
+with st.expander("ℹ️ Description", expanded=False):
+    st.write("""
+    Each simulated path draws a random annual return around the scenario's
+    growth rate. The shaded bands show the 5–95% and 25–75% ranges of the
+    index per year, with the median in bold and the deterministic scenario
+    dashed. Percentiles are estimated while the paths stream through, so the
+    path count does not change the memory used.
+    """)
+
+fan_cols = st.columns(3)
+fan_scenario = fan_cols[0].selectbox("Scenario", list(DEFAULT_SCENARIOS), key="fan_scenario")
+fan_vol = fan_cols[1].slider("Annual Volatility (%)", 0.0, 30.0, 12.0, 0.5, key="fan_vol") / 100
+fan_paths = fan_cols[2].select_slider("Simulated Paths", [1_000, 10_000, 100_000, 1_000_000],
+                                      value=10_000, key="fan_paths")
+
+
+@st.cache_data(show_spinner="Simulating paths...")
+def index_bands(growth: float, volatility: float, n_years: int, n_paths: int):
+    return cached_call("montecarlo.index_fan", index_fan, growth=growth, volatility=volatility,
+                       n_years=n_years, n_paths=n_paths, seed=42)
+
+
+with span("simulate"):
+    growth = DEFAULT_SCENARIOS[fan_scenario]
+    # One year of growth per plotted year, aligned with growth_index in df_scen.
+    bands = index_bands(growth, fan_vol, len(years), fan_paths)
+
+with span("figure"):
+    fig, ax = plt.subplots()
+    ax.fill_between(years, bands[0], bands[4], alpha=0.2, color="blue", label="5–95%")
+    ax.fill_between(years, bands[1], bands[3], alpha=0.35, color="blue", label="25–75%")
+    ax.plot(years, bands[2], color="blue", linewidth=2, label="Median")
+    ax.plot(df_scen["Year"], df_scen[fan_scenario], color="black", linestyle="--", label="Deterministic")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Index Value (Relative Growth)")
+    ax.set_title(f"{fan_scenario}: {fan_paths:,} Simulated Paths")
+    ax.legend(loc="upper left")
+    st.pyplot(fig)
 
 # --- Download ---
-csv = df_scen.to_csv(index=False).encode("utf-8")
-st.download_button(
-    "⬇️ Download Scenario Results (CSV)",
-    data=csv,
-    file_name="scenario_analysis.csv",
-    mime="text/csv"
-)
+download_panel(df_scen, "⬇️ Download Scenario Results", "scenario_analysis")
+
+end_page()
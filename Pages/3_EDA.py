@@ -1,19 +1,30 @@
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
-import requests
 from collections import Counter
 import nltk
 from nltk.corpus import stopwords
 from nltk import word_tokenize, ngrams
 from nltk.stem import WordNetLemmatizer
-import os
+from wordcloud import WordCloud
 
 import streamlit as st
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
+from findash.charts import INDICATOR_CHARTS, line_chart, plot_indicator, scenario_specs
+from findash.data import coerce_year, load_indicators
+from findash.dedup import deduplicate
+from findash.forum import fetch_comments, search_posts
+from findash.scenarios import DEFAULT_SCENARIOS, growth_index
+from findash.topics import TopicModel
+from findash.ui import begin_page, chart_backend, correlation_panel, download_panel, end_page, show_chart
+from findash.telemetry import span
+
+begin_page("EDA")
+backend = chart_backend()
+
 # ---- Sidebar Navigation ----
 def navigation_guide(current_page: str):
     pages = [
@@ -23,7 +34,8 @@ def navigation_guide(current_page: str):
         "⚙️ Data Process",
         "📈 Modelling",
         "📖 Interpretation",
-        "🚀 Deployment"
+        "🚀 Deployment",
+        "🏘️ Portfolio"
     ]
     with st.sidebar:
         st.markdown("## 📌 Navigation Guide")
@@ -50,36 +62,19 @@ with st.expander("ℹ️ Description", expanded=False):
 
 # --- Define Scenarios ---
 years = np.arange(2025, 2046)
-baseline = np.cumprod([1.05]*len(years)) * 100
-optimistic = np.cumprod([1.08]*len(years)) * 100
-pessimistic = np.cumprod([1.03]*len(years)) * 100
+index = growth_index(list(DEFAULT_SCENARIOS.values()), len(years))
 
-df_scen = pd.DataFrame({
-    "Year": years.astype(int),
-    "Baseline (5%)": baseline,
-    "Optimistic (8%)": optimistic,
-    "Pessimistic (3%)": pessimistic
-})
+df_scen = pd.DataFrame({"Year": years.astype(int)})
+for name, values in zip(DEFAULT_SCENARIOS, index):
+    df_scen[name] = values
 
 # --- Chart ---
-fig, ax = plt.subplots()
-ax.plot(df_scen["Year"], df_scen["Baseline (5%)"], label="Baseline (5%)", color="blue")
-ax.plot(df_scen["Year"], df_scen["Optimistic (8%)"], label="Optimistic (8%)", color="green")
-ax.plot(df_scen["Year"], df_scen["Pessimistic (3%)"], label="Pessimistic (3%)", color="red")
-ax.set_xlabel("Year")
-ax.set_ylabel("Index Value (Relative Growth)")
-ax.set_title("Scenario Comparison")
-ax.legend()
-st.pyplot(fig)
+with span("figure"):
+    show_chart(line_chart(df_scen, "Year", scenario_specs(DEFAULT_SCENARIOS), "Scenario Comparison",
+                          ylabel="Index Value (Relative Growth)", backend=backend))
 
 # --- Download ---
-csv = df_scen.to_csv(index=False).encode("utf-8")
-st.download_button(
-    "⬇️ Download Scenario Results (CSV)",
-    data=csv,
-    file_name="scenario_analysis.csv",
-    mime="text/csv"
-)
+download_panel(df_scen, "⬇️ Download Scenario Results", "scenario_analysis")
 
 
 
@@ -100,11 +95,10 @@ nltk.download("wordnet", quiet=True)
 # ----------------------------
 @st.cache_data
 def load_data(path: str = "data.csv"):
-    if not os.path.exists(path):
-        return None, f"File not found: {path}"
     try:
-        df = pd.read_csv(path)
-        return df, None
+        return load_indicators(path), None
+    except FileNotFoundError as e:
+        return None, str(e)
     except Exception as e:
         return None, f"Error reading {path}: {e}"
 
@@ -113,28 +107,30 @@ def load_data(path: str = "data.csv"):
 # ----------------------------
 @st.cache_data(show_spinner=False)
 def scrape_reddit_no_api(query="rent vs buy", subreddit="MalaysianPF", limit=20):
-    url = f"https://www.reddit.com/r/{subreddit}/search.json?q={query}&restrict_sr=1&limit={limit}&sort=new"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    try:
-        r = requests.get(url, headers=headers, timeout=10)
-    except requests.RequestException as e:
-        return pd.DataFrame([{"error": f"Network error: {e}"}])
-
-    if r.status_code != 200:
-        return pd.DataFrame([{"error": f"Failed to fetch Reddit data: HTTP {r.status_code}"}])
-
-    data = r.json()
-    posts = []
-    for post in data.get("data", {}).get("children", []):
-        p = post.get("data", {})
-        posts.append({
-            "platform": "Reddit",
-            "subreddit": subreddit,
-            "title": p.get("title"),
-            "url": "https://reddit.com" + str(p.get("permalink", "")),
-            "content": (p.get("selftext") or "")[:300]
-        })
-    return pd.DataFrame(posts)
+    with span("scrape"):
+        return search_posts(query, subreddit, limit)
+
+@st.cache_data(show_spinner=False)
+def scrape_comments(posts: pd.DataFrame, workers: int):
+    with span("comments"):
+        return fetch_comments(posts, max_workers=workers)
+
+@st.cache_data(show_spinner=False)
+def remove_duplicates(df: pd.DataFrame, columns: tuple, threshold: float):
+    with span("dedup"):
+        return deduplicate(df, list(columns), threshold=threshold)
+
+def topic_model(texts: list, n_topics: int) -> TopicModel:
+    """This session's model for ``n_topics``, updated with any texts it has not seen."""
+    state = st.session_state.setdefault(f"topics_{n_topics}", {"model": TopicModel(n_topics), "seen": set()})
+    new = [t for t in texts if hash(t) not in state["seen"]]
+    if new:
+        if state["model"].centroids is None:
+            state["model"].fit(new)
+        else:
+            state["model"].partial_fit(new)
+        state["seen"].update(hash(t) for t in new)
+    return state["model"]
 
 # ----------------------------
 # Text Preprocessing
@@ -169,20 +165,14 @@ page = st.sidebar.radio("Go to:", ["📊 EDA", "💬 Forum Scraper"])
 if page == "📊 EDA":
     st.title("🔎 Exploratory Data Analysis (EDA)")
 
-    df, err = load_data("data.csv")
+    with span("load_data"):
+        df, err = load_data("data.csv")
     if err:
         st.error(err)
         st.stop()
 
     # Ensure Year is integer (consistent with Analysis/Expected Outcomes)
-    if "Year" in df.columns:
-        # Coerce to numeric first to avoid stray strings, then cast to int
-        df["Year"] = pd.to_numeric(df["Year"], errors="coerce").astype("Int64")
-        # Optional: drop rows where Year couldn't be parsed
-        if df["Year"].isna().any():
-            df = df.dropna(subset=["Year"]).copy()
-        df["Year"] = df["Year"].astype(int)
-        df = df.reset_index(drop=True)
+    df = coerce_year(df)
 
     # Data Preview
     st.subheader("📋 Data Preview")
@@ -190,50 +180,138 @@ if page == "📊 EDA":
 
     # Summary Statistics
     st.subheader("📊 Summary Statistics")
-    st.write(df.describe(include="all"))
+    with span("describe"):
+        st.write(df.describe(include="all"))
 
     # Chart Selector
     st.subheader("📈 Visual Analysis")
+    chart_names = {f"{spec.name} vs Year": spec for spec in INDICATOR_CHARTS}
     chart_type = st.selectbox(
         "Select a chart to display:",
-        ["OPR vs Year", "EPF vs Year", "Price Growth vs Year", "Rent Yield vs Year", "Correlation Heatmap"]
+        list(chart_names) + ["Correlation Heatmap"]
     )
 
-    if chart_type == "OPR vs Year" and "OPR_avg" in df.columns and "Year" in df.columns:
-        fig, ax = plt.subplots()
-        ax.plot(df["Year"], df["OPR_avg"], marker="o", label="OPR (%)", color="blue")
-        ax.set_xlabel("Year"); ax.set_ylabel("OPR (%)")
-        ax.set_title("Trend of OPR vs Year")
-        ax.legend(); st.pyplot(fig)
-
-    elif chart_type == "EPF vs Year" and "EPF" in df.columns and "Year" in df.columns:
-        fig, ax = plt.subplots()
-        ax.plot(df["Year"], df["EPF"], marker="s", label="EPF (%)", color="orange")
-        ax.set_xlabel("Year"); ax.set_ylabel("EPF (%)")
-        ax.set_title("Trend of EPF vs Year")
-        ax.legend(); st.pyplot(fig)
-
-    elif chart_type == "Price Growth vs Year" and "PriceGrowth" in df.columns and "Year" in df.columns:
-        fig, ax = plt.subplots()
-        ax.plot(df["Year"], df["PriceGrowth"], marker="^", label="Price Growth (%)", color="green")
-        ax.set_xlabel("Year"); ax.set_ylabel("Price Growth (%)")
-        ax.set_title("Trend of Price Growth vs Year")
-        ax.legend(); st.pyplot(fig)
-
-    elif chart_type == "Rent Yield vs Year" and "RentYield" in df.columns and "Year" in df.columns:
-        fig, ax = plt.subplots()
-        ax.plot(df["Year"], df["RentYield"], marker="d", label="Rental Yield (%)", color="purple")
-        ax.set_xlabel("Year"); ax.set_ylabel("Rental Yield (%)")
-        ax.set_title("Trend of Rental Yield vs Year")
-        ax.legend(); st.pyplot(fig)
+    spec = chart_names.get(chart_type)
+    if spec is not None and spec.column in df.columns and "Year" in df.columns:
+        with span("figure"):
+            show_chart(plot_indicator(spec, df["Year"], df[spec.column], backend=backend))
 
     elif chart_type == "Correlation Heatmap":
         st.write("### Correlation Matrix")
-        corr = df.corr(numeric_only=True)
-        st.dataframe(corr.style.background_gradient(cmap="Blues"), use_container_width=True)
+        correlation_panel(df, "eda", backend=backend)
 
     # Download
     st.subheader("⬇️ Download Data")
-    csv = df.to_csv(index=False).encode("utf-8")
-    st.download_button("Download Dataset (CSV)", data=csv, file_name="EDA_data.csv", mime="text/csv")
+    download_panel(df, "Download Dataset", "EDA_data")
 
+# ----------------------------
+# Page 2: Forum Scraper
+# ----------------------------
+elif page == "💬 Forum Scraper":
+    st.title("🏡 Rent vs Buy — Forum Discussions (Malaysia)")
+    st.write("Fetching latest Reddit discussions without API keys.")
+
+    query = st.text_input("Search query:", "rent vs buy")
+    subreddit = st.selectbox("Choose subreddit:", ["MalaysianPF", "Malaysia", "personalfinance", "realestate"])
+    limit = st.slider("Number of posts", 5, 50, 20)
+    with_comments = st.checkbox("Include full comment threads", value=False,
+                                help="Downloads every comment of each post, expanding \"load more\" links up to "
+                                     "20 requests per thread; slower, but the discussion is there.")
+    workers = st.slider("Parallel downloads", 1, 16, 8, disabled=not with_comments)
+    dedup = st.checkbox("Remove near-duplicate posts and comments", value=True,
+                        help="Cross-posts and reposts would otherwise be counted more than once.")
+    dedup_threshold = st.slider("Duplicate similarity threshold", 0.5, 1.0, 0.8, 0.05, disabled=not dedup,
+                                help="Estimated Jaccard similarity of 5-character shingles.")
+    ngram_option = st.radio("Show:", ["Unigrams", "Bigrams", "Trigrams"])
+    n_topics = st.slider("Discussion topics", 2, 10, 4,
+                         help="Posts are grouped by k-means on their TF-IDF vectors.")
+
+    if st.button("Scrape Discussions"):
+        with st.spinner("Scraping Reddit..."):
+            df_posts = scrape_reddit_no_api(query, subreddit, limit)
+
+            # Handle errors (keep your original UX)
+            if df_posts.empty or ("error" in df_posts.columns):
+                msg = df_posts.iloc[0]["error"] if ("error" in df_posts.columns and not df_posts.empty) else "No posts found."
+                st.warning(msg)
+            else:
+                st.success(f"Fetched {len(df_posts)} posts from r/{subreddit}")
+                duplicates = []
+                if dedup:
+                    df_posts, removed = remove_duplicates(df_posts, ("title", "content"), dedup_threshold)
+                    duplicates.append(removed)
+                st.dataframe(df_posts, use_container_width=True)
+
+                text_series = df_posts["title"] if "title" in df_posts.columns else df_posts["content"]
+                if with_comments:
+                    df_comments, stats = scrape_comments(df_posts, workers)
+                    st.success(f"Fetched {stats['comments']:,} comments from {stats['posts']} threads in "
+                               f"{stats['seconds']:.1f} s ({stats['comments_per_sec']:,.0f} comments/s)")
+                    if stats["failed"]:
+                        st.warning(f"{stats['failed']} thread(s) could not be downloaded.")
+                    if stats["truncated"]:
+                        st.info(f"{stats['truncated']:,} comment(s) in {stats['truncated_threads']} very long "
+                                "thread(s) were left unexpanded.")
+                    if dedup:
+                        df_comments, removed = remove_duplicates(df_comments, ("body",), dedup_threshold)
+                        duplicates.append(removed)
+                    with st.expander("💬 Comments"):
+                        st.dataframe(df_comments, use_container_width=True, hide_index=True)
+                    text_series = pd.concat([text_series, df_comments["body"]], ignore_index=True)
+
+                n_duplicates = sum(len(d) for d in duplicates)
+                if n_duplicates:
+                    with st.expander(f"🧹 {n_duplicates:,} near-duplicates removed"):
+                        for removed in duplicates:
+                            if len(removed):
+                                st.dataframe(removed, use_container_width=True)
+
+                # Topics
+                st.subheader("🧭 Discussion Topics")
+                corpus = (df_posts["title"].fillna("") + " " + df_posts["content"].fillna("")).tolist()
+                if with_comments:
+                    corpus += df_comments["body"].tolist()
+                with span("topics"):
+                    model = topic_model(corpus, n_topics)
+                    topics = model.summary(corpus, n_terms=8, n_examples=3)
+                st.caption(f"Model trained on {model.n_docs:,} posts and comments so far in this session; "
+                           "new scrapes update it.")
+                st.dataframe(topics[["topic", "posts", "top terms"]], use_container_width=True, hide_index=True)
+                for topic in topics.to_dict("records"):
+                    if topic["posts"]:
+                        with st.expander(f"Topic {topic['topic']}: {topic['top terms']}"):
+                            for post in topic["representative posts"]:
+                                st.markdown(f"- {post}")
+
+                # Word Cloud & Top Words Side-by-Side
+                st.subheader("📊 Word Cloud & Top Words/Phrases")
+                tokens = preprocess_text(text_series)
+
+                if tokens:
+                    n = 1 if ngram_option == "Unigrams" else 2 if ngram_option == "Bigrams" else 3
+                    top_ngrams = get_top_ngrams(tokens, n=n, top_k=10)
+
+                    col1, col2 = st.columns(2)
+
+                    with col1:
+                        st.write("### Word Cloud")
+                        if n == 1:
+                            wc_text = " ".join(tokens)
+                            with span("figure"):
+                                wc = WordCloud(width=800, height=400, background_color="white").generate(wc_text)
+                                fig, ax = plt.subplots(figsize=(10, 5))
+                                ax.imshow(wc, interpolation="bilinear")
+                                ax.axis("off")
+                                st.pyplot(fig)
+                        else:
+                            st.info("Word Cloud only for unigrams. Showing Top Phrases instead.")
+
+                    with col2:
+                        st.write(f"### Top 10 {ngram_option}")
+                        top_words = [" ".join(w) if isinstance(w, tuple) else w for w, count in top_ngrams]
+                        counts = [count for w, count in top_ngrams]
+                        st.table(pd.DataFrame({"Word/Phrase": top_words, "Count": counts}))
+                else:
+                    st.warning("No text available for analysis.")
+
+end_page()
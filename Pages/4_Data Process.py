@@ -1,11 +1,20 @@
+import os
+
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+
+from findash.charts import INDICATOR_CHARTS, chart_for, plot_indicator
+from findash.data import clean_indicators, load_indicators, resolve_path
+from findash.resample import GRANULARITIES, load_indicator_set
+from findash.ui import begin_page, chart_backend, correlation_panel, download_panel, end_page, show_chart
+from findash.telemetry import span
 
 # ---------------------------------------------
 # Page Setup
 # ---------------------------------------------
 st.set_page_config(page_title="⚙️ Data Process", page_icon="⚙️", layout="wide")
+begin_page("Data Process")
+backend = chart_backend()
 
 # ---- Sidebar Navigation ----
 def navigation_guide(current_page: str):
@@ -16,7 +25,8 @@ def navigation_guide(current_page: str):
         "⚙️ Data Process",
         "📈 Modelling",
         "📖 Interpretation",
-        "🚀 Deployment"
+        "🚀 Deployment",
+        "🏘️ Portfolio"
     ]
     with st.sidebar:
         st.markdown("## 📌 Navigation Guide")
@@ -34,12 +44,18 @@ navigation_guide("⚙️ Data Process")
 # ---------------------------------------------
 @st.cache_data
 def load_data(filepath="data.csv"):
-    return pd.read_csv(filepath)
+    return load_indicators(filepath)
+
+@st.cache_resource
+def indicator_set(path: str, mtime: float):
+    # One IndicatorSet per file version; it memoizes its own granularity views.
+    return load_indicator_set(path)
 
 st.title("⚙️ Data Processing Dashboard")
 
 # Load dataset
-df = load_data()
+with span("load_data"):
+    df = load_data()
 
 # === Data Collection
 st.header("✅ Data Collection")
@@ -51,14 +67,9 @@ st.write(f"**Years detected:** {years[0]} to {years[-1]}  \n(**{len(years)} year
 st.header("✅ Data Cleansing")
 initial_rows = len(df)
 
-# Drop missing
-df_clean = df.dropna().copy()
-
-# Ensure Year is numeric (same as in EDA)
-if "Year" in df_clean.columns:
-    df_clean["Year"] = pd.to_numeric(df_clean["Year"], errors="coerce").astype("Int64")
-    df_clean = df_clean.dropna(subset=["Year"]).copy()
-    df_clean["Year"] = df_clean["Year"].astype(int)
+with span("clean"):
+    # Drop missing rows and ensure Year is numeric (same as in EDA)
+    df_clean = clean_indicators(df)
 
 dropped = initial_rows - len(df_clean)
 if dropped == 0:
@@ -71,21 +82,15 @@ with st.expander("🔎 Preview Cleaned Data"):
 
 # === Summary Statistics
 st.header("📊 Summary Statistics")
-st.dataframe(df_clean.describe(include="all"))
+with span("describe"):
+    st.dataframe(df_clean.describe(include="all"))
 
 # === Correlation Matrix
 st.header("📈 Correlation Matrix")
-corr = df_clean.corr(numeric_only=True)
-st.dataframe(corr.style.background_gradient(cmap="Blues"), use_container_width=True)
+correlation_panel(df_clean, "process", backend=backend)
 
 # === Download full CSV
-csv = df_clean.to_csv(index=False).encode("utf-8")
-st.download_button(
-    "⬇️ Download Cleaned CSV",
-    data=csv,
-    file_name="cleaned_data.csv",
-    mime="text/csv"
-)
+download_panel(df_clean, "⬇️ Download Cleaned Data", "cleaned_data")
 
 # === Year Range Filter
 st.header("📅 Year Range Filter")
@@ -96,17 +101,11 @@ min_year, max_year = st.slider(
     value=(int(years[0]), int(years[-1])),
     step=1
 )
-filtered_df = df_clean[(df_clean["Year"] >= min_year) & (df_clean["Year"] <= max_year)]
 
 # === Trend Chart(s)
 st.header("📉 Trend Chart(s)")
 
-chart_options = {
-    "OPR_avg": "OPR (%)",
-    "PriceGrowth": "Price Growth (%)",
-    "RentYield": "Rental Yield (%)",
-    "EPF": "EPF (%)"
-}
+chart_options = {spec.column: spec.label for spec in INDICATOR_CHARTS}
 
 selected_columns = st.multiselect(
     "Select variables to plot against Year:",
@@ -115,12 +114,21 @@ selected_columns = st.multiselect(
     format_func=lambda x: chart_options[x]
 )
 
+granularity = st.radio("Granularity:", list(GRANULARITIES), horizontal=True)
+with span("resample"):
+    path = resolve_path()
+    indicators = indicator_set(path, os.path.getmtime(path))
+    view = indicators.view(granularity)
+    view = view[(view.index.year >= min_year) & (view.index.year <= max_year)]
+st.caption("Aggregation: " + ", ".join(
+    f"{chart_options.get(name, name)} by {indicators.aggregation(name)}" for name in indicators.names))
+x = view.index.year if granularity == "Annual" else view.index.to_timestamp()
+
 # Plot each selected variable
 for col in selected_columns:
-    if col in filtered_df.columns:
-        fig, ax = plt.subplots()
-        ax.plot(filtered_df["Year"], filtered_df[col], marker="o")
-        ax.set_xlabel("Year")
-        ax.set_ylabel(chart_options[col])
-        ax.set_title(f"{chart_options[col]} vs Year")
-        st.pyplot(fig)
+    if col in view.columns:
+        with span("figure"):
+            spec = chart_for(col)
+            show_chart(plot_indicator(spec, x, view[col], title=f"{spec.label} vs Year ({granularity})", backend=backend))
+
+end_page()
@@ -3,10 +3,19 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
+from findash.charts import ChartSpec, line_chart
+from findash.diskcache import cached_call
+from findash.sensitivity import contribution_growth_grid
+from findash.sobol import WEALTH_BOUNDS, sobol_indices
+from findash.ui import begin_page, chart_backend, download_panel, end_page, show_chart
+from findash.telemetry import span
+
 # ---------------------------------------------
 # Page Setup
 # ---------------------------------------------
 st.set_page_config(page_title="📊 Modelling", page_icon="📊", layout="wide")
+begin_page("Modelling")
+backend = chart_backend()
 
 # ---- Sidebar Navigation ----
 def navigation_guide(current_page: str):
@@ -17,7 +26,8 @@ def navigation_guide(current_page: str):
         "⚙️ Data Process",
         "📊 Modelling",
         "📑 Results and Interpretation",
-        "🚀 Deployment"
+        "🚀 Deployment",
+        "🏘️ Portfolio"
     ]
     with st.sidebar:
         st.markdown("## 📌 Navigation Guide")
@@ -47,34 +57,110 @@ contrib_rates = [200, 400, 600]
 returns = [0.05, 0.07, 0.09]
 years = np.arange(2025, 2046)
 
-results = []
-for c in contrib_rates:
-    for r in returns:
-        values = np.cumsum([c * ((1 + r)**i) for i in range(len(years))])
-        results.append(pd.DataFrame({
-            "Year": years,
-            "Contribution": c,
-            "Return": r,
-            "Value": values
-        }))
+with span("sensitivity"):
+    grid = contribution_growth_grid(contrib_rates, returns, len(years))
+
+    results = []
+    for i, c in enumerate(contrib_rates):
+        for j, r in enumerate(returns):
+            results.append(pd.DataFrame({
+                "Year": years,
+                "Contribution": c,
+                "Return": r,
+                "Value": grid[i, j]
+            }))
 
-df_sens = pd.concat(results)
+    df_sens = pd.concat(results)
 
 # --- Chart ---
-fig, ax = plt.subplots()
-for (c, r), group in df_sens.groupby(["Contribution", "Return"]):
-    ax.plot(group["Year"], group["Value"], label=f"RM{c}/m @ {int(r*100)}%")
-ax.set_title("Sensitivity of Contributions & Returns")
-ax.set_xlabel("Year")
-ax.set_ylabel("Portfolio Value (RM)")
-ax.legend()
-st.pyplot(fig)
+with span("figure"):
+    labels = [f"RM{c}/m @ {int(r*100)}%" for c in contrib_rates for r in returns]
+    df_lines = pd.DataFrame(grid.reshape(len(labels), -1).T, columns=labels).assign(Year=years)
+    specs = [ChartSpec(label, label, label, marker=None) for label in labels]
+    show_chart(line_chart(df_lines, "Year", specs, "Sensitivity of Contributions & Returns",
+                          ylabel="Portfolio Value (RM)", backend=backend))
 
 # --- Download ---
-csv = df_sens.to_csv(index=False).encode("utf-8")
-st.download_button(
-    "⬇️ Download Sensitivity Results (CSV)",
-    data=csv,
-    file_name="sensitivity_analysis.csv",
-    mime="text/csv"
-)
+download_panel(df_sens, "⬇️ Download Sensitivity Results", "sensitivity_analysis")
+
+# ---------------------------------------------
+# Global Sensitivity (Sobol Indices)
+# ---------------------------------------------
+st.markdown("### 🎯 Global Sensitivity (Sobol Indices)")
+with st.expander("ℹ️ Description", expanded=False):
+    st.write("""
+    Sobol indices split the variance of the Buy − Rent wealth gap across all 
+    inputs of the 30-year simulation. The first-order index is the share 
+    explained by an input on its own; the total effect adds its interactions 
+    with every other input. Inputs are drawn uniformly from the ranges below.
+    """)
+
+# name: (label, display scale, slider min, slider max, step)
+SOBOL_INPUTS = {
+    "house_price": ("House Price (RM)", 1, 100_000.0, 5_000_000.0, 50_000.0),
+    "down_pct": ("Down Payment (%)", 100, 0.0, 90.0, 1.0),
+    "mortgage_rate": ("Mortgage Rate (%)", 100, 0.0, 10.0, 0.1),
+    "term_years": ("Loan Term (years)", 1, 5.0, 40.0, 1.0),
+    "rent_yield": ("Rent Yield (%)", 100, 0.0, 10.0, 0.1),
+    "invest_return": ("Investment Return (%)", 100, 0.0, 15.0, 0.1),
+    "home_appreciation": ("Home Appreciation (%)", 100, 0.0, 10.0, 0.1),
+    "rent_growth": ("Annual Rent Increase (%)", 100, 0.0, 10.0, 0.1),
+}
+
+@st.cache_data(show_spinner=False)
+def run_sobol(bounds: tuple, n_evaluations: int):
+    return cached_call("sobol", sobol_indices, bounds=dict(bounds), n_evaluations=n_evaluations, seed=0)
+
+with st.form("sobol_form"):
+    range_cols = st.columns(2)
+    bounds = []
+    for k, (name, (label, scale, lo, hi, step)) in enumerate(SOBOL_INPUTS.items()):
+        default = tuple(float(v) * scale for v in WEALTH_BOUNDS[name])
+        low, high = range_cols[k % 2].slider(label, lo, hi, default, step)
+        bounds.append((name, (low / scale, high / scale)))
+    n_evaluations = st.select_slider(
+        "Model evaluations", options=[10_000, 100_000, 1_000_000], value=100_000
+    )
+    submitted = st.form_submit_button("Run Sobol Analysis")
+
+if submitted:
+    with st.spinner("Evaluating the Saltelli design..."), span("sobol"):
+        st.session_state.sobol = run_sobol(tuple(bounds), n_evaluations)
+
+if "sobol" in st.session_state:
+    res = st.session_state.sobol
+    labels = [SOBOL_INPUTS[n][0] for n in res.names]
+    df_sobol = pd.DataFrame({
+        "Input": labels,
+        "First-order": res.first,
+        "First-order ±95% CI": res.first_ci,
+        "Total effect": res.total,
+        "Total effect ±95% CI": res.total_ci,
+    }).sort_values("Total effect", ascending=False)
+    st.caption(f"{res.n_evaluations:,} model evaluations ({res.n_base:,} base samples).")
+    st.dataframe(df_sobol.round(3), use_container_width=True, hide_index=True)
+
+    with span("figure"):
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4))
+        pos = np.arange(len(labels))
+        ax1.barh(pos - 0.2, res.first, 0.4, xerr=res.first_ci, label="First-order")
+        ax1.barh(pos + 0.2, res.total, 0.4, xerr=res.total_ci, label="Total effect")
+        ax1.set_yticks(pos)
+        ax1.set_yticklabels(labels)
+        ax1.set_xlabel("Sobol index")
+        ax1.set_title("Sobol Indices (95% CI)")
+        ax1.legend()
+
+        evals = [c[0] for c in res.convergence]
+        totals = np.array([c[2] for c in res.convergence])
+        for j, label in enumerate(labels):
+            ax2.plot(evals, totals[:, j], label=label)
+        ax2.set_xscale("log")
+        ax2.set_xlabel("Model evaluations")
+        ax2.set_ylabel("Total effect")
+        ax2.set_title("Convergence")
+        ax2.legend(fontsize="small")
+        fig.tight_layout()
+        st.pyplot(fig)
+
+end_page()
@@ -1,11 +1,28 @@
+import os
+import tempfile
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from findash.backtest import rolling_backtest
+from findash.charts import ChartSpec, line_chart
+from findash.data import clean_indicators, load_indicators, resolve_path
+from findash.diskcache import cached_call
+from findash.montecarlo import wealth_fan, wealth_path_chunks
+from findash.pathstore import PathStore, store_chunks
+from findash.resample import IndicatorSet
+from findash.wealth import ENGINE_VERSION
+from findash.ui import begin_page, chart_backend, download_panel, end_page, show_chart
+from findash.telemetry import span
+
 # ---------------------------------------------
 # Page Setup
 # ---------------------------------------------
 st.set_page_config(page_title="📑 Results & Interpretation", page_icon="📑", layout="wide")
+begin_page("Results and Interpretation")
+backend = chart_backend()
 
 # ---- Sidebar Navigation ----
 def navigation_guide(current_page: str):
@@ -16,7 +33,8 @@ def navigation_guide(current_page: str):
         "⚙️ Data Process",
         "📊 Modelling",
         "📑 Results and Interpretation",
-        "🚀 Deployment"
+        "🚀 Deployment",
+        "🏘️ Portfolio"
     ]
     with st.sidebar:
         st.markdown("## 📌 Navigation Guide")
@@ -53,14 +71,126 @@ with st.expander("🔎 View Result Dataframe"):
     st.dataframe(df_results, use_container_width=True)
 
 # --- Growth Curves ---
-fig, ax = plt.subplots()
-ax.plot(df_results["Year"], df_results["Buy Equity (RM)"], marker="o", label="Buy")
-ax.plot(df_results["Year"], df_results["Rent & Invest (RM)"], marker="s", label="Rent & Invest")
-ax.set_title("Wealth Accumulation Comparison")
-ax.set_xlabel("Year")
-ax.set_ylabel("Value (RM)")
-ax.legend()
-st.pyplot(fig)
+with span("figure"):
+    specs = [ChartSpec("Buy Equity (RM)", "Buy", "Buy", marker="o"),
+             ChartSpec("Rent & Invest (RM)", "Rent & Invest", "Rent & Invest", marker="s")]
+    show_chart(line_chart(df_results, "Year", specs, "Wealth Accumulation Comparison",
+                          ylabel="Value (RM)", backend=backend))
+
+# --- Uncertainty Fan Chart ---
+st.subheader("🌪️ Uncertainty Around the Projection")
+st.write("""
+The curves above are single deterministic lines. Below, investment returns
+and house price growth vary randomly from year to year around the default
+assumptions (4% mortgage, 6% return, 2% appreciation, 4.5% rent yield).
+Bands show the 5–95% and 25–75% ranges of wealth in each year.
+""")
+unc_cols = st.columns(3)
+invest_vol = unc_cols[0].slider("Investment Volatility (%)", 0.0, 25.0, 10.0, 0.5) / 100
+home_vol = unc_cols[1].slider("House Price Volatility (%)", 0.0, 15.0, 5.0, 0.5) / 100
+n_paths = unc_cols[2].select_slider("Simulated Paths", [1_000, 10_000, 100_000, 1_000_000], value=10_000)
+
+
+@st.cache_data(show_spinner="Simulating paths...")
+def wealth_bands(invest_volatility: float, home_volatility: float, n_paths: int):
+    return cached_call("montecarlo.wealth_fan", wealth_fan, n_paths=n_paths, invest_volatility=invest_volatility,
+                       home_volatility=home_volatility, seed=42)
+
+
+with span("simulate"):
+    buy_bands, rent_bands = wealth_bands(invest_vol, home_vol, n_paths)
+    fan_years = np.arange(1, buy_bands.shape[1] + 1)
+
+with span("figure"):
+    fig, ax = plt.subplots()
+    for bands, color, label in ((buy_bands, "tab:blue", "Buy"), (rent_bands, "tab:orange", "Rent & Invest")):
+        ax.fill_between(fan_years, bands[0], bands[4], alpha=0.15, color=color)
+        ax.fill_between(fan_years, bands[1], bands[3], alpha=0.3, color=color)
+        ax.plot(fan_years, bands[2], color=color, linewidth=2, label=f"{label} (median)")
+    ax.set_title(f"Wealth Percentile Bands ({n_paths:,} paths)")
+    ax.set_xlabel("Years from Purchase")
+    ax.set_ylabel("Value (RM)")
+    ax.legend(loc="upper left")
+    st.pyplot(fig)
+
+# --- Path Drill-down ---
+if st.toggle("🔬 Keep full paths for drill-down", help="Writes every simulated path to a compact float32 file on disk."):
+
+    def path_store_file(invest_volatility: float, home_volatility: float, n_paths: int) -> str:
+        # Checked on every run rather than cached: the temp folder can be cleaned
+        # under us. store_chunks publishes atomically, so an existing file is complete.
+        params = dict(invest_volatility=invest_volatility, home_volatility=home_volatility, seed=42)
+        name = f"wealth_v{ENGINE_VERSION}_{n_paths}_{invest_volatility:.4f}_{home_volatility:.4f}.fdp"
+        filename = os.path.join(tempfile.gettempdir(), "findash_paths", name)
+        if not os.path.exists(filename):
+            with st.spinner("Writing paths to disk..."):
+                store_chunks(filename, wealth_path_chunks(n_paths=n_paths, **params), n_paths,
+                             len(fan_years), series=("buy", "rent"), params=params).close()
+        return filename
+
+    with span("path_store"):
+        store = PathStore(path_store_file(invest_vol, home_vol, n_paths))
+    drill_year = st.slider("Year to Inspect", 1, store.n_years, store.n_years)
+    buy_at, rent_at = store.year("buy", drill_year - 1), store.year("rent", drill_year - 1)
+
+    with span("figure"):
+        fig, ax = plt.subplots()
+        ax.hist(buy_at, bins=60, alpha=0.5, color="tab:blue", label="Buy")
+        ax.hist(rent_at, bins=60, alpha=0.5, color="tab:orange", label="Rent & Invest")
+        ax.set_title(f"Distribution of Wealth in Year {drill_year}")
+        ax.set_xlabel("Value (RM)")
+        ax.set_ylabel("Paths")
+        ax.legend()
+        st.pyplot(fig)
+    st.metric("Paths where Rent & Invest Beats Buy", f"{np.mean(rent_at > buy_at):.1%}")
+    st.caption(f"{store.n_paths:,} paths × {store.n_years} years stored in {store.nbytes / 2**20:.1f} MB (float32).")
+
+# --- Historical Backtest ---
+st.header("📜 Historical Backtest")
+st.write("""
+What if you had bought, or rented and invested, starting in each year of the
+indicator history? The mortgage floats at OPR plus a spread, the house grows
+with the recorded price growth, rent follows the recorded rental yield, and
+the renter's savings earn the EPF dividend. Each start year runs for the
+chosen horizon.
+""")
+bt_cols = st.columns(4)
+bt_horizon = bt_cols[0].slider("Horizon (years)", 1, 15, 5)
+bt_price = bt_cols[1].number_input("House Price (RM)", 100_000, 5_000_000, 800_000, 50_000)
+bt_down = bt_cols[2].slider("Down Payment (%)", 0, 50, 10) / 100
+bt_spread = bt_cols[3].slider("Spread over OPR (%)", 0.0, 4.0, 2.0, 0.25) / 100
+
+
+@st.cache_data(show_spinner=False)
+def historical_backtest(horizon: int, price: float, down: float, spread: float, path: str, mtime: float):
+    # ``mtime`` keys this cache on the file version, so an edited Data.csv is re-read;
+    # the disk cache below keys on the data's contents.
+    return cached_call("backtest", lambda data, **kw: rolling_backtest(IndicatorSet.from_annual(data), **kw),
+                       data=clean_indicators(load_indicators(path)), horizon_years=horizon, house_price=price,
+                       down_pct=down, spread=spread)
+
+
+with span("backtest"):
+    try:
+        data_path = resolve_path()
+        df_bt = historical_backtest(bt_horizon, float(bt_price), bt_down, bt_spread,
+                                    data_path, os.path.getmtime(data_path))
+    except (FileNotFoundError, ValueError) as e:
+        df_bt = None
+        st.warning(f"Backtest unavailable: {e}")
+
+if df_bt is not None:
+    df_bt["Start Year"] = df_bt["start"].str[:4].astype(int)
+    bt1, bt2 = st.columns(2)
+    bt1.metric("Start Years where Buying Won", f"{(df_bt['decision'] == 'buy').mean():.0%}")
+    bt2.metric("Median Buy − Rent (RM)", f"RM {df_bt['buy_minus_rent'].median():,.0f}")
+    with span("figure"):
+        specs = [ChartSpec("buy_wealth", "Buy", "Buy (equity)", marker="o"),
+                 ChartSpec("rent_wealth", "Rent & Invest", "Rent & Invest", marker="s")]
+        show_chart(line_chart(df_bt, "Start Year", specs, f"Wealth after {bt_horizon} Years by Start Year",
+                              xlabel="Start Year", ylabel="Value (RM)", backend=backend))
+    with st.expander("🔎 View Backtest Table"):
+        st.dataframe(df_bt.drop(columns="Start Year"), use_container_width=True, hide_index=True)
 
 # --- Interpretation ---
 st.header("📝 Interpretation")
@@ -80,10 +210,6 @@ st.write("""
 """)
 
 # --- Download Results ---
-csv = df_results.to_csv(index=False).encode("utf-8")
-st.download_button(
-    "⬇️ Download Results CSV",
-    data=csv,
-    file_name="results_interpretation.csv",
-    mime="text/csv"
-)
+download_panel(df_results, "⬇️ Download Results", "results_interpretation")
+
+end_page()
@@ -1,9 +1,12 @@
 import streamlit as st
 
+from findash.ui import begin_page, end_page
+
 # ---------------------------------------------
 # Page Setup
 # ---------------------------------------------
 st.set_page_config(page_title="🚀 Deployment", page_icon="🚀", layout="wide")
+begin_page("Deployment")
 
 # ---- Sidebar Navigation ----
 def navigation_guide(current_page: str):
@@ -14,7 +17,8 @@ def navigation_guide(current_page: str):
         "⚙️ Data Process",
         "📊 Modelling",
         "📑 Results and Interpretation",
-        "🚀 Deployment"
+        "🚀 Deployment",
+        "🏘️ Portfolio"
     ]
     with st.sidebar:
         st.markdown("## 📌 Navigation Guide")
@@ -73,3 +77,5 @@ st.write("""
 """)
 
 st.success("✅ Deployment ensures accessibility, scalability, and reproducibility of the research.")
+
+end_page()
@@ -0,0 +1,150 @@
+import io
+
+import streamlit as st
+import pandas as pd
+
+from findash.export import fingerprint
+from findash.portfolio import EXAMPLE_PORTFOLIO, evaluate_portfolio, filter_portfolio, sample_listings
+from findash.ui import begin_page, download_panel, end_page
+from findash.telemetry import span
+
+# ---------------------------------------------
+# Page Setup
+# ---------------------------------------------
+st.set_page_config(page_title="🏘️ Portfolio", page_icon="🏘️", layout="wide")
+begin_page("Portfolio")
+
+# ---- Sidebar Navigation ----
+def navigation_guide(current_page: str):
+    pages = [
+        "Expected Outcomes",
+        "📑 Analysis",
+        "📊 EDA",
+        "⚙️ Data Process",
+        "📊 Modelling",
+        "📑 Results and Interpretation",
+        "🚀 Deployment",
+        "🏘️ Portfolio"
+    ]
+    with st.sidebar:
+        st.markdown("## 📌 Navigation Guide")
+        for page in pages:
+            if page == current_page:
+                st.markdown(f"🔵 **{page}**")
+            else:
+                st.markdown(page)
+
+navigation_guide("🏘️ Portfolio")
+
+# ---------------------------------------------
+# Portfolio Input
+# ---------------------------------------------
+st.title("🏘️ Portfolio: Compare a Shortlist of Properties")
+st.write("""
+Evaluate every property on a shortlist at once. Each row has its own price,
+rent, financing and growth assumptions; rates, yields and the down payment
+are in percent. Missing columns fall back to the dashboard defaults.
+""")
+
+source = st.radio("Properties from:", ["✏️ Edit the example", "📤 Upload CSV / Excel", "🎲 Random listings"],
+                  horizontal=True)
+
+@st.cache_data(show_spinner="Reading file...")
+def read_upload(data: bytes, name: str) -> pd.DataFrame:
+    if name.lower().endswith((".xlsx", ".xls")):
+        return pd.read_excel(io.BytesIO(data))
+    return pd.read_csv(io.BytesIO(data))
+
+@st.cache_data(show_spinner=False)
+def random_listings(n: int) -> pd.DataFrame:
+    return sample_listings(n, seed=7)
+
+properties = None
+if source == "✏️ Edit the example":
+    properties = st.data_editor(EXAMPLE_PORTFOLIO, num_rows="dynamic", use_container_width=True,
+                                hide_index=True, key="portfolio_editor")
+elif source == "📤 Upload CSV / Excel":
+    upload = st.file_uploader("Property table", type=["csv", "xlsx"])
+    with st.expander("ℹ️ Expected columns"):
+        st.write("""
+        `name`, `house_price` (or `price`), `rent` (monthly RM) or `rent_yield`,
+        `down_pct` or `down_payment` (RM), `mortgage_rate`, `term_years`,
+        `home_appreciation`, `rent_growth`, `invest_return`.
+        """)
+    if upload is not None:
+        properties = read_upload(upload.getvalue(), upload.name)
+else:
+    n_listings = st.select_slider("Number of listings", [1_000, 10_000, 50_000, 100_000], value=10_000)
+    properties = random_listings(n_listings)
+
+if properties is None or len(properties) == 0:
+    st.info("Add at least one property to evaluate.")
+    end_page()
+    st.stop()
+
+# ---------------------------------------------
+# Evaluate (one vectorized pass, cached by table contents)
+# ---------------------------------------------
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: fingerprint})
+def evaluate(df: pd.DataFrame) -> pd.DataFrame:
+    return evaluate_portfolio(df)
+
+with span("simulate"):
+    scored = evaluate(properties)
+
+# ---------------------------------------------
+# Filters
+# ---------------------------------------------
+st.sidebar.header("🔎 Filters")
+decision = st.sidebar.selectbox("Better choice", ["Any", "buy", "rent"])
+price_cap = float(scored["house_price"].fillna(0.0).max())
+max_price = st.sidebar.number_input("Max Price (RM)", 0.0, value=price_cap, step=50_000.0)
+max_payment = st.sidebar.number_input("Max Monthly Instalment (RM)", 0.0, value=0.0, step=500.0,
+                                      help="0 = no limit")
+max_down = st.sidebar.number_input("Max Down Payment (RM)", 0.0, value=0.0, step=10_000.0, help="0 = no limit")
+
+with span("filter"):
+    shortlist = filter_portfolio(
+        scored,
+        decision=None if decision == "Any" else decision,
+        max_price=max_price,
+        max_payment=max_payment or None,
+        max_down_payment=max_down or None,
+    )
+
+c1, c2, c3 = st.columns(3)
+c1.metric("Properties Evaluated", f"{len(scored):,}")
+c2.metric("Meeting Filters", f"{len(shortlist):,}")
+c3.metric("Favour Buying", f"{(scored['decision'] == 'buy').mean():.0%}")
+
+# ---------------------------------------------
+# Ranking
+# ---------------------------------------------
+st.header("🏆 Ranking")
+st.caption("Rank 1 has the largest buy-minus-rent wealth gap at the end of its own loan term.")
+if shortlist["horizon_years"].nunique() > 1:
+    st.info("These properties have different loan terms, so each gap is measured at a different horizon "
+            "(see the Horizon column). Filter or edit to one term for a like-for-like ranking.")
+columns = ["rank", "name", "house_price", "horizon_years", "monthly_payment", "gross_yield_pct",
+           "payment_to_rent", "buy_wealth", "rent_wealth", "buy_minus_rent", "decision"]
+st.dataframe(
+    shortlist[[c for c in columns if c in shortlist.columns]].head(1_000),
+    use_container_width=True,
+    hide_index=True,
+    column_config={
+        "house_price": st.column_config.NumberColumn("Price (RM)", format="%.0f"),
+        "horizon_years": st.column_config.NumberColumn("Horizon (years)", format="%.0f"),
+        "monthly_payment": st.column_config.NumberColumn("Instalment (RM)", format="%.0f"),
+        "gross_yield_pct": st.column_config.NumberColumn("Gross Yield (%)", format="%.2f"),
+        "payment_to_rent": st.column_config.NumberColumn("Instalment / Rent", format="%.2f"),
+        "buy_wealth": st.column_config.NumberColumn("Buy Wealth (RM)", format="%.0f"),
+        "rent_wealth": st.column_config.NumberColumn("Rent Wealth (RM)", format="%.0f"),
+        "buy_minus_rent": st.column_config.NumberColumn("Buy − Rent (RM)", format="%.0f"),
+    },
+)
+if len(shortlist) > 1_000:
+    st.caption(f"Showing the top 1,000 of {len(shortlist):,}; download for the full list.")
+
+download_panel(shortlist, "⬇️ Download Ranked Shortlist", "portfolio_ranking")
+
+end_page()
@@ -0,0 +1,102 @@
+"""Load-test the findash JSON API.
+
+Starts an in-process server (or targets ``--url``) and, for each concurrency
+level, fires ``--requests`` POSTs from that many client threads, each holding
+a keep-alive connection. Reports p50/p99 latency and requests per second.
+
+    python benchmarks/api_loadtest.py --levels 1 4 16 64 --requests 2000
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from findash.api import WealthServer  # noqa: E402
+
+
+def make_body(rng: random.Random, distinct: int, batch: int) -> bytes:
+    """A /wealth body drawn from ``distinct`` parameter sets (controls cache hit rate)."""
+    def item():
+        k = rng.randrange(distinct)
+        return {"house_price": 500_000 + 1_000 * (k % 1_000), "mortgage_rate": 0.03 + 0.0001 * (k // 1_000)}
+    payload = {"items": [item() for _ in range(batch)]} if batch > 1 else item()
+    return json.dumps(payload).encode("utf-8")
+
+
+def run_level(host: str, port: int, concurrency: int, total: int, distinct: int, batch: int) -> dict:
+    latencies = []
+    lock = threading.Lock()
+    per_client = max(1, total // concurrency)
+
+    def client(seed: int):
+        rng = random.Random(seed)
+        conn = http.client.HTTPConnection(host, port, timeout=30)
+        conn.connect()
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        local = []
+        for _ in range(per_client):
+            body = make_body(rng, distinct, batch)
+            t0 = time.perf_counter()
+            conn.request("POST", "/wealth", body, {"Content-Type": "application/json"})
+            resp = conn.getresponse()
+            resp.read()
+            local.append(time.perf_counter() - t0)
+            if resp.status != 200:
+                raise RuntimeError(f"HTTP {resp.status}")
+        conn.close()
+        with lock:
+            latencies.extend(local)
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for f in [pool.submit(client, seed) for seed in range(concurrency)]:
+            f.result()
+    elapsed = time.perf_counter() - t0
+    lat = np.array(latencies) * 1000
+    return {"concurrency": concurrency, "requests": len(lat), "p50_ms": np.percentile(lat, 50),
+            "p99_ms": np.percentile(lat, 99), "rps": len(lat) / elapsed}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="existing server, e.g. http://127.0.0.1:8765 (default: start one)")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--requests", type=int, default=2000, help="requests per concurrency level")
+    parser.add_argument("--distinct", type=int, default=5000, help="distinct parameter sets to draw from")
+    parser.add_argument("--batch", type=int, default=1, help="items per request body")
+    parser.add_argument("--workers", type=int, default=8, help="server compute threads (in-process server only)")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.url:
+        target = urlparse(args.url)
+        host, port = target.hostname, target.port or 80
+    else:
+        server = WealthServer(("127.0.0.1", 0), workers=args.workers)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address
+
+    print(f"{'conc':>5} {'requests':>9} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>9}")
+    for level in args.levels:
+        r = run_level(host, port, level, args.requests, args.distinct, args.batch)
+        print(f"{r['concurrency']:>5} {r['requests']:>9} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['rps']:>9.0f}")
+    if server is not None:
+        print(f"cache: {server.cache.stats()}")
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""Compare server CPU time and payload size of the two chart backends.
+
+For each dashboard chart type, builds the chart with matplotlib (rendered
+to PNG the way ``st.pyplot`` does, at 200 dpi with a tight bounding box) and
+as a Vega-Lite spec (serialized to JSON, as ``st.vega_lite_chart`` sends it).
+Reports the median CPU time per chart over ``--repeat`` runs and the bytes
+sent to the browser.
+
+    python benchmarks/chart_backends.py --repeat 10
+"""
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from findash.charts import ChartSpec, heatmap, line_chart, scenario_specs  # noqa: E402
+from findash.scenarios import DEFAULT_SCENARIOS, growth_index  # noqa: E402
+from findash.sensitivity import contribution_growth_grid  # noqa: E402
+from findash.wealth import buy_vs_rent_wealth  # noqa: E402
+
+
+def _scenarios():
+    years = np.arange(2025, 2046)
+    df = pd.DataFrame(growth_index(list(DEFAULT_SCENARIOS.values()), len(years)).T, columns=list(DEFAULT_SCENARIOS))
+    df["Year"] = years
+    return lambda backend: line_chart(df, "Year", scenario_specs(DEFAULT_SCENARIOS), "Scenario Comparison",
+                                      ylabel="Index Value", backend=backend)
+
+
+def _sensitivity():
+    contributions, returns, years = [500, 1000, 1500], [0.04, 0.06, 0.08], np.arange(2025, 2046)
+    grid = contribution_growth_grid(contributions, returns, len(years))
+    labels = [f"RM{c}/m @ {int(r * 100)}%" for c in contributions for r in returns]
+    df = pd.DataFrame(grid.reshape(len(labels), -1).T, columns=labels).assign(Year=years)
+    specs = [ChartSpec(label, label, label, marker=None) for label in labels]
+    return lambda backend: line_chart(df, "Year", specs, "Sensitivity", ylabel="RM", backend=backend)
+
+
+def _long_series():
+    dates = pd.date_range("1990-01-01", periods=100_000, freq="h")
+    values = np.cumsum(np.random.default_rng(0).normal(0, 0.01, len(dates))) + 3
+    df = pd.DataFrame({"Date": dates, "OPR_avg": values})
+    spec = ChartSpec("OPR_avg", "OPR", "OPR (%)")
+    return lambda backend: line_chart(df, "Date", [spec], "100k-point series (LTTB)", xlabel="Date", backend=backend)
+
+
+def _heatmap():
+    downs, rates = np.linspace(0.10, 0.90, 81), np.linspace(0.02, 0.07, 51)
+    _, _, surface = buy_vs_rent_wealth(house_price=800_000, down_pct=downs[None, :], mortgage_rate=rates[:, None])
+    return lambda backend: heatmap(surface, downs * 100, rates * 100, "Buy − Rent",
+                                   "Down Payment (%)", "Mortgage Rate (%)", backend=backend)
+
+
+CHARTS = {
+    "scenario lines": _scenarios,
+    "sensitivity lines": _sensitivity,
+    "long series": _long_series,
+    "financing heatmap": _heatmap,
+}
+
+
+def payload(chart) -> bytes:
+    if isinstance(chart, dict):
+        return json.dumps(chart).encode("utf-8")
+    buf = io.BytesIO()
+    chart.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    plt.close(chart)
+    return buf.getvalue()
+
+
+def measure(build, backend: str, repeat: int):
+    times, size = [], 0
+    for _ in range(repeat):
+        t0 = time.process_time()
+        size = len(payload(build(backend)))
+        times.append(time.process_time() - t0)
+    return statistics.median(times), size
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    header = f"{'chart':<20} {'backend':<11} {'CPU ms':>8} {'payload KB':>11}"
+    print(header)
+    print("-" * len(header))
+    for name, make in CHARTS.items():
+        build = make()
+        for backend in ("matplotlib", "vega-lite"):
+            cpu, size = measure(build, backend, args.repeat)
+            print(f"{name:<20} {backend:<11} {cpu * 1000:>8.1f} {size / 1024:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Time MinHash/LSH near-duplicate detection as the corpus grows.
+
+Builds synthetic forum posts, reposts a share of them with a small edit, and
+reports signature and banding time per corpus size plus how many reposts
+were found and how many distinct posts were wrongly merged:
+
+    python benchmarks/dedup_bench.py --sizes 1000 10000 50000 --threshold 0.8
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from findash.dedup import duplicate_groups, minhash_signatures  # noqa: E402
+from reddit_standin import _sentence  # noqa: E402
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--reposts", type=float, default=0.2, help="share of posts reposted with an edit")
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--num-perm", type=int, default=128)
+    args = parser.parse_args(argv)
+
+    rows = []
+    for size in args.sizes:
+        rng = random.Random(size)
+        originals = [_sentence(rng, rng.randrange(20, 120)) for _ in range(size)]
+        n_reposts = int(size * args.reposts)
+        texts = originals + [t[:-1] + " Edit: typo." for t in originals[:n_reposts]]
+
+        t0 = time.perf_counter()
+        signatures = minhash_signatures(texts, num_perm=args.num_perm)
+        t1 = time.perf_counter()
+        groups = duplicate_groups(signatures, args.threshold)
+        t2 = time.perf_counter()
+        rows.append({
+            "posts": len(texts),
+            "signatures (s)": round(t1 - t0, 2),
+            "lsh (s)": round(t2 - t1, 2),
+            "posts/s": round(len(texts) / (t2 - t0)),
+            "reposts found": f"{(groups[size:] == np.arange(n_reposts)).mean():.1%}",
+            "false merges": int((groups[:size] != np.arange(size)).sum()),
+        })
+    print(pd.DataFrame(rows).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""Concurrent-session load test of every page with Streamlit's headless AppTest.
+
+Each simulated session opens one page and replays a scripted interaction
+(slider drags on Expected Outcomes, year-range changes in Data Process,
+chart switching and scrape clicks in EDA, ...), timing every rerun.
+``--concurrency`` sessions run at once, each in its own worker process
+(AppTest's runtime is process-global); they share the disk cache. Scrapes go
+to the local Reddit stand-in (``benchmarks/reddit_standin.py``).
+
+By default each page's sessions run as one concurrent phase, so the peak
+resident memory (this process plus all workers; shared pages are counted
+once per process) can be attributed to a page; ``--mixed`` runs all
+sessions at once instead. Reports per-page rerun latency percentiles,
+errors and peak RSS:
+
+    python benchmarks/load_harness.py --sessions 50 --concurrency 50
+    python benchmarks/load_harness.py --pages "Expected Outcomes" "Data Process" --sessions 20 --mixed
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+import streamlit.logger  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from reddit_standin import StandInServer  # noqa: E402
+
+
+# ----------------------------
+# Widget helpers
+# ----------------------------
+def widget(at, kind: str, label: str):
+    """The first ``kind`` widget (``slider``, ``selectbox``, ...) whose label starts with ``label``."""
+    for w in getattr(at, kind):
+        if w.label.startswith(label):
+            return w
+    raise LookupError(f"no {kind} labelled {label!r}")
+
+
+def drag(kind: str, label: str, values):
+    """Steps that move a slider through ``values``, one rerun each (a drag fires several)."""
+    return [(f"{label} = {v}", lambda at, v=v: widget(at, kind, label).set_value(v)) for v in values]
+
+
+def click(label: str):
+    return [(f"click {label}", lambda at: widget(at, "button", label).click())]
+
+
+# ----------------------------
+# Interaction scripts, one per page
+# ----------------------------
+def _year_ranges(rng):
+    from findash.data import clean_indicators, load_indicators
+    years = clean_indicators(load_indicators())["Year"].astype(int)
+    lo, hi = int(years.min()), int(years.max())
+    spans = [(lo + rng.randrange(0, 4), hi - rng.randrange(0, 4)) for _ in range(3)]
+    return spans + [(lo, hi)]
+
+
+def script(page: str, rng: random.Random) -> list:
+    """``[(step name, action), ...]`` for one session on ``page``."""
+    jitter = rng.choice([-0.5, 0.0, 0.5])
+    if page == "Main":
+        return click("Next →") * 5 + click("← Back")
+    if page == "Expected Outcomes":
+        return (drag("slider", "Mortgage Rate", [4.0 + jitter + d for d in (0.2, 0.4, 0.6, 0.8)])
+                + drag("slider", "Down Payment", [0.15, 0.2])
+                + drag("slider", "Loan Term", [35, 25]))
+    if page == "Analysis":
+        return (drag("slider", "Annual Volatility", [12.0 + jitter + d for d in (1.0, 2.0, 3.0)])
+                + drag("selectbox", "Scenario", ["Optimistic (8%)", "Pessimistic (3%)"]))
+    if page == "EDA":
+        charts = ["EPF vs Year", "Rent Yield vs Year", "Correlation Heatmap"]
+        return (drag("selectbox", "Select a chart", charts)
+                + drag("radio", "Go to", ["💬 Forum Scraper"])
+                + drag("checkbox", "Include full comment threads", [True])
+                + click("Scrape Discussions"))
+    if page == "Data Process":
+        return (drag("slider", "Select Year Range", _year_ranges(rng))
+                + drag("radio", "Granularity", ["Quarterly", "Monthly"]))
+    if page == "Modelling":
+        return (drag("select_slider", "Model evaluations", [10_000])
+                + click("Run Sobol Analysis"))
+    if page == "Results":
+        return (drag("slider", "Investment Volatility", [10.0 + jitter + d for d in (1.0, 2.0)])
+                + drag("slider", "Horizon", [8, 10]))
+    if page == "Deployment":
+        return []
+    if page == "Portfolio":
+        return (drag("selectbox", "Better choice", ["buy", "rent", "Any"])
+                + drag("radio", "Properties from", ["🎲 Random listings"]))
+    raise ValueError(f"no script for page {page!r}")
+
+
+PAGES = {
+    "Main": "Main.py",
+    "Expected Outcomes": "Pages/1_Expected Outcomes.py",
+    "Analysis": "Pages/2_Analysis.py",
+    "EDA": "Pages/3_EDA.py",
+    "Data Process": "Pages/4_Data Process.py",
+    "Modelling": "Pages/5_Modelling.py",
+    "Results": "Pages/6_Result and Intepretation.py",
+    "Deployment": "Pages/7_Deployment.py",
+    "Portfolio": "Pages/8_Portfolio.py",
+}
+
+
+# ----------------------------
+# Sessions and measurement
+# ----------------------------
+def run_session(page: str, seed: int, timeout: float) -> list:
+    """Open ``page``, replay its script and return one record per rerun."""
+    rng = random.Random(seed)
+    at = AppTest.from_file(os.path.join(ROOT, PAGES[page]), default_timeout=timeout)
+    records = []
+
+    def rerun(step: str):
+        t0 = time.perf_counter()
+        error = None
+        try:
+            at.run()
+            if at.exception:
+                lines = [l.strip() for l in at.exception[0].value.splitlines() if l.strip(" *")]
+                error = lines[0] if lines else "exception"
+        except Exception as e:  # timeouts and harness errors
+            error = f"{type(e).__name__}: {e}"
+        records.append({"page": page, "step": step, "seconds": time.perf_counter() - t0, "error": error})
+        return error is None
+
+    if not rerun("open"):
+        return records
+    for step, action in script(page, rng):
+        try:
+            action(at)
+        except Exception as e:  # the widget is not on screen (e.g. an earlier rerun failed)
+            records.append({"page": page, "step": step, "seconds": 0.0, "error": f"{type(e).__name__}: {e}"})
+            continue
+        rerun(step)
+    return records
+
+
+def rss(pid="self") -> int:
+    """Resident set size of a process in bytes (0 if it has gone)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+class RssSampler:
+    """Samples the combined resident set size of this process and its workers."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak = self.current()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def current() -> int:
+        return rss() + sum(rss(p.pid) for p in multiprocessing.active_children())
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, self.current())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def preload() -> None:
+    """Import what the pages import, so workers don't pay for it inside the first timed rerun."""
+    import importlib
+    for name in ("matplotlib.pyplot", "nltk", "wordcloud", "findash.ui", "findash.backtest", "findash.dedup",
+                 "findash.forum", "findash.graph", "findash.montecarlo", "findash.optimize", "findash.pathstore",
+                 "findash.portfolio", "findash.prefetch", "findash.sobol", "findash.topics", "findash.variable_rate"):
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+    for name in ("streamlit.deprecation_util", "streamlit.runtime.scriptrunner_utils.script_run_context"):
+        # AppTest resets log levels on every run, so silence these per-rerun warnings directly.
+        streamlit.logger.get_logger(name).disabled = True
+
+
+def run_phase(pages: list, sessions: int, concurrency: int, timeout: float, seed: int):
+    """Run ``sessions`` sessions spread over ``pages``; returns (records, peak RSS, seconds).
+
+    AppTest keeps the Streamlit runtime in a process-wide global, so two
+    sessions cannot run in one process at once; each concurrent session gets
+    its own worker process. Workers share the disk cache but not
+    ``st.cache_data``.
+    """
+    context = multiprocessing.get_context("fork" if sys.platform != "win32" else "spawn")
+    with RssSampler() as sampler, ProcessPoolExecutor(max_workers=concurrency, mp_context=context,
+                                                      initializer=preload) as pool:
+        t0 = time.perf_counter()
+        futures = [pool.submit(run_session, pages[i % len(pages)], seed + i, timeout) for i in range(sessions)]
+        records = [r for f in futures for r in f.result()]
+        elapsed = time.perf_counter() - t0
+    return records, sampler.peak, elapsed
+
+
+def summarize(records: list, peaks: dict) -> pd.DataFrame:
+    """Per page: first-load time and percentiles of the interaction reruns that followed."""
+    df = pd.DataFrame(records)
+    ok = df["error"].isna()
+    rows = []
+    for page, group in df.groupby("page", sort=False):
+        opened = group.loc[ok & (group["step"] == "open"), "seconds"].to_numpy() * 1000
+        ms = group.loc[ok & (group["step"] != "open"), "seconds"].to_numpy() * 1000
+        p50, p90, p99 = np.percentile(ms, [50, 90, 99]) if len(ms) else (np.nan,) * 3
+        rows.append({"page": page, "sessions": int((group["step"] == "open").sum()), "reruns": len(group),
+                     "open p50 ms": np.median(opened) if len(opened) else np.nan,
+                     "p50 ms": p50, "p90 ms": p90, "p99 ms": p99, "max ms": ms.max() if len(ms) else np.nan,
+                     "errors": int((~ok[group.index]).sum()),
+                     "peak RSS MB": peaks.get(page, peaks.get("*", 0)) / 2**20})
+    return pd.DataFrame(rows).round(0)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", nargs="+", default=list(PAGES), choices=list(PAGES), metavar="PAGE",
+                        help=f"pages to load (default: all of {', '.join(PAGES)})")
+    parser.add_argument("--sessions", type=int, default=50, help="simulated sessions per page (total with --mixed)")
+    parser.add_argument("--concurrency", type=int, default=50, help="sessions running at the same time")
+    parser.add_argument("--mixed", action="store_true", help="run every page's sessions in one phase")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds allowed per rerun")
+    parser.add_argument("--delay", type=float, default=0.05, help="latency of the Reddit stand-in per request")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-dir", default=None,
+                        help="disk cache directory (default: a fresh temporary one, i.e. a cold start)")
+    parser.add_argument("--errors", action="store_true", help="list distinct errors after the table")
+    args = parser.parse_args(argv)
+
+    standin = StandInServer(comments=100, delay=args.delay).start()
+    os.environ["REDDIT_BASE_URL"] = standin.url
+    os.environ.setdefault("FINDASH_CACHE_DIR", args.cache_dir or tempfile.mkdtemp(prefix="findash_load_"))
+
+    preload()  # forked workers inherit the imported modules
+    baseline = rss()
+    records, peaks = [], {}
+    started = time.perf_counter()
+    if args.mixed:
+        recs, peaks["*"], _ = run_phase(args.pages, args.sessions, args.concurrency, args.timeout, args.seed)
+        records += recs
+    else:
+        for page in args.pages:
+            recs, peaks[page], elapsed = run_phase([page], args.sessions, args.concurrency, args.timeout, args.seed)
+            records += recs
+            print(f"{page}: {args.sessions} sessions in {elapsed:.1f} s", file=sys.stderr)
+    total = time.perf_counter() - started
+    standin.shutdown()
+
+    table = summarize(records, peaks)
+    print(f"{len(records)} reruns in {total:.1f} s ({len(records) / total:.1f} reruns/s), "
+          f"concurrency {args.concurrency}, baseline RSS {baseline / 2**20:.0f} MB, "
+          f"{standin.requests} stand-in requests")
+    print(table.to_string(index=False))
+    if args.errors:
+        errors = pd.DataFrame(records).dropna(subset=["error"])
+        for (page, error), n in errors.groupby(["page", "error"]).size().items():
+            print(f"  {page}: {n} x {error}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Compare in-memory float64 paths with the float32 memory-mapped path store.
+
+Simulates ``--paths`` buy/rent wealth paths and keeps them either as float64
+arrays in process memory or in a float32 store on disk. Reports peak heap
+allocations (tracemalloc, which does not count mapped file pages), the file
+size, write and year-slice times, and the float32 rounding error.
+
+    python benchmarks/pathstore_bench.py --paths 200000 500000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from findash.montecarlo import wealth_path_chunks  # noqa: E402
+from findash.pathstore import store_chunks  # noqa: E402
+
+YEARS = 30
+
+
+def run_float64(n_paths: int, chunk: int, seed: int):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    buy = np.empty((n_paths, YEARS))
+    rent = np.empty((n_paths, YEARS))
+    start = 0
+    for b, r in wealth_path_chunks(n_paths=n_paths, chunk=chunk, seed=seed):
+        buy[start:start + len(b)] = b
+        rent[start:start + len(r)] = r
+        start += len(b)
+    write = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    median = float(np.median(rent[:, YEARS - 1]))
+    slice_time = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"write_s": write, "slice_s": slice_time, "peak_mb": peak / 2**20,
+            "disk_mb": 0.0, "median": median}, rent
+
+
+def run_store(n_paths: int, chunk: int, seed: int, directory: str):
+    filename = os.path.join(directory, f"paths_{n_paths}.fdp")
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    store = store_chunks(filename, wealth_path_chunks(n_paths=n_paths, chunk=chunk, seed=seed),
+                         n_paths, YEARS, series=("buy", "rent"), params={"seed": seed})
+    write = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    median = float(np.median(store.year("rent", YEARS - 1)))
+    slice_time = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"write_s": write, "slice_s": slice_time, "peak_mb": peak / 2**20,
+            "disk_mb": os.path.getsize(filename) / 2**20, "median": median}, store
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", type=int, nargs="+", default=[100_000, 300_000])
+    parser.add_argument("--chunk", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    header = f"{'paths':>9} {'storage':>8} {'write s':>8} {'slice s':>8} {'peak MB':>8} {'disk MB':>8}"
+    print(header)
+    print("-" * len(header))
+    with tempfile.TemporaryDirectory() as directory:
+        for n in args.paths:
+            r64, rent64 = run_float64(n, args.chunk, args.seed)
+            r32, store = run_store(n, args.chunk, args.seed, directory)
+            for label, r in (("float64", r64), ("mmap32", r32)):
+                print(f"{n:>9,} {label:>8} {r['write_s']:>8.2f} {r['slice_s']:>8.3f} "
+                      f"{r['peak_mb']:>8.1f} {r['disk_mb']:>8.1f}")
+            rel = np.abs(store["rent"].astype(float) - rent64) / np.maximum(np.abs(rent64), 1.0)
+            print(f"{'':>9} float32 error: max rel {rel.max():.2e}, mean rel {rel.mean():.2e}, "
+                  f"final-year median diff RM {abs(r32['median'] - r64['median']):.2f}")
+            store.close()
+            del rent64, store
+
+
+if __name__ == "__main__":
+    main()
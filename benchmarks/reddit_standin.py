@@ -0,0 +1,249 @@
+"""Local stand-in for the Reddit JSON endpoints used by the Forum Scraper.
+
+Serves ``/r/<sub>/search.json``, ``/r/<sub>/comments/<id>/<slug>.json`` and
+``/api/morechildren.json`` with synthetic, deterministic posts (about 10% of
+them reposts) and nested comment trees, optionally adding latency per
+request. Like Reddit, a thread returns its first ``limit`` comments and
+"more" stubs for the rest. By default it
+measures comment-tree expansion throughput for several worker counts:
+
+    python benchmarks/reddit_standin.py --posts 50 --comments 200 --delay 0.05 --workers 1 4 8 16
+    python benchmarks/reddit_standin.py --comments 2000 --limit 200 --workers 8   # exercises morechildren
+
+With ``--serve`` it only serves, so the app can be pointed at it:
+
+    python benchmarks/reddit_standin.py --serve --port 8766
+    REDDIT_BASE_URL=http://127.0.0.1:8766 streamlit run Main.py
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+WORDS = ("rent buy house loan deposit EPF withdrawal rental yield mortgage interest OPR condo "
+         "landed Klang Valley price appreciation invest ASB stamp duty legal fees bank eligibility "
+         "DSR salary monthly instalment tenure refinance").split()
+COMMENTS_PATH = re.compile(r"^/r/([^/]+)/comments/([^/]+)(?:/[^/]*)?\.json$")
+SEARCH_PATH = re.compile(r"^/r/([^/]+)/search\.json$")
+MORE_PATH = "/api/morechildren.json"
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+
+def comment_nodes(post_id: str, n_comments: int, seed: int = 0) -> dict:
+    """``id -> comment data`` (flat, in thread order) for ``n_comments`` comments nested up to 6 deep."""
+    rng = random.Random(f"{post_id}-{seed}")
+    nodes, depth, children = [], {}, {f"t3_{post_id}": []}
+    for i in range(n_comments):
+        parent = rng.choice(nodes) if nodes and rng.random() < 0.6 else None
+        if parent is not None and depth[parent["id"]] >= 6:
+            parent = None
+        data = {"id": f"{post_id}c{i}", "author": f"user{rng.randrange(500)}", "score": rng.randrange(-5, 200),
+                "parent_id": f"t1_{parent['id']}" if parent else f"t3_{post_id}",
+                "body": _sentence(rng, rng.randrange(8, 60)), "replies": ""}
+        depth[data["id"]] = 0 if parent is None else depth[parent["id"]] + 1
+        children[data["parent_id"]].append(data["id"])
+        children[f"t1_{data['id']}"] = []
+        nodes.append(data)
+    by_id = {n["id"]: n for n in nodes}
+
+    # Depth-first thread order, as Reddit lists comments.
+    ordered, stack = {}, list(reversed(children[f"t3_{post_id}"]))
+    while stack:
+        cid = stack.pop()
+        ordered[cid] = by_id[cid]
+        stack.extend(reversed(children[f"t1_{cid}"]))
+    return ordered
+
+
+def comment_tree(post_id: str, n_comments: int, seed: int = 0, limit: int = None, nodes: dict = None) -> list:
+    """``[post listing, comment listing]`` with the first ``limit`` comments and "more" stubs for the rest."""
+    nodes = comment_nodes(post_id, n_comments, seed) if nodes is None else nodes
+    kept = set(list(nodes)[:limit] if limit is not None else nodes)
+    children = {}
+    for cid, data in nodes.items():
+        children.setdefault(data["parent_id"], []).append(cid)
+
+    def subtree(cid):
+        out, stack = [], [cid]
+        while stack:
+            c = stack.pop()
+            out.append(c)
+            stack.extend(reversed(children.get(f"t1_{c}", [])))
+        return out
+
+    def listing(parent_key):
+        things, dropped = [], []
+        for cid in children.get(parent_key, []):
+            if cid in kept:
+                replies = listing(f"t1_{cid}")
+                has_replies = bool(replies["data"]["children"])
+                things.append({"kind": "t1", "data": {**nodes[cid], "replies": replies if has_replies else ""}})
+            else:
+                dropped += subtree(cid)
+        if dropped:
+            things.append({"kind": "more", "data": {"count": len(dropped), "children": dropped,
+                                                    "id": dropped[0], "parent_id": parent_key}})
+        return {"kind": "Listing", "data": {"children": things}}
+
+    post = {"kind": "Listing", "data": {"children": [{"kind": "t3", "data": {"id": post_id}}]}}
+    return [post, listing(f"t3_{post_id}")]
+
+
+def more_children(nodes: dict, ids) -> dict:
+    """An ``/api/morechildren`` response: the requested comments, flat, in thread order."""
+    wanted = set(ids)
+    things = [{"kind": "t1", "data": data} for cid, data in nodes.items() if cid in wanted]
+    return {"json": {"errors": [], "data": {"things": things}}}
+
+
+def search_listing(subreddit: str, query: str, limit: int, comments: int) -> dict:
+    rng = random.Random(f"{subreddit}-{query}")
+    children = []
+    for i in range(limit):
+        post_id = f"p{i:05d}"
+        title, selftext = f"{query.title()}? " + _sentence(rng, 8), _sentence(rng, 80)
+        if children and rng.random() < 0.1:  # a repost, as forums have
+            original = rng.choice(children)["data"]
+            title, selftext = original["title"], original["selftext"] + " Edit: reposting for visibility."
+        children.append({"kind": "t3", "data": {
+            "id": post_id, "title": title, "selftext": selftext, "num_comments": comments,
+            "permalink": f"/r/{subreddit}/comments/{post_id}/thread_{i}/",
+        }})
+    return {"kind": "Listing", "data": {"children": children}}
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded stand-in; ``url`` is its base URL once bound."""
+
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, comments: int = 200, delay: float = 0.0, host: str = "127.0.0.1"):
+        super().__init__((host, port), _Handler)
+        self.comments = comments
+        self.delay = delay
+        self.requests = 0
+        self._cache = {}
+        self._nodes = {}
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def body_for(self, key, build) -> bytes:
+        with self._lock:
+            self.requests += 1
+            body = self._cache.get(key)
+        if body is None:
+            body = json.dumps(build()).encode("utf-8")
+            with self._lock:
+                self._cache[key] = body
+        return body
+
+    def nodes(self, post_id: str) -> dict:
+        with self._lock:
+            nodes = self._nodes.get(post_id)
+        if nodes is None:
+            nodes = comment_nodes(post_id, self.comments)
+            with self._lock:
+                self._nodes[post_id] = nodes
+        return nodes
+
+    def start(self) -> "StandInServer":
+        threading.Thread(target=self.serve_forever, name="reddit-standin", daemon=True).start()
+        return self
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        server = self.server
+        if server.delay:
+            time.sleep(server.delay)
+        if m := SEARCH_PATH.match(url.path):
+            limit = int(query.get("limit", 25))
+            body = server.body_for(("search", m.group(1), query.get("q", ""), limit),
+                                   lambda: search_listing(m.group(1), query.get("q", ""), limit, server.comments))
+        elif m := COMMENTS_PATH.match(url.path):
+            post_id, limit = m.group(2), int(query.get("limit", 200))
+            body = server.body_for(("comments", post_id, limit),
+                                   lambda: comment_tree(post_id, server.comments, limit=limit,
+                                                        nodes=server.nodes(post_id)))
+        elif url.path == MORE_PATH:
+            post_id = query.get("link_id", "")[3:]
+            ids = [c for c in query.get("children", "").split(",") if c]
+            body = server.body_for(("more", post_id, tuple(ids)),
+                                   lambda: more_children(server.nodes(post_id), ids))
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--posts", type=int, default=50, help="posts to expand per run")
+    parser.add_argument("--comments", type=int, default=200, help="comments per thread")
+    parser.add_argument("--limit", type=int, default=500, help="comments per thread page; the rest come via morechildren")
+    parser.add_argument("--delay", type=float, default=0.05, help="seconds of latency added per request")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--serve", action="store_true", help="serve until interrupted instead of benchmarking")
+    args = parser.parse_args(argv)
+
+    server = StandInServer(args.port, args.comments, args.delay)
+    if args.serve:
+        print(f"Reddit stand-in on {server.url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return 0
+
+    server.start()
+    os.environ["REDDIT_BASE_URL"] = server.url
+    from findash.forum import fetch_comments, search_posts
+
+    posts = search_posts("rent vs buy", "MalaysianPF", args.posts)
+    rows = []
+    for workers in args.workers:
+        comments, stats = fetch_comments(posts, max_workers=workers, limit=args.limit)
+        rows.append({"workers": workers, "posts": stats["posts"], "comments": stats["comments"],
+                     "failed": stats["failed"], "truncated": stats["truncated"], "seconds": round(stats["seconds"], 3),
+                     "comments/s": round(stats["comments_per_sec"])})
+    server.shutdown()
+    server.server_close()
+    print(f"{args.posts} posts x {args.comments} comments, {args.delay * 1000:.0f} ms per request")
+    print(pd.DataFrame(rows).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
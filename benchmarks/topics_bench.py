@@ -0,0 +1,77 @@
+"""Time mini-batch k-means topic clustering and its peak memory as the corpus grows.
+
+Generates posts from a few synthetic themes, fits :class:`findash.topics.TopicModel`
+and reports fit time, posts per second and how cleanly the themes were
+recovered (share of posts in their theme's majority cluster). ``--memory``
+adds the peak traced allocation during fitting (tracing slows the fit):
+
+    python benchmarks/topics_bench.py --sizes 10000 100000 300000 --topics 4
+    python benchmarks/topics_bench.py --sizes 10000 100000 --memory
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from findash.topics import TopicModel  # noqa: E402
+
+THEMES = {
+    "loan eligibility": "loan eligibility bank approval dsr salary tenure margin financing refinance".split(),
+    "rental yield": "rental yield tenant rent vacancy condo landlord maintenance roi cashflow".split(),
+    "epf withdrawal": "epf withdrawal account retirement dividend akaun savings contribution kwsp".split(),
+    "stamp duty": "stamp duty legal fees spa mot lawyer valuation disbursement hoc exemption".split(),
+}
+COMMON = "house buy money malaysia month year price property".split()
+
+
+def make_posts(n: int, n_themes: int, seed: int = 0):
+    rng = random.Random(seed)
+    themes = list(THEMES)[:n_themes]
+    labels, posts = [], []
+    for _ in range(n):
+        theme = rng.randrange(n_themes)
+        words = [rng.choice(THEMES[themes[theme]]) for _ in range(rng.randrange(6, 20))]
+        words += [rng.choice(COMMON) for _ in range(rng.randrange(3, 10))]
+        labels.append(theme)
+        posts.append(" ".join(words))
+    return posts, np.array(labels)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--topics", type=int, default=4, choices=range(2, len(THEMES) + 1))
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--memory", action="store_true", help="also report peak traced memory")
+    args = parser.parse_args(argv)
+
+    rows = []
+    for size in args.sizes:
+        posts, truth = make_posts(size, args.topics)
+        if args.memory:
+            tracemalloc.start()
+        t0 = time.perf_counter()
+        model = TopicModel(args.topics, batch_size=args.batch_size).fit(posts, epochs=args.epochs)
+        fit = time.perf_counter() - t0
+        labels, _ = model.predict(posts)
+        purity = sum(np.bincount(labels[truth == t]).max() for t in range(args.topics)) / size
+        row = {"posts": size, "fit (s)": round(fit, 2), "posts/s": round(size * args.epochs / fit),
+               "purity": f"{purity:.1%}"}
+        if args.memory:
+            row["peak MB"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+            tracemalloc.stop()
+        rows.append(row)
+    print(pd.DataFrame(rows).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""Shared, Streamlit-free building blocks for the Financial Scenario Dashboard.
+
+The engine modules only depend on NumPy, so batch jobs and tests can import
+them without starting Streamlit or matplotlib. Data loaders live in
+:mod:`findash.data` (pandas) and Streamlit helpers in :mod:`findash.ui`.
+"""
+from findash.wealth import (
+    buy_vs_rent_wealth,
+    fv_lump_sum,
+    fv_growing_annuity,
+    fv_monthly_annuity,
+    monthly_mortgage_payment,
+    pv_growing_annuity,
+    pv_growing_perpetuity,
+    wealth_trajectory,
+)
+from findash.scenarios import DEFAULT_SCENARIOS, growth_index
+from findash.sensitivity import contribution_growth_grid, one_factor_sweep
+
+__all__ = [
+    "DEFAULT_SCENARIOS",
+    "buy_vs_rent_wealth",
+    "contribution_growth_grid",
+    "fv_growing_annuity",
+    "fv_lump_sum",
+    "fv_monthly_annuity",
+    "growth_index",
+    "monthly_mortgage_payment",
+    "one_factor_sweep",
+    "pv_growing_annuity",
+    "pv_growing_perpetuity",
+    "wealth_trajectory",
+]
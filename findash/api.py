@@ -0,0 +1,335 @@
+"""Local HTTP JSON API over the wealth engine.
+
+Run with ``python -m findash.api --port 8765``. Endpoints:
+
+- ``GET /health`` and ``GET /stats`` (memory and disk cache counters)
+- ``POST /wealth``: one parameter object, or ``{"items": [...]}`` for a batch;
+  returns ``buy_wealth``, ``rent_wealth`` and ``buy_minus_rent`` per item
+- ``POST /trajectory``: same body shape; returns year-by-year buy and rent wealth
+- ``POST /scenarios``: ``{"base": {...}, "grid": {"param": [values], ...}}``;
+  returns ``buy_minus_rent`` over the outer product of the grid axes
+
+Parameters are the keyword arguments of
+:func:`findash.wealth.buy_vs_rent_wealth`; missing ones take the engine
+defaults. Values that are not finite or fall outside :data:`DOMAINS` get a
+400, and responses are strict JSON (never ``NaN`` or ``Infinity``). Results
+are cached per normalized parameter set in an LRU bounded by entry count and
+approximate bytes. Each connection gets its own thread (idle keep-alive
+connections are closed after ``--idle-timeout`` seconds), and the engine
+calls run on a fixed-size compute pool. Scenario grids are also written
+through to the shared disk cache (:mod:`findash.diskcache`).
+"""
+import argparse
+import json
+import math
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from findash.diskcache import default_cache
+from findash.wealth import buy_vs_rent_wealth, wealth_trajectory
+
+PARAMS = {
+    "house_price": 800_000.0,
+    "down_pct": 0.10,
+    "mortgage_rate": 0.04,
+    "term_years": 30,
+    "rent_yield": 0.045,
+    "invest_return": 0.06,
+    "home_appreciation": 0.02,
+    "rent_growth": 0.0,
+}
+# Accepted range of each parameter (inclusive); rates are fractions, e.g. 0.04.
+DOMAINS = {
+    "house_price": (1.0, 1e10),
+    "down_pct": (0.0, 1.0),
+    "mortgage_rate": (0.0, 1.0),
+    "term_years": (1, 100),
+    "rent_yield": (0.0, 1.0),
+    "invest_return": (-0.99, 1.0),
+    "home_appreciation": (-0.99, 1.0),
+    "rent_growth": (-0.99, 1.0),
+}
+MAX_BATCH = 10_000
+MAX_GRID = 250_000
+FLOAT_BYTES = 32  # a float in a Python list: the 8-byte slot plus the 24-byte object
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _normalize_value(name: str, value):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise BadRequest(f"{name} must be a number") from None
+    lo, hi = DOMAINS[name]
+    if not math.isfinite(value) or not lo <= value <= hi:
+        raise BadRequest(f"{name} must be a finite number between {lo:g} and {hi:g}")
+    if name == "term_years":
+        if not value.is_integer():
+            raise BadRequest("term_years must be a whole number of years")
+        return int(value)
+    return float(f"{value:.12g}")
+
+
+def normalize(params: dict) -> tuple:
+    """Defaults filled in, numbers canonicalised; usable as a cache key."""
+    if not isinstance(params, dict):
+        raise BadRequest("parameters must be a JSON object")
+    unknown = set(params) - set(PARAMS)
+    if unknown:
+        raise BadRequest(f"unknown parameter(s): {', '.join(sorted(unknown))}")
+    return tuple(_normalize_value(name, params.get(name, default)) for name, default in PARAMS.items())
+
+
+class ResultCache:
+    """Thread-safe LRU keyed on normalized parameters, bounded by entries and bytes.
+
+    Entries larger than a quarter of ``max_bytes`` are not kept (large
+    scenario grids still go to the disk cache).
+    """
+
+    def __init__(self, maxsize: int = 10_000, max_bytes: int = 128 * 2**20):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()   # key -> (value, approximate bytes)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key][0]
+            self.misses += 1
+            return None
+
+    def put(self, key, value, nbytes: int = 256) -> None:
+        """Store ``value``, whose in-memory size is about ``nbytes``."""
+        if nbytes > self.max_bytes // 4:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._data[key] = (value, nbytes)
+            self.bytes += nbytes
+            while len(self._data) > self.maxsize or self.bytes > self.max_bytes:
+                self.bytes -= self._data.popitem(last=False)[1][1]
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {"size": len(self._data), "maxsize": self.maxsize, "bytes": self.bytes,
+                    "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses,
+                    "hit_rate": self.hits / total if total else 0.0}
+
+
+# ----------------------------
+# Endpoint logic
+# ----------------------------
+def _items(body) -> tuple:
+    if isinstance(body, dict) and "items" in body:
+        items = body["items"]
+        if not isinstance(items, list) or not items:
+            raise BadRequest("items must be a non-empty list")
+        if len(items) > MAX_BATCH:
+            raise BadRequest(f"at most {MAX_BATCH} items per request")
+        return [normalize(i) for i in items], True
+    return [normalize(body if body is not None else {})], False
+
+
+def wealth(body, cache: ResultCache) -> dict:
+    keys, batched = _items(body)
+    results = [cache.get(("wealth", k)) for k in keys]
+    missing = [i for i, r in enumerate(results) if r is None]
+    if missing:
+        # Evaluate every cache miss in one vectorized call.
+        columns = np.array([keys[i] for i in missing], dtype=float).T
+        buy, rent, diff = (np.atleast_1d(a) for a in buy_vs_rent_wealth(**dict(zip(PARAMS, columns))))
+        for j, i in enumerate(missing):
+            result = {"buy_wealth": float(buy[j]), "rent_wealth": float(rent[j]),
+                      "buy_minus_rent": float(diff[j])}
+            cache.put(("wealth", keys[i]), result)
+            results[i] = result
+    return {"results": results} if batched else results[0]
+
+
+def trajectory(body, cache: ResultCache) -> dict:
+    keys, batched = _items(body)
+    results = []
+    for key in keys:
+        result = cache.get(("trajectory", key))
+        if result is None:
+            years, buy, rent = wealth_trajectory(**dict(zip(PARAMS, key)))
+            result = {"years": years.tolist(), "buy_wealth": buy.tolist(), "rent_wealth": rent.tolist()}
+            cache.put(("trajectory", key), result, 256 + 3 * len(years) * FLOAT_BYTES)
+        results.append(result)
+    return {"results": results} if batched else results[0]
+
+
+def scenarios(body, cache: ResultCache) -> dict:
+    if not isinstance(body, dict) or not isinstance(body.get("grid"), dict) or not body["grid"]:
+        raise BadRequest('body must contain a "grid" object of parameter -> list of values')
+    base = normalize(body.get("base", {}))
+    grid = body["grid"]
+    axes = {}
+    for name, values in grid.items():
+        if name not in PARAMS:
+            raise BadRequest(f"unknown grid parameter: {name}")
+        if not isinstance(values, list) or not values:
+            raise BadRequest(f"grid values for {name} must be a non-empty list")
+        axes[name] = [_normalize_value(name, v) for v in values]
+    points = int(np.prod([len(v) for v in axes.values()]))
+    if points > MAX_GRID:
+        raise BadRequest(f"grid has more than {MAX_GRID} points")
+
+    key = ("scenarios", base, tuple((n, tuple(v)) for n, v in axes.items()))
+    result = cache.get(key)
+    disk = default_cache() if result is None else None
+    if disk is not None:
+        # Large grids are worth sharing with other processes and restarts.
+        params = {"base": base, "axes": axes}
+        result = disk.get("api.scenarios", params)
+    if result is None:
+        kwargs = dict(zip(PARAMS, base))
+        names = list(axes)
+        for dim, name in enumerate(names):
+            shape = [1] * len(names)
+            shape[dim] = -1
+            kwargs[name] = np.asarray(axes[name], dtype=float).reshape(shape)
+        _, _, diff = buy_vs_rent_wealth(**kwargs)
+        diff = np.broadcast_to(diff, tuple(len(axes[n]) for n in names))
+        result = {"axes": axes, "buy_minus_rent": diff.tolist()}
+        if disk is not None:
+            disk.put("api.scenarios", params, result)
+    if result is not None:
+        cache.put(key, result, 256 + (points + sum(map(len, axes.values()))) * FLOAT_BYTES)
+    return result
+
+
+ROUTES = {"/wealth": wealth, "/trajectory": trajectory, "/scenarios": scenarios}
+
+
+# ----------------------------
+# HTTP plumbing
+# ----------------------------
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "findash-api"
+    # Headers and body go out in separate writes; don't let Nagle hold the body back.
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        # Drop keep-alive connections that sit idle, so they can't pile up.
+        self.timeout = self.server.idle_timeout
+        super().setup()
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, payload) -> None:
+        try:
+            body = json.dumps(payload, allow_nan=False).encode("utf-8")
+        except ValueError:  # NaN or infinity is not JSON; never send it
+            status, body = 500, b'{"error": "result is not a finite number"}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"status": "ok"})
+        elif self.path == "/stats":
+            disk = default_cache()
+            self._send(200, {"cache": self.server.cache.stats(), "disk": disk.stats() if disk else None})
+        else:
+            self._send(404, {"error": f"no such endpoint: {self.path}"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            self.close_connection = True  # the body's extent is unknown
+            self._send(400, {"error": "Content-Length must be a non-negative integer"})
+            return
+        raw = self.rfile.read(length) if length else b""
+        route = ROUTES.get(self.path)
+        if route is None:
+            self._send(404, {"error": f"no such endpoint: {self.path}"})
+            return
+        try:
+            body = json.loads(raw) if raw else None
+            self._send(200, self.server.compute(route, body))
+        except json.JSONDecodeError as e:
+            self._send(400, {"error": f"invalid JSON: {e}"})
+        except BadRequest as e:
+            self._send(400, {"error": str(e)})
+
+
+class WealthServer(ThreadingHTTPServer):
+    """HTTP server with a thread per connection and a bounded pool for the engine calls.
+
+    Connection threads only parse and send; ``workers`` caps how many
+    requests compute at once, so idle keep-alive clients never hold a worker.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, workers: int = 8, cache_size: int = 10_000, verbose: bool = False,
+                 idle_timeout: float = 15.0, cache_mb: int = 128):
+        super().__init__(address, Handler)
+        self.cache = ResultCache(cache_size, cache_mb * 2**20)
+        self.verbose = verbose
+        self.idle_timeout = idle_timeout
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="findash-api")
+
+    def compute(self, route, body):
+        return self._pool.submit(route, body, self.cache).result()
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m findash.api",
+                                     description="Serve the wealth engine as a JSON API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=8, help="threads running engine calls")
+    parser.add_argument("--cache-size", type=int, default=10_000, help="cached results kept in memory")
+    parser.add_argument("--cache-mb", type=int, default=128, help="memory for cached results, in MB")
+    parser.add_argument("--idle-timeout", type=float, default=15.0,
+                        help="seconds before an idle keep-alive connection is closed")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    server = WealthServer((args.host, args.port), args.workers, args.cache_size, args.verbose,
+                          args.idle_timeout, args.cache_mb)
+    print(f"Serving findash API on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Historical buy-vs-rent backtest from every possible start date.
+
+Replays the indicator history (``Data.csv`` or any
+:class:`findash.resample.IndicatorSet`) at monthly granularity:
+
+* the mortgage floats at ``OPR_avg + spread`` and is re-amortized monthly
+  (:func:`findash.variable_rate.amortize_variable`);
+* the house grows with ``PriceGrowth``;
+* market rent each month is ``house value * RentYield / 12``;
+* the renter invests the down payment, plus the instalment minus rent each
+  month, at the ``EPF`` dividend rate.
+
+Every window of ``horizon_years`` is taken from the monthly series with
+``sliding_window_view`` (a strided view, not a copy), and all windows are
+evaluated together, so the cost is a few array operations whatever the
+number of start dates.
+"""
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from findash.resample import IndicatorSet, load_indicator_set
+from findash.variable_rate import amortize_variable
+
+REQUIRED = ("OPR_avg", "EPF", "PriceGrowth", "RentYield")
+
+
+def rolling_backtest(
+    indicators: IndicatorSet = None,
+    horizon_years: int = 10,
+    house_price: float = 800_000.0,
+    down_pct: float = 0.10,
+    term_years: int = 30,
+    spread: float = 0.02,
+    step_months: int = 12,
+) -> pd.DataFrame:
+    """Buy-vs-rent outcome for every start date with ``horizon_years`` of history after it.
+
+    ``spread`` is added to the OPR to get the mortgage rate. Start dates are
+    ``step_months`` apart (12 = one per year). Wealth is measured at the end
+    of the window: the buyer's home value minus the outstanding loan, and the
+    renter's invested portfolio.
+    """
+    indicators = indicators if indicators is not None else load_indicator_set()
+    monthly = indicators.view("M")
+    missing = [c for c in REQUIRED if c not in monthly.columns]
+    if missing:
+        raise ValueError(f"backtest needs indicator column(s): {', '.join(missing)}")
+    monthly = monthly[list(REQUIRED)].dropna()
+    months = 12 * int(horizon_years)
+    if months > len(monthly):
+        raise ValueError(f"horizon of {horizon_years} years exceeds the {len(monthly) // 12} years of history")
+    if horizon_years > term_years:
+        raise ValueError("horizon_years cannot exceed term_years")
+
+    values = monthly.to_numpy(dtype=float) / 100.0
+    windows = sliding_window_view(values, months, axis=0)[::step_months]  # (starts, 4, months)
+    opr, epf, growth, yield_ = (windows[:, i, :] for i in range(4))
+
+    # Buy: floating-rate loan and the appreciating house.
+    loan = house_price * (1 - down_pct)
+    schedule = amortize_variable(loan, opr + spread, term_months=12 * int(term_years))
+    value = house_price * np.cumprod(1 + growth, axis=1)
+    buy_wealth = value[:, -1] - schedule.balance[:, -1]
+
+    # Rent: market rent off the house value; savings compound monthly at the EPF rate.
+    rent = value * yield_ / 12.0
+    contribution = schedule.payment - rent
+    invest = np.cumprod((1 + epf) ** (1 / 12), axis=1)
+    to_end = invest[:, -1:] / invest  # growth from the end of month t to the end of the window
+    rent_wealth = house_price * down_pct * invest[:, -1] + np.einsum("ij,ij->i", contribution, to_end)
+
+    starts = monthly.index[:len(monthly) - months + 1][::step_months]
+    diff = buy_wealth - rent_wealth
+    return pd.DataFrame({
+        "start": starts.astype(str),
+        "end": (starts + months - 1).astype(str),
+        "avg_mortgage_rate_pct": (opr + spread).mean(axis=1) * 100,
+        "first_payment": schedule.payment[:, 0],
+        "house_value": value[:, -1],
+        "loan_outstanding": schedule.balance[:, -1],
+        "buy_wealth": buy_wealth,
+        "rent_wealth": rent_wealth,
+        "buy_minus_rent": diff,
+        "decision": np.where(diff >= 0, "buy", "rent"),
+    })
@@ -0,0 +1,216 @@
+"""Score household buy-vs-rent inputs from a CSV or Parquet file.
+
+Usage::
+
+    python -m findash.batch households.csv -o scored.csv
+    python -m findash.batch households.parquet -o scored.parquet --workers 4
+
+The input is read in chunks, each chunk is evaluated with one vectorized
+call into :mod:`findash.wealth`, and results are appended to the output as
+they complete, so memory stays bounded by ``--chunksize`` times the number of
+chunks in flight.
+
+Input columns (missing ones fall back to the engine defaults):
+
+- ``house_price`` (alias ``price``)
+- ``down_pct``, or ``down_payment`` in RM
+- ``mortgage_rate`` (alias ``rate``), ``term_years`` (alias ``term``)
+- ``rent_yield``, or ``rent`` as monthly rent in RM
+- ``invest_return``, ``home_appreciation``, ``rent_growth`` (annual rent escalation)
+
+Rates and yields are fractions (0.04) unless ``--percent`` is given. All
+input columns are passed through to the output.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from findash.wealth import buy_vs_rent_wealth, monthly_mortgage_payment
+
+DEFAULTS = {
+    "house_price": 800_000.0,
+    "down_pct": 0.10,
+    "mortgage_rate": 0.04,
+    "term_years": 30,
+    "rent_yield": 0.045,
+    "invest_return": 0.06,
+    "home_appreciation": 0.02,
+    "rent_growth": 0.0,
+}
+ALIASES = {"price": "house_price", "rate": "mortgage_rate", "term": "term_years"}
+RATE_COLUMNS = ("mortgage_rate", "rent_yield", "invest_return", "home_appreciation", "rent_growth")
+
+
+def household_inputs(df: pd.DataFrame, percent: bool = False) -> dict:
+    """Map a chunk's columns onto engine keyword arrays."""
+    cols = {ALIASES.get(c, c): c for c in df.columns}
+    n = len(df)
+
+    def column(name):
+        if name not in cols:
+            return None
+        values = df[cols[name]]
+        if not pd.api.types.is_numeric_dtype(values):
+            # Spreadsheet text such as "950,000" or "RM 950,000".
+            values = values.astype(str).str.replace(r"(?i)^\s*RM|[,\s]", "", regex=True)
+        return pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+
+    inputs = {}
+    for name, default in DEFAULTS.items():
+        values = column(name)
+        if values is not None and percent and name in RATE_COLUMNS:
+            values = values / 100.0
+        inputs[name] = values if values is not None else np.full(n, float(default))
+
+    price = inputs["house_price"]
+    if "down_pct" not in cols:
+        down = column("down_payment")
+        if down is not None:
+            inputs["down_pct"] = down / price
+    elif percent:
+        inputs["down_pct"] = inputs["down_pct"] / 100.0
+    if "rent_yield" not in cols:
+        rent = column("rent")
+        if rent is not None:
+            inputs["rent_yield"] = rent * 12.0 / price
+    return inputs
+
+
+def score_chunk(df: pd.DataFrame, percent: bool = False) -> pd.DataFrame:
+    """Evaluate one chunk of households and append the result columns."""
+    p = household_inputs(df, percent)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        payment = monthly_mortgage_payment(p["house_price"] * (1 - p["down_pct"]),
+                                           p["mortgage_rate"], p["term_years"])
+        buy, rent, diff = buy_vs_rent_wealth(**p)
+    out = df.copy()
+    out["monthly_payment"] = payment
+    out["buy_wealth"] = buy
+    out["rent_wealth"] = rent
+    out["buy_minus_rent"] = diff
+    out["decision"] = np.where(np.isnan(diff), "", np.where(diff >= 0, "buy", "rent"))
+    return out
+
+
+# ----------------------------
+# Streaming I/O
+# ----------------------------
+def _is_parquet(path: str) -> bool:
+    return path.lower().endswith((".parquet", ".pq"))
+
+
+def iter_chunks(path: str, chunksize: int):
+    """Yield DataFrame chunks from a CSV or Parquet file."""
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path if path != "-" else sys.stdin, chunksize=chunksize)
+
+
+class ChunkWriter:
+    """Append scored chunks to a CSV (or stdout) or Parquet file.
+
+    CSV chunks arrive already encoded (see :func:`score_encoded`) so the
+    expensive float formatting happens in the workers, not here.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.csv = not _is_parquet(path)
+        self._parquet = None
+        self._fh = None
+
+    def write(self, columns: list, payload) -> None:
+        if not self.csv:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(payload, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, table.schema)
+            self._parquet.write_table(table.cast(self._parquet.schema))
+            return
+        if self._fh is None:
+            self._fh = sys.stdout if self.path == "-" else open(self.path, "w", encoding="utf-8", newline="")
+            self._fh.write(",".join(columns) + "\n")
+        self._fh.write(payload)
+
+    def close(self) -> None:
+        if self._parquet is not None:
+            self._parquet.close()
+        if self._fh is not None and self._fh is not sys.stdout:
+            self._fh.close()
+
+
+def score_encoded(df: pd.DataFrame, percent: bool, csv: bool):
+    """Worker task: score a chunk and, for CSV output, encode it headerless."""
+    scored = score_chunk(df, percent)
+    payload = scored.to_csv(index=False, header=False) if csv else scored
+    return len(scored), list(scored.columns), payload
+
+
+def run(input_path: str, output_path: str, chunksize: int = 100_000,
+        workers: int = 1, percent: bool = False) -> dict:
+    """Score ``input_path`` into ``output_path`` and return row/timing stats."""
+    t0 = time.perf_counter()
+    rows = 0
+    writer = ChunkWriter(output_path)
+
+    def emit(result):
+        nonlocal rows
+        n, columns, payload = result
+        writer.write(columns, payload)
+        rows += n
+
+    try:
+        if workers <= 1:
+            for chunk in iter_chunks(input_path, chunksize):
+                emit(score_encoded(chunk, percent, writer.csv))
+        else:
+            # Keep a bounded number of chunks in flight and write them in order.
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for chunk in iter_chunks(input_path, chunksize):
+                    pending.append(pool.submit(score_encoded, chunk, percent, writer.csv))
+                    if len(pending) >= 2 * workers:
+                        emit(pending.popleft().result())
+                while pending:
+                    emit(pending.popleft().result())
+    finally:
+        writer.close()
+    seconds = time.perf_counter() - t0
+    return {"rows": rows, "seconds": seconds, "rows_per_second": rows / seconds if seconds else 0.0}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m findash.batch",
+        description="Score buy-vs-rent decisions for a file of households.",
+    )
+    parser.add_argument("input", help="CSV or Parquet file of household inputs ('-' for stdin CSV)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="CSV or Parquet output file (default: CSV to stdout)")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="rows per vectorized chunk")
+    parser.add_argument("--workers", type=int, default=1,
+                        help=f"worker processes (this machine has {os.cpu_count()} cores)")
+    parser.add_argument("--percent", action="store_true",
+                        help="rate, yield and down_pct columns are percentages (4.0 = 4%%)")
+    args = parser.parse_args(argv)
+
+    stats = run(args.input, args.output, args.chunksize, args.workers, args.percent)
+    print(f"Scored {stats['rows']:,} households in {stats['seconds']:.2f}s "
+          f"({stats['rows_per_second']:,.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+"""Declarative charts with a choice of rendering backend.
+
+Each indicator in ``Data.csv`` is described once by a :class:`ChartSpec` in
+:data:`INDICATOR_CHARTS`; pages look specs up by column and draw them with
+:func:`plot_indicator` instead of repeating matplotlib blocks.
+
+:func:`line_chart` and :func:`heatmap` build either a matplotlib figure,
+rasterized on the server, or a Vega-Lite spec (a plain dict carrying only
+the data) that the browser renders. The backend is chosen per call, with
+:data:`DEFAULT_BACKEND` set by ``FINDASH_CHART_BACKEND``.
+
+Series longer than ``max_points`` are reduced with Largest-Triangle-Three-
+Buckets (:func:`lttb`) before drawing. LTTB keeps the first and last points
+and, from each bucket in between, the point forming the largest triangle
+with its neighbours, so peaks and troughs survive and drawing cost stays
+fixed however long the series is.
+"""
+import os
+from dataclasses import dataclass
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+BACKENDS = ("matplotlib", "vega-lite")
+DEFAULT_BACKEND = os.environ.get("FINDASH_CHART_BACKEND", "matplotlib")
+if DEFAULT_BACKEND not in BACKENDS:
+    DEFAULT_BACKEND = "matplotlib"
+
+MAX_POINTS = 800
+MARKER_LIMIT = 100  # draw point markers only for short series
+
+
+@dataclass(frozen=True)
+class ChartSpec:
+    column: str
+    name: str      # selector text, e.g. "OPR"
+    label: str     # axis label, e.g. "OPR (%)"
+    marker: str = "o"
+    color: str = None
+
+    @property
+    def title(self) -> str:
+        return f"Trend of {self.label.split(' (')[0]} vs Year"
+
+
+INDICATOR_CHARTS = (
+    ChartSpec("OPR_avg", "OPR", "OPR (%)", marker="o", color="blue"),
+    ChartSpec("EPF", "EPF", "EPF (%)", marker="s", color="orange"),
+    ChartSpec("PriceGrowth", "Price Growth", "Price Growth (%)", marker="^", color="green"),
+    ChartSpec("RentYield", "Rent Yield", "Rental Yield (%)", marker="d", color="purple"),
+)
+
+SCENARIO_COLORS = {"Baseline (5%)": "blue", "Optimistic (8%)": "green", "Pessimistic (3%)": "red"}
+
+
+def scenario_specs(names) -> list:
+    """Line specs for scenario columns, in the dashboard's usual colours."""
+    return [ChartSpec(name, name, name, marker=None, color=SCENARIO_COLORS.get(name)) for name in names]
+
+
+def chart_for(column: str) -> ChartSpec:
+    """The registered spec for ``column``, or a plain default one."""
+    for spec in INDICATOR_CHARTS:
+        if spec.column == column:
+            return spec
+    return ChartSpec(column, column, column)
+
+
+def lttb(x, y, threshold: int):
+    """Indices of at most ``threshold`` points of ``(x, y)`` chosen by LTTB."""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # Bucket boundaries over the interior points 1 .. n-2.
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(int)
+    keep = np.empty(threshold, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket (the last point for the final bucket).
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def _numeric(x: np.ndarray) -> np.ndarray:
+    return x.astype(float) if x.dtype.kind in "iuf" else x.view("int64").astype(float)
+
+
+def _downsampled(x, y, max_points: int):
+    x, y = np.asarray(x), np.asarray(y, dtype=float)
+    mask = ~np.isnan(y)
+    x, y = x[mask], y[mask]
+    idx = lttb(_numeric(x), y, max_points)
+    return x[idx], y[idx]
+
+
+def _resolve(backend: str) -> str:
+    backend = backend or DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown chart backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+    return backend
+
+
+def _vega_x(x: np.ndarray):
+    if x.dtype.kind == "M":
+        return [str(v) for v in x.astype("datetime64[D]")], "temporal"
+    return x.tolist(), "quantitative"
+
+
+def line_chart(df: pd.DataFrame, x: str, specs, title: str, xlabel: str = "Year", ylabel: str = None,
+               backend: str = None, max_points: int = MAX_POINTS):
+    """One line per :class:`ChartSpec` in ``specs`` against column ``x`` of ``df``.
+
+    Each line is downsampled to ``max_points`` with :func:`lttb`. Returns a
+    matplotlib figure or a Vega-Lite spec dict, depending on ``backend``.
+    """
+    backend = _resolve(backend)
+    specs = list(specs)
+    ylabel = ylabel or (specs[0].label if len(specs) == 1 else "")
+    lines = [(spec, *_downsampled(df[x].to_numpy(), df[spec.column].to_numpy(), max_points)) for spec in specs]
+
+    if backend == "matplotlib":
+        fig, ax = plt.subplots()
+        for spec, xs, ys in lines:
+            ax.plot(xs, ys, marker=spec.marker if len(xs) <= MARKER_LIMIT else None,
+                    label=spec.label, color=spec.color)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        ax.legend()
+        return fig
+
+    values = []
+    x_type = "quantitative"
+    for spec, xs, ys in lines:
+        xs, x_type = _vega_x(xs)
+        values.extend({"x": a, "y": round(float(b), 6), "series": spec.label} for a, b in zip(xs, ys))
+    color = {"field": "series", "type": "nominal", "title": None, "sort": [spec.label for spec in specs]}
+    if all(spec.color for spec in specs):
+        color["scale"] = {"domain": [spec.label for spec in specs], "range": [spec.color for spec in specs]}
+    show_points = any(spec.marker for spec in specs) and max(len(xs) for _, xs, _ in lines) <= MARKER_LIMIT
+    whole_years = x_type == "quantitative" and df[x].dtype.kind in "iu"
+    return {
+        "title": title,
+        "data": {"values": values},
+        "mark": {"type": "line", "point": show_points, "tooltip": True},
+        "encoding": {
+            "x": {"field": "x", "type": x_type, "title": xlabel, "axis": {"format": "d"} if whole_years else {}},
+            "y": {"field": "y", "type": "quantitative", "title": ylabel, "scale": {"zero": False}},
+            "color": color,
+        },
+    }
+
+
+def heatmap(z, x_values, y_values, title: str, xlabel: str, ylabel: str, value_label: str = "",
+            highlight=None, backend: str = None):
+    """Heatmap of ``z`` (``(len(y_values), len(x_values))``; NaN cells left blank).
+
+    ``highlight`` is an optional ``(x, y)`` point to mark, e.g. an optimum.
+    """
+    backend = _resolve(backend)
+    z = np.asarray(z, dtype=float)
+    x_values, y_values = np.asarray(x_values, dtype=float), np.asarray(y_values, dtype=float)
+
+    if backend == "matplotlib":
+        fig, ax = plt.subplots()
+        dx = (x_values[1] - x_values[0]) / 2 if len(x_values) > 1 else 0.5
+        dy = (y_values[1] - y_values[0]) / 2 if len(y_values) > 1 else 0.5
+        extent = [x_values[0] - dx, x_values[-1] + dx, y_values[0] - dy, y_values[-1] + dy]
+        im = ax.imshow(z, aspect="auto", origin="lower", extent=extent, cmap="viridis")
+        if highlight is not None:
+            ax.plot(*highlight, marker="*", color="red", markersize=14)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        fig.colorbar(im, ax=ax, label=value_label or None)
+        return fig
+
+    yy, xx = np.nonzero(np.isfinite(z))
+    values = [{"x": round(float(x_values[j]), 6), "y": round(float(y_values[i]), 6), "z": round(float(z[i, j]), 2)}
+              for i, j in zip(yy, xx)]
+    layers = [{
+        "data": {"values": values},
+        "mark": {"type": "rect", "tooltip": True},
+        "encoding": {
+            "x": {"field": "x", "type": "ordinal", "title": xlabel,
+                  "axis": {"labelOverlap": True, "format": ".3~g"}},
+            "y": {"field": "y", "type": "ordinal", "title": ylabel, "sort": "descending",
+                  "axis": {"labelOverlap": True, "format": ".3~g"}},
+            "color": {"field": "z", "type": "quantitative", "title": value_label,
+                      "scale": {"scheme": "viridis"}},
+        },
+    }]
+    if highlight is not None:
+        hx, hy = highlight
+        # Snap to the grid so the star lands on an ordinal cell.
+        hx = round(float(x_values[np.abs(x_values - hx).argmin()]), 6)
+        hy = round(float(y_values[np.abs(y_values - hy).argmin()]), 6)
+        layers.append({
+            "data": {"values": [{"x": hx, "y": hy}]},
+            "mark": {"type": "point", "shape": "diamond", "size": 200, "color": "red", "filled": True},
+            "encoding": {"x": {"field": "x", "type": "ordinal"}, "y": {"field": "y", "type": "ordinal"}},
+        })
+    return {"title": title, "layer": layers}
+
+
+def correlation_heatmap(matrix, names, title: str = "Correlation Matrix", threshold: float = 0.0,
+                        backend: str = None, label_limit: int = 40):
+    """Diverging heatmap of a correlation matrix; cells with ``|r| < threshold`` are left blank.
+
+    Axis labels are drawn only for up to ``label_limit`` indicators.
+    """
+    backend = _resolve(backend)
+    matrix = np.asarray(matrix, dtype=np.float32)
+    shown = np.where(np.abs(matrix) >= threshold, matrix, np.nan)
+    names = [str(n) for n in names]
+    labelled = len(names) <= label_limit
+
+    if backend == "matplotlib":
+        size = min(12, 4 + 0.15 * len(names))
+        fig, ax = plt.subplots(figsize=(size, size * 0.85))
+        im = ax.imshow(shown, cmap="RdBu_r", vmin=-1, vmax=1, interpolation="nearest")
+        if labelled:
+            ax.set_xticks(range(len(names)), names, rotation=90)
+            ax.set_yticks(range(len(names)), names)
+        else:
+            ax.set_xticks([])
+            ax.set_yticks([])
+        ax.set_title(title)
+        fig.colorbar(im, ax=ax, label="r")
+        return fig
+
+    rows, cols = np.nonzero(np.isfinite(shown))
+    values = [{"a": names[i], "b": names[j], "r": round(float(shown[i, j]), 3)} for i, j in zip(rows, cols)]
+    axis = {"labels": labelled, "ticks": labelled, "title": None}
+    return {
+        "title": title,
+        "data": {"values": values},
+        "mark": {"type": "rect", "tooltip": True},
+        "encoding": {
+            "x": {"field": "b", "type": "nominal", "sort": names, "axis": axis},
+            "y": {"field": "a", "type": "nominal", "sort": names, "axis": axis},
+            "color": {"field": "r", "type": "quantitative",
+                      "scale": {"scheme": "redblue", "domain": [-1, 1], "reverse": True}},
+        },
+    }
+
+
+def plot_indicator(spec: ChartSpec, x, y, max_points: int = MAX_POINTS, title: str = None, backend: str = None):
+    """Line chart of one indicator, downsampled to ``max_points``."""
+    df = pd.DataFrame({"x": np.asarray(x), spec.column: np.asarray(y, dtype=float)})
+    return line_chart(df, "x", [spec], title or spec.title, backend=backend, max_points=max_points)
@@ -0,0 +1,87 @@
+"""Correlation views that stay usable for wide indicator panels.
+
+:func:`correlation_view` computes the Pearson matrix of every numeric
+column in float32 with one matrix product, orders the columns by
+average-linkage hierarchical clustering on ``1 - |r|`` (so strongly
+related indicators, positive or negative, sit next to each other), and
+:func:`top_pairs` picks the most correlated pairs with ``argpartition``
+instead of sorting all ``p * (p - 1) / 2`` of them.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class CorrelationView:
+    names: list          # column names in cluster order
+    matrix: np.ndarray   # (p, p) float32, rows/columns in cluster order
+
+
+def correlation_matrix(values: np.ndarray) -> np.ndarray:
+    """Pearson correlation of the columns of ``values`` (n, p) as float32.
+
+    Missing values are treated as the column mean (they add nothing to the
+    covariance). Constant columns get NaN rows and columns.
+    """
+    x = np.asarray(values, dtype=np.float32)
+    mean = np.nanmean(x, axis=0)
+    z = x - mean
+    z[np.isnan(z)] = 0.0
+    norm = np.sqrt(np.einsum("ij,ij->j", z, z))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z /= norm
+        corr = z.T @ z
+    np.clip(corr, -1.0, 1.0, out=corr)
+    np.fill_diagonal(corr, np.where(norm > 0, 1.0, np.nan))
+    return corr
+
+
+def cluster_order(corr: np.ndarray) -> np.ndarray:
+    """Leaf order of an average-linkage dendrogram on the distance ``1 - |r|``."""
+    p = corr.shape[0]
+    if p <= 2:
+        return np.arange(p)
+    dist = 1.0 - np.abs(np.nan_to_num(corr.astype(np.float64), nan=0.0))
+    np.fill_diagonal(dist, np.inf)
+    sizes = np.ones(p)
+    leaves = [[i] for i in range(p)]
+    active = np.ones(p, dtype=bool)
+    for _ in range(p - 1):
+        flat = int(np.argmin(dist))
+        i, j = divmod(flat, p)
+        # Lance-Williams update for average linkage: cluster j merges into i.
+        merged = (sizes[i] * dist[i] + sizes[j] * dist[j]) / (sizes[i] + sizes[j])
+        dist[i], dist[:, i] = merged, merged
+        dist[i, i] = np.inf
+        dist[j], dist[:, j] = np.inf, np.inf
+        sizes[i] += sizes[j]
+        leaves[i] = leaves[i] + leaves[j]
+        active[j] = False
+    return np.array(leaves[int(np.flatnonzero(active)[0])])
+
+
+def correlation_view(df: pd.DataFrame) -> CorrelationView:
+    """Clustered float32 correlation of the numeric columns of ``df``."""
+    numeric = df.select_dtypes("number")
+    corr = correlation_matrix(numeric.to_numpy())
+    order = cluster_order(corr)
+    return CorrelationView(names=[str(numeric.columns[i]) for i in order], matrix=corr[np.ix_(order, order)])
+
+
+def top_pairs(view: CorrelationView, k: int = 10, threshold: float = 0.0) -> pd.DataFrame:
+    """The ``k`` pairs with the largest ``|r|`` (at least ``threshold``), strongest first."""
+    rows, cols = np.triu_indices(len(view.names), k=1)
+    r = view.matrix[rows, cols]
+    strength = np.nan_to_num(np.abs(r), nan=-1.0)
+    keep = np.flatnonzero(strength >= threshold)
+    if len(keep) > k:
+        keep = keep[np.argpartition(strength[keep], -k)[-k:]]
+    keep = keep[np.argsort(-strength[keep], kind="stable")]
+    names = np.asarray(view.names)
+    return pd.DataFrame({
+        "Indicator A": names[rows[keep]],
+        "Indicator B": names[cols[keep]],
+        "r": r[keep].astype(float).round(3),
+    })
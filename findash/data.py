@@ -0,0 +1,46 @@
+"""Loaders for the macro indicator dataset (``Data.csv``)."""
+import os
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_PATH = os.path.join(ROOT, "Data.csv")
+
+
+def resolve_path(path: str = None) -> str:
+    """Find ``path`` (default: the bundled ``Data.csv``), ignoring filename case."""
+    path = path or DATA_PATH
+    if os.path.exists(path):
+        return path
+    folder, name = os.path.split(path)
+    folder = folder or "."
+    if os.path.isdir(folder):
+        for entry in os.listdir(folder):
+            if entry.lower() == name.lower():
+                return os.path.join(folder, entry)
+    # Relative names like "data.csv" also resolve against the repository root
+    if not os.path.isabs(path) and path != DATA_PATH:
+        return resolve_path(os.path.join(ROOT, path))
+    raise FileNotFoundError(f"File not found: {path}")
+
+
+def coerce_year(df: pd.DataFrame) -> pd.DataFrame:
+    """Make ``Year`` an int column, dropping rows where it can't be parsed."""
+    if "Year" not in df.columns:
+        return df
+    df = df.copy()
+    df["Year"] = pd.to_numeric(df["Year"], errors="coerce").astype("Int64")
+    if df["Year"].isna().any():
+        df = df.dropna(subset=["Year"])
+    df["Year"] = df["Year"].astype(int)
+    return df.reset_index(drop=True)
+
+
+def load_indicators(path: str = None) -> pd.DataFrame:
+    """Read the indicator CSV as-is."""
+    return pd.read_csv(resolve_path(path))
+
+
+def clean_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop incomplete rows and normalise ``Year``."""
+    return coerce_year(df.dropna())
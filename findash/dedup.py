@@ -0,0 +1,155 @@
+"""Near-duplicate detection for forum posts with MinHash and LSH banding.
+
+Each text is lower-cased, whitespace-collapsed and cut into overlapping
+character ``k``-grams (shingles). Shingle hashes are computed for the whole
+corpus at once as a rolling polynomial over its bytes, and MinHash
+signatures for a batch of documents are one broadcast of ``num_perm``
+multiply-shift hash functions followed by ``np.minimum.reduceat`` over each
+document's run of shingles.
+
+Signatures are split into ``bands`` of ``rows``; documents whose band
+values agree in any band land in the same bucket. Only bucket members are
+compared (by the share of equal signature values, an estimate of Jaccard
+similarity), and matches are merged with union-find, so the cost grows with
+the corpus rather than with the number of pairs.
+"""
+import zlib
+
+import numpy as np
+import pandas as pd
+
+EMPTY = np.iinfo(np.uint32).max   # signature value of a document with no shingles
+BATCH_ELEMENTS = 1_000_000        # num_perm * shingles hashed at once (8 MB of uint64, cache-friendly)
+
+
+def normalize(text: str) -> str:
+    return " ".join(str(text).lower().split())
+
+
+def shingle_hashes(texts, k: int = 5):
+    """32-bit hashes of every character ``k``-gram, and each document's start offset.
+
+    Returns ``(hashes, offsets)``: the shingles of document ``i`` are
+    ``hashes[offsets[i]:offsets[i + 1]]``. Texts shorter than ``k`` are
+    treated as a single shingle.
+    """
+    encoded = [normalize(t).encode("utf-8") for t in texts]
+    lengths = np.array([len(b) for b in encoded], dtype=np.int64)
+    buf = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+    starts = np.concatenate([[0], np.cumsum(lengths)])
+
+    # Polynomial hash of every window of k bytes over the joined corpus (mod 2**64).
+    n_windows = max(len(buf) - k + 1, 0)
+    rolling = np.zeros(n_windows, dtype=np.uint64)
+    for j in range(k):
+        rolling = rolling * np.uint64(1_000_003) + buf[j:j + n_windows]
+
+    counts = np.where(lengths >= k, lengths - k + 1, np.minimum(lengths, 1))
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    # Windows that start inside a document and end before its last byte.
+    doc = np.repeat(np.arange(len(lengths)), counts)
+    pos = np.arange(offsets[-1]) - np.repeat(offsets[:-1], counts) + np.repeat(starts[:-1], counts)
+    short = np.repeat(lengths < k, counts)
+    hashes = np.empty(offsets[-1], dtype=np.uint64)
+    hashes[~short] = rolling[pos[~short]]
+    if short.any():  # whole (short) text as one shingle
+        hashes[short] = np.array([zlib.crc32(encoded[i]) for i in doc[short]], dtype=np.uint64)
+    hashes ^= hashes >> np.uint64(29)
+    hashes *= np.uint64(0xBF58476D1CE4E5B9)
+    hashes ^= hashes >> np.uint64(32)
+    return hashes & np.uint64(0xFFFFFFFF), offsets
+
+
+def minhash_signatures(texts, num_perm: int = 128, k: int = 5, seed: int = 1) -> np.ndarray:
+    """``(n_texts, num_perm)`` uint32 MinHash signatures; empty texts get :data:`EMPTY` rows.
+
+    The permutations are multiply-shift hashes, ``(a * x + b) mod 2**64 >> 32``
+    for random 64-bit ``a`` (odd) and ``b``, which need no modulo.
+    """
+    hashes, offsets = shingle_hashes(texts, k)
+    rng = np.random.default_rng(seed)
+    a = (rng.integers(0, 2**63, num_perm, dtype=np.uint64) << np.uint64(1) | np.uint64(1))[:, None]
+    b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)[:, None]
+
+    n = len(offsets) - 1
+    sig = np.full((n, num_perm), EMPTY, dtype=np.uint32)
+    counts = np.diff(offsets)
+    nonempty = np.flatnonzero(counts > 0)
+    per_batch = max(1, BATCH_ELEMENTS // num_perm)
+    i = 0
+    while i < len(nonempty):
+        # Take documents until the batch holds about per_batch shingles.
+        lo = offsets[nonempty[i]]
+        j = int(np.searchsorted(offsets[nonempty + 1], lo + per_batch, side="right"))
+        j = max(j, i + 1)
+        docs = nonempty[i:j]
+        hi = offsets[docs[-1] + 1]
+        values = a * hashes[lo:hi]                                # (num_perm, shingles), wraps mod 2**64
+        values += b
+        # The top 32 bits of the minimum are the minimum of the top 32 bits.
+        sig[docs] = (np.minimum.reduceat(values, offsets[docs] - lo, axis=1) >> np.uint64(32)).T
+        i = j
+    return sig
+
+
+def lsh_params(num_perm: int, threshold: float) -> tuple:
+    """``(bands, rows)`` with ``bands * rows <= num_perm`` whose S-curve midpoint is nearest ``threshold``."""
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        midpoint = (1.0 / bands) ** (1.0 / rows)
+        if best is None or abs(midpoint - threshold) < best[0]:
+            best = (abs(midpoint - threshold), bands, rows)
+    return best[1], best[2]
+
+
+def _find(parent: np.ndarray, i: int) -> int:
+    root = i
+    while parent[root] != root:
+        root = parent[root]
+    while parent[i] != root:  # path compression
+        parent[i], i = root, parent[i]
+    return root
+
+
+def duplicate_groups(signatures: np.ndarray, threshold: float = 0.8) -> np.ndarray:
+    """For each document, the index of the first document in its near-duplicate group."""
+    n, num_perm = signatures.shape
+    bands, rows = lsh_params(num_perm, threshold)
+    parent = np.arange(n)
+    valid = signatures[:, 0] != EMPTY
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows))).ravel()
+        _, bucket = np.unique(keys, return_inverse=True)
+        order = np.argsort(bucket, kind="stable")
+        sorted_bucket = bucket[order]
+        first = np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]]
+        leader = order[np.flatnonzero(first)[np.cumsum(first) - 1]]  # first member of each bucket
+        members = np.flatnonzero((order != leader) & valid[order] & valid[leader])
+        if not len(members):
+            continue
+        docs, leads = order[members], leader[members]
+        similarity = (signatures[docs] == signatures[leads]).mean(axis=1)
+        for d, l in zip(docs[similarity >= threshold], leads[similarity >= threshold]):
+            rd, rl = _find(parent, int(d)), _find(parent, int(l))
+            if rd != rl:
+                parent[max(rd, rl)] = min(rd, rl)
+    return np.array([_find(parent, i) for i in range(n)])
+
+
+def deduplicate(df: pd.DataFrame, columns, threshold: float = 0.8, num_perm: int = 128, k: int = 5):
+    """``df`` without near-duplicate rows (the first of each group is kept).
+
+    ``columns`` (a name or a list) are joined to form each row's text.
+    Returns ``(kept, removed)``, where ``removed`` has a ``duplicate_of``
+    column with the index label of the row it repeats.
+    """
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    if df.empty:
+        return df, df.assign(duplicate_of=pd.Series(dtype=object))
+    text = df[columns].fillna("").astype(str).agg(" ".join, axis=1)
+    groups = duplicate_groups(minhash_signatures(text.tolist(), num_perm=num_perm, k=k), threshold)
+    is_dup = groups != np.arange(len(df))
+    removed = df[is_dup].assign(duplicate_of=df.index[groups[is_dup]])
+    return df[~is_dup], removed
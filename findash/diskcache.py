@@ -0,0 +1,295 @@
+"""Disk-backed result cache shared by every process on the host.
+
+``st.cache_data`` and the API's in-memory LRU are per process and lost on
+restart. :class:`DiskCache` sits behind them: each result is pickled to its
+own file under ``FINDASH_CACHE_DIR`` (default ``.findash_cache`` in the
+repository), named by the SHA-256 of the namespace, the engine version and
+the normalized parameters. Any process computing the same thing finds the
+same file.
+
+Writes go to a temporary file in the same directory and are moved into place
+with ``os.replace``, so readers never see a partial entry. When the total
+size passes ``FINDASH_CACHE_MAX_MB`` (default 512) the least recently used
+entries are removed; hits refresh an entry's modification time. Each process
+only tracks its own writes between scans, so it re-reads the real size from
+disk every :data:`RESCAN_WRITES` writes or :data:`RESCAN_SECONDS` seconds:
+with several writers the total can exceed the limit by at most what the
+other processes wrote since their own last scan. Scans and evictions run on a background thread,
+off the request path. Set ``FINDASH_CACHE_DIR=off`` to disable it.
+
+Hits, misses, writes and evictions are counted in :mod:`findash.telemetry`
+as ``findash_cache_requests_total`` and ``findash_cache_events_total``.
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from findash import telemetry
+from findash.data import ROOT
+from findash.wealth import ENGINE_VERSION
+
+DEFAULT_DIR = os.path.join(ROOT, ".findash_cache")
+SUFFIX = ".pkl"
+RESCAN_WRITES = 50      # writes by this process between scans of the real size on disk
+RESCAN_SECONDS = 30.0   # ... or seconds, whichever comes first
+POPULAR_LIMIT = 256     # distinct requests kept for popular(); pruned to this at twice the size
+_MISS = object()
+
+
+def canonical(value):
+    """A JSON-serializable form of ``value`` that is equal for equal inputs.
+
+    Floats are rounded to 12 significant digits (whole ones become ints),
+    mappings are key-sorted, and arrays and DataFrames are replaced by a
+    digest of their contents.
+    """
+    if isinstance(value, dict):
+        return {str(k): canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [canonical(v) for v in value]
+    if isinstance(value, (bool, np.bool_)) or value is None or isinstance(value, str):
+        return value.item() if isinstance(value, np.bool_) else value
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        value = float(f"{float(value):.12g}")
+        return int(value) if value.is_integer() else value  # 30.0 and 30 share a key
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value)
+        return {"ndarray": str(data.dtype), "shape": list(data.shape),
+                "sha256": hashlib.sha256(data.tobytes()).hexdigest()}
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest = hashlib.sha256(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+        labels = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+        digest.update(repr(labels).encode("utf-8"))
+        return {"pandas": type(value).__name__, "sha256": digest.hexdigest()}
+    raise TypeError(f"cannot build a cache key from {type(value).__name__}")
+
+
+def cache_key(namespace: str, params: dict) -> str:
+    payload = json.dumps({"ns": namespace, "engine": ENGINE_VERSION, "params": canonical(params)},
+                         sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    def __init__(self, directory: str = None, max_bytes: int = None):
+        self.directory = directory or DEFAULT_DIR
+        self.max_bytes = max_bytes or int(float(os.environ.get("FINDASH_CACHE_MAX_MB", "512")) * 2**20)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._size = None  # total size at the last scan plus this process's writes since
+        self._last_scan = 0.0
+        self._writes_since_scan = 0
+        self._evicting = False
+        self._lock = threading.Lock()
+        self.tracked = frozenset()   # namespaces whose calls popular() counts (set by the warmer)
+        self._requests = Counter()   # key -> calls through call() in this process
+        self._request_params = {}    # key -> (namespace, params) for popular()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + SUFFIX)
+
+    def _record(self, result: str) -> None:
+        with self._lock:
+            if result == "hit":
+                self.hits += 1
+            else:
+                self.misses += 1
+        telemetry.incr("findash_cache_requests_total", result=result)
+
+    def get(self, namespace: str, params: dict, default=None):
+        """The cached value, or ``default`` when absent or unreadable."""
+        path = self._path(cache_key(namespace, params))
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self._record("miss")
+            return default
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            self._record("miss")
+            telemetry.incr("findash_cache_events_total", event="corrupt")
+            return default
+        try:
+            os.utime(path)  # LRU order for eviction
+        except OSError:
+            pass
+        self._record("hit")
+        return value
+
+    def put(self, namespace: str, params: dict, value) -> None:
+        """Store ``value`` atomically; failures are counted, never raised."""
+        path = self._path(cache_key(namespace, params))
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                size = os.path.getsize(tmp)
+                os.replace(tmp, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+        except (OSError, pickle.PicklingError, TypeError):
+            telemetry.incr("findash_cache_events_total", event="write_error")
+            return
+        with self._lock:
+            self.writes += 1
+            self._writes_since_scan += 1
+            if self._size is not None:
+                self._size += size
+            due = (self._size is None or self._size > self.max_bytes
+                   or self._writes_since_scan >= RESCAN_WRITES
+                   or time.time() - self._last_scan >= RESCAN_SECONDS)
+        telemetry.incr("findash_cache_events_total", event="write")
+        if due:
+            self.evict_in_background()
+
+    def contains(self, namespace: str, params: dict) -> bool:
+        """Whether an entry exists, without counting a hit or miss."""
+        return os.path.exists(self._path(cache_key(namespace, params)))
+
+    def call(self, namespace: str, fn, **params):
+        """``fn(**params)``, served from the cache when this call was made before."""
+        if namespace in self.tracked:
+            self._count_request(namespace, params)
+        value = self.get(namespace, params, _MISS)
+        if value is _MISS:
+            value = fn(**params)
+            self.put(namespace, params, value)
+        return value
+
+    def _count_request(self, namespace: str, params: dict) -> None:
+        """Count a call for :meth:`popular`; only JSON-serializable parameters can be replayed."""
+        try:
+            json.dumps(params)
+        except (TypeError, ValueError):
+            return
+        key = cache_key(namespace, params)
+        with self._lock:
+            self._requests[key] += 1
+            self._request_params.setdefault(key, (namespace, params))
+            if len(self._requests) > 2 * POPULAR_LIMIT:
+                self._requests = Counter(dict(self._requests.most_common(POPULAR_LIMIT)))
+                self._request_params = {k: self._request_params[k] for k in self._requests}
+
+    def _entries(self, stale_after: float = 3600.0):
+        """``(mtime, size, path)`` of every entry, plus temp files abandoned by crashed writers."""
+        entries = []
+        cutoff = time.time() - stale_after
+        for dirpath, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                if name.endswith(SUFFIX) or (name.endswith(".tmp") and st.st_mtime < cutoff):
+                    entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def evict_in_background(self):
+        """Run :meth:`evict` on a daemon thread unless one is already running; returns the thread."""
+        with self._lock:
+            if self._evicting:
+                return None
+            self._evicting = True
+        thread = threading.Thread(target=self._evict_task, name="findash-cache-evict", daemon=True)
+        thread.start()
+        return thread
+
+    def _evict_task(self) -> None:
+        try:
+            self.evict()
+        except OSError:
+            telemetry.incr("findash_cache_events_total", event="evict_error")
+        finally:
+            with self._lock:
+                self._evicting = False
+
+    def evict(self, target: float = 0.8) -> int:
+        """Scan the real size on disk and remove least recently used entries until it is below
+        ``target * max_bytes``; blocks, so the request path uses :meth:`evict_in_background`."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes * target:
+                    break
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+        with self._lock:
+            self._size = total
+            self._last_scan = time.time()
+            self._writes_since_scan = 0
+            self.evictions += removed
+        if removed:
+            telemetry.incr("findash_cache_events_total", n=removed, event="evict")
+        return removed
+
+    def popular(self, n: int = None) -> list:
+        """``(namespace, params, count)`` of the calls made most often in this process.
+
+        Only namespaces in :attr:`tracked` are counted, and at most about
+        :data:`POPULAR_LIMIT` distinct requests are kept.
+        """
+        with self._lock:
+            return [(*self._request_params[key], count) for key, count in self._requests.most_common(n)]
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {"directory": self.directory, "hits": self.hits, "misses": self.misses,
+                    "writes": self.writes, "evictions": self.evictions,
+                    "hit_rate": self.hits / total if total else 0.0}
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_cache():
+    """The process-wide cache from ``FINDASH_CACHE_DIR``, or ``None`` when disabled."""
+    global _default
+    directory = os.environ.get("FINDASH_CACHE_DIR", DEFAULT_DIR)
+    if directory.lower() in ("", "off", "0", "none"):
+        return None
+    with _default_lock:
+        if _default is None or _default.directory != directory:
+            _default = DiskCache(directory)
+        return _default
+
+
+def cached_call(namespace: str, fn, **params):
+    """``fn(**params)`` through the default disk cache (computed directly when it is off)."""
+    cache = default_cache()
+    return fn(**params) if cache is None else cache.call(namespace, fn, **params)
@@ -0,0 +1,132 @@
+"""On-demand table exports in several formats.
+
+:func:`export_bytes` encodes a DataFrame as CSV, gzip-compressed CSV, Parquet
+or Excel. Results are kept in a small in-process cache keyed by a
+fingerprint of the frame's contents, so repeated downloads of unchanged data
+are served without re-encoding. CSV is produced in row blocks
+(:func:`iter_csv`) and gzip compresses block by block, so large tables never
+exist as one giant string.
+
+Parquet needs ``pyarrow`` (or ``fastparquet``) and Excel needs ``openpyxl``;
+:func:`available_formats` lists only the formats that can be produced here.
+"""
+import gzip
+import hashlib
+import importlib.util
+import io
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+# name -> (file extension, MIME type)
+FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "CSV (gzip)": ("csv.gz", "application/gzip"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "Excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+_REQUIRES = {"Parquet": ("pyarrow", "fastparquet"), "Excel": ("openpyxl",)}
+
+CSV_BLOCK_ROWS = 50_000
+CACHE_BYTES = 64 * 2**20
+
+
+def available_formats() -> list:
+    """Format names whose optional dependency is installed."""
+    return [name for name in FORMATS
+            if name not in _REQUIRES or any(importlib.util.find_spec(m) for m in _REQUIRES[name])]
+
+
+def fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a frame: values, index, column names and dtypes."""
+    h = hashlib.sha1()
+    h.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return h.hexdigest()
+
+
+def iter_csv(df: pd.DataFrame, block_rows: int = CSV_BLOCK_ROWS, index: bool = False):
+    """UTF-8 CSV of ``df`` as a sequence of byte blocks (header in the first)."""
+    if len(df) == 0:
+        yield df.to_csv(index=index).encode("utf-8")
+        return
+    for start in range(0, len(df), block_rows):
+        block = df.iloc[start:start + block_rows]
+        yield block.to_csv(index=index, header=start == 0).encode("utf-8")
+
+
+def _encode(df: pd.DataFrame, fmt: str) -> bytes:
+    if fmt == "CSV":
+        return b"".join(iter_csv(df))
+    buf = io.BytesIO()
+    if fmt == "CSV (gzip)":
+        with gzip.GzipFile(fileobj=buf, mode="wb", compresslevel=6, mtime=0) as gz:
+            for block in iter_csv(df):
+                gz.write(block)
+    elif fmt == "Parquet":
+        df.to_parquet(buf, index=False)
+    elif fmt == "Excel":
+        with pd.ExcelWriter(buf, engine="openpyxl") as writer:
+            df.to_excel(writer, index=False)
+    else:
+        raise ValueError(f"unknown export format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    return buf.getvalue()
+
+
+class _ExportCache:
+    """LRU of encoded exports, bounded by total size in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._items:
+                return
+            self._items[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, old = self._items.popitem(last=False)
+                self.size -= len(old)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+
+_cache = _ExportCache(CACHE_BYTES)
+
+
+def export_bytes(df: pd.DataFrame, fmt: str = "CSV") -> bytes:
+    """``df`` encoded as ``fmt`` (a key of :data:`FORMATS`), cached by content."""
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown export format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    key = (fingerprint(df), fmt)
+    data = _cache.get(key)
+    if data is None:
+        data = _encode(df, fmt)
+        _cache.put(key, data)
+    return data
+
+
+def cache_stats() -> dict:
+    return {"entries": len(_cache._items), "bytes": _cache.size, "hits": _cache.hits, "misses": _cache.misses}
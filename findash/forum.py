@@ -0,0 +1,187 @@
+"""Reddit discussions for the Forum Scraper, fetched without API keys.
+
+:func:`search_posts` reads a subreddit search listing. :func:`fetch_comments`
+expands the full comment tree of each post over a bounded thread pool that
+shares one ``requests.Session`` (and so one keep-alive connection pool),
+walks each tree iteratively and builds a single DataFrame from column lists
+at the end instead of appending row by row.
+
+Reddit returns at most ``limit`` comments per thread and replaces the rest
+with "more" stubs. Their comments are fetched through ``/api/morechildren``
+(100 per request), up to ``max_more`` requests per thread; whatever is left
+after that, and "continue this thread" links, is counted as truncated.
+
+``REDDIT_BASE_URL`` points both at another host, e.g. the local stand-in in
+``benchmarks/reddit_standin.py``.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = "Mozilla/5.0"
+MORE_BATCH = 100  # comment ids per /api/morechildren request (Reddit's maximum)
+COMMENT_COLUMNS = ["post_id", "comment_id", "parent_id", "depth", "author", "score", "body"]
+
+
+def base_url() -> str:
+    return os.environ.get("REDDIT_BASE_URL", "https://www.reddit.com").rstrip("/")
+
+
+def make_session(pool_size: int = 8) -> requests.Session:
+    """A session whose connection pool can hold one connection per worker."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=1)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def search_posts(query: str = "rent vs buy", subreddit: str = "MalaysianPF", limit: int = 20,
+                 session: requests.Session = None, timeout: float = 10) -> pd.DataFrame:
+    """Newest posts matching ``query``; a one-row ``error`` frame when the request fails."""
+    session = session or make_session(1)
+    url = f"{base_url()}/r/{subreddit}/search.json"
+    params = {"q": query, "restrict_sr": 1, "limit": limit, "sort": "new"}
+    try:
+        r = session.get(url, params=params, timeout=timeout)
+    except requests.RequestException as e:
+        return pd.DataFrame([{"error": f"Network error: {e}"}])
+    if r.status_code != 200:
+        return pd.DataFrame([{"error": f"Failed to fetch Reddit data: HTTP {r.status_code}"}])
+
+    posts = []
+    for post in r.json().get("data", {}).get("children", []):
+        p = post.get("data", {})
+        posts.append({
+            "platform": "Reddit",
+            "subreddit": subreddit,
+            "title": p.get("title"),
+            "url": "https://reddit.com" + str(p.get("permalink", "")),
+            "content": (p.get("selftext") or "")[:300],
+            "id": p.get("id"),
+            "permalink": p.get("permalink"),
+            "num_comments": p.get("num_comments"),
+        })
+    return pd.DataFrame(posts)
+
+
+def flatten_comments(payload, post_id: str, out: dict, more: list = None, depth_of: dict = None) -> int:
+    """Append every comment in a thread's JSON to the column lists in ``out``.
+
+    ``payload`` is Reddit's ``[post listing, comment listing]``, or a flat
+    list of things from ``/api/morechildren``, whose depth is found from the
+    parent's entry in ``depth_of`` (comment id -> depth, filled as comments
+    are added). The tree is walked with an explicit stack (threads can nest
+    deeper than Python's recursion limit). The child ids of each "more"
+    stub are appended to ``more`` when given. Returns the number added.
+    """
+    if payload and isinstance(payload, list) and all(isinstance(t, dict) and t.get("kind") in ("t1", "more")
+                                                     for t in payload):
+        children = payload
+    else:
+        listing = payload[1] if isinstance(payload, list) and len(payload) > 1 else payload
+        children = listing.get("data", {}).get("children", [])
+    depth_of = {} if depth_of is None else depth_of
+    stack = [(child, None) for child in reversed(children)]
+    added = 0
+    while stack:
+        node, depth = stack.pop()
+        c = node.get("data", {})
+        if depth is None:
+            parent = str(c.get("parent_id") or "")
+            depth = depth_of[parent[3:]] + 1 if parent.startswith("t1_") and parent[3:] in depth_of else 0
+        if node.get("kind") == "more":
+            if more is not None:
+                more.append(list(c.get("children") or []))
+            continue
+        if node.get("kind") != "t1":
+            continue
+        depth_of[c.get("id")] = depth
+        out["post_id"].append(post_id)
+        out["comment_id"].append(c.get("id"))
+        out["parent_id"].append(c.get("parent_id"))
+        out["depth"].append(depth)
+        out["author"].append(c.get("author"))
+        out["score"].append(c.get("score"))
+        out["body"].append(c.get("body") or "")
+        added += 1
+        replies = c.get("replies")
+        if isinstance(replies, dict):
+            children = replies.get("data", {}).get("children", [])
+            stack.extend((child, depth + 1) for child in reversed(children))
+    return added
+
+
+def fetch_comments(posts: pd.DataFrame, max_workers: int = 8, session: requests.Session = None,
+                   timeout: float = 10, limit: int = 500, max_more: int = 20):
+    """Full comment trees of ``posts`` (needs ``id`` and ``permalink``) as one DataFrame.
+
+    At most ``max_workers`` threads download at once over a shared session,
+    and each thread makes at most ``max_more`` ``/api/morechildren`` requests.
+    A thread that fails to download or parse is counted as failed without
+    stopping the others. Returns ``(comments, stats)``; ``stats`` has the
+    post, comment and failure counts, the elapsed seconds, the throughput in
+    comments per second, and ``truncated`` / ``truncated_threads``: comments
+    left unexpanded (a "continue this thread" link counts as one) and the
+    threads they belong to.
+    """
+    session = session or make_session(max_workers)
+    columns = {name: [] for name in COMMENT_COLUMNS}
+    lock = threading.Lock()
+    root = base_url()
+
+    truncated = {}
+
+    def fetch(post_id, permalink):
+        url = f"{root}{permalink.rstrip('/')}.json"
+        r = session.get(url, params={"limit": limit, "raw_json": 1}, timeout=timeout)
+        r.raise_for_status()
+        local = {name: [] for name in COMMENT_COLUMNS}
+        more, depth_of = [], {}
+        flatten_comments(r.json(), post_id, local, more, depth_of)
+        pending = [cid for ids in more for cid in ids if cid != "_"]
+        skipped = sum(1 for ids in more if not ids or ids == ["_"])  # "continue this thread" links
+        requests_made = 0
+        while pending and requests_made < max_more:
+            batch, pending = pending[:MORE_BATCH], pending[MORE_BATCH:]
+            r = session.get(f"{root}/api/morechildren.json", timeout=timeout, params={
+                "api_type": "json", "link_id": f"t3_{post_id}", "children": ",".join(batch),
+                "limit_children": "false", "raw_json": 1})
+            r.raise_for_status()
+            requests_made += 1
+            things, more = r.json()["json"]["data"]["things"], []
+            if things:
+                flatten_comments(things, post_id, local, more, depth_of)
+            pending += [cid for ids in more for cid in ids if cid != "_"]
+            skipped += sum(1 for ids in more if not ids or ids == ["_"])
+        skipped += len(pending)
+        with lock:
+            for name in COMMENT_COLUMNS:
+                columns[name].extend(local[name])
+            if skipped:
+                truncated[post_id] = skipped
+
+    targets = posts[["id", "permalink"]].dropna().itertuples(index=False)
+    failed = []
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="findash-comments") as pool:
+        futures = {pool.submit(fetch, post_id, permalink): post_id for post_id, permalink in targets}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            # Removed or locked threads can come back as JSON of another shape.
+            except (requests.RequestException, ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+                failed.append(f"{futures[future]}: {e}")
+    elapsed = time.perf_counter() - start
+
+    comments = pd.DataFrame(columns)
+    stats = {"posts": len(futures), "comments": len(comments), "failed": len(failed), "errors": failed,
+             "truncated": sum(truncated.values()), "truncated_threads": len(truncated),
+             "seconds": elapsed, "comments_per_sec": len(comments) / elapsed if elapsed > 0 else 0.0}
+    return comments, stats
@@ -0,0 +1,122 @@
+"""Memoized computation graphs.
+
+A :class:`Graph` is a list of :class:`Node` objects in dependency order.
+Each node remembers the inputs it last saw and its result; on
+:meth:`Graph.evaluate` only nodes downstream of a changed input are
+recomputed, and a node whose recomputed value is unchanged stops the change
+from propagating further. Intermediates can be scalars or NumPy arrays.
+
+:func:`wealth_graph` expresses :func:`findash.wealth.buy_vs_rent_wealth`
+this way, so moving ``invest_return`` alone leaves the mortgage payment and
+rent untouched.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Callable, Tuple
+
+import numpy as np
+
+from findash.wealth import fv_growing_annuity, fv_lump_sum, fv_monthly_annuity, monthly_mortgage_payment
+
+
+@dataclass(frozen=True)
+class Node:
+    name: str
+    deps: Tuple[str, ...]
+    fn: Callable
+
+
+def _same(a, b) -> bool:
+    if a is b:
+        return True
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        a, b = np.asarray(a), np.asarray(b)
+        return a.shape == b.shape and a.dtype == b.dtype and np.array_equal(a, b, equal_nan=True)
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
+class Graph:
+    def __init__(self, inputs, nodes):
+        self.inputs = tuple(inputs)
+        self.nodes = list(nodes)
+        known = set(self.inputs)
+        for node in self.nodes:
+            missing = [d for d in node.deps if d not in known]
+            if missing:
+                raise ValueError(f"node {node.name!r} depends on undefined {missing}")
+            known.add(node.name)
+        self._values = {}
+        self._lock = threading.Lock()
+        self.last_recomputed = ()
+        self.evaluations = 0
+        self.recomputations = 0
+
+    def evaluate(self, **inputs) -> dict:
+        """Values of every input and node, recomputing only what changed."""
+        unknown = set(inputs) - set(self.inputs)
+        if unknown:
+            raise TypeError(f"unexpected input(s): {', '.join(sorted(unknown))}")
+        missing = set(self.inputs) - set(inputs)
+        if missing:
+            raise TypeError(f"missing input(s): {', '.join(sorted(missing))}")
+
+        with self._lock:
+            values = self._values
+            changed = set()
+            for name in self.inputs:
+                if name not in values or not _same(values[name], inputs[name]):
+                    values[name] = inputs[name]
+                    changed.add(name)
+
+            recomputed = []
+            for node in self.nodes:
+                if node.name in values and not changed.intersection(node.deps):
+                    continue
+                result = node.fn(*(values[d] for d in node.deps))
+                recomputed.append(node.name)
+                if node.name not in values or not _same(values[node.name], result):
+                    values[node.name] = result
+                    changed.add(node.name)
+
+            self.last_recomputed = tuple(recomputed)
+            self.evaluations += 1
+            self.recomputations += len(recomputed)
+            return dict(values)
+
+    def invalidate(self) -> None:
+        """Forget every memoized value."""
+        with self._lock:
+            self._values = {}
+
+
+WEALTH_INPUTS = (
+    "house_price", "down_pct", "mortgage_rate", "term_years",
+    "rent_yield", "invest_return", "home_appreciation", "rent_growth",
+)
+
+
+def wealth_graph() -> Graph:
+    """:func:`findash.wealth.buy_vs_rent_wealth` as a memoized graph.
+
+    ``evaluate`` returns ``buy_wealth``, ``rent_wealth`` and ``diff`` alongside
+    the intermediates (``loan``, ``payment``, ``contribution``, ...).
+    ``contribution`` is the first month's instalment minus rent; later months
+    differ once ``rent_growth`` escalates the rent.
+    """
+    return Graph(WEALTH_INPUTS, [
+        Node("loan", ("house_price", "down_pct"), lambda p, d: p * (1 - d)),
+        Node("down", ("house_price", "down_pct"), lambda p, d: p * d),
+        Node("payment", ("loan", "mortgage_rate", "term_years"), monthly_mortgage_payment),
+        Node("monthly_rent", ("house_price", "rent_yield"), lambda p, y: p * y / 12.0),
+        Node("contribution", ("payment", "monthly_rent"), lambda m, r: m - r),
+        Node("buy_wealth", ("house_price", "home_appreciation", "term_years"), fv_lump_sum),
+        Node("fv_down", ("down", "invest_return", "term_years"), fv_lump_sum),
+        Node("fv_payments", ("payment", "invest_return", "term_years"), fv_monthly_annuity),
+        Node("fv_rent", ("monthly_rent", "invest_return", "term_years", "rent_growth"), fv_growing_annuity),
+        Node("fv_contributions", ("fv_payments", "fv_rent"), lambda a, b: a - b),
+        Node("rent_wealth", ("fv_down", "fv_contributions"), lambda a, b: a + b),
+        Node("diff", ("buy_wealth", "rent_wealth"), lambda b, r: b - r),
+    ])
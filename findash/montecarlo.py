@@ -0,0 +1,85 @@
+"""Monte Carlo projections summarised as streaming percentile bands.
+
+Paths are generated chunk by chunk and folded into a
+:class:`findash.quantiles.StreamingQuantiles` digest per series, so the full
+``(paths, years)`` matrix never exists. Annual returns are drawn as
+independent normals around the deterministic assumptions. With zero
+volatility every path reproduces the deterministic engine.
+"""
+import numpy as np
+
+from findash.quantiles import StreamingQuantiles
+from findash.wealth import monthly_mortgage_payment
+
+FAN_QUANTILES = (0.05, 0.25, 0.50, 0.75, 0.95)
+
+
+def index_path_chunks(growth: float, volatility: float, n_years: int, n_paths: int,
+                      chunk: int = 10_000, base: float = 100.0, seed: int = None):
+    """Yield ``(rows, n_years)`` chunks of a compounded growth index."""
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_paths, chunk):
+        m = min(chunk, n_paths - start)
+        returns = rng.normal(growth, volatility, (m, n_years))
+        yield base * np.cumprod(1 + returns, axis=1)
+
+
+def wealth_path_chunks(house_price=800_000.0, down_pct=0.10, mortgage_rate=0.04, term_years=30,
+                       rent_yield=0.045, invest_return=0.06, home_appreciation=0.02, rent_growth=0.0,
+                       invest_volatility=0.10, home_volatility=0.05, n_paths: int = 10_000,
+                       chunk: int = 10_000, seed: int = None):
+    """Yield ``(buy, rent)`` chunks of year-end wealth, each ``(rows, term_years)``.
+
+    Mirrors :func:`findash.wealth.wealth_trajectory`, but each year draws its
+    own investment return and home appreciation.
+    """
+    rng = np.random.default_rng(seed)
+    down = house_price * down_pct
+    m_mort = float(monthly_mortgage_payment(house_price - down, mortgage_rate, term_years))
+    rent0 = house_price * rent_yield / 12.0
+    years = np.arange(term_years)
+    contribution = m_mort - rent0 * (1 + rent_growth) ** years  # monthly, per year
+
+    for start in range(0, n_paths, chunk):
+        m = min(chunk, n_paths - start)
+        ret = rng.normal(invest_return, invest_volatility, (m, term_years))
+        app = rng.normal(home_appreciation, home_volatility, (m, term_years))
+
+        buy = house_price * np.cumprod(1 + app, axis=1)
+        lump = down * np.cumprod(1 + ret, axis=1)
+        # Monthly contributions compound at ret/12 within each year.
+        r = ret / 12.0
+        grow12 = (1 + r) ** 12
+        safe_r = np.where(r == 0, 1.0, r)
+        s12 = np.where(r == 0, 12.0, (grow12 - 1) / safe_r)
+        annuity = np.empty((m, term_years))
+        acc = np.zeros(m)
+        for t in range(term_years):
+            acc = acc * grow12[:, t] + contribution[t] * s12[:, t]
+            annuity[:, t] = acc
+        yield buy, lump + annuity
+
+
+def fan_bands(chunks, n_columns: int, qs=FAN_QUANTILES, compression: int = 200) -> np.ndarray:
+    """Percentile bands ``(len(qs), n_columns)`` of a stream of path chunks."""
+    digest = StreamingQuantiles(n_columns, compression)
+    for block in chunks:
+        digest.update(block)
+    return digest.quantile(qs)
+
+
+def index_fan(growth: float, volatility: float, n_years: int, n_paths: int, qs=FAN_QUANTILES,
+              chunk: int = 10_000, seed: int = None) -> np.ndarray:
+    """Percentile bands ``(len(qs), n_years)`` of a simulated growth index (base 100)."""
+    return fan_bands(index_path_chunks(growth, volatility, n_years, n_paths, chunk, seed=seed), n_years, qs)
+
+
+def wealth_fan(n_paths: int = 10_000, qs=FAN_QUANTILES, chunk: int = 10_000, seed: int = None, **params):
+    """Percentile bands of buy and rent wealth: ``(buy_bands, rent_bands)``."""
+    term_years = int(params.get("term_years", 30))
+    buy_digest = StreamingQuantiles(term_years)
+    rent_digest = StreamingQuantiles(term_years)
+    for buy, rent in wealth_path_chunks(n_paths=n_paths, chunk=chunk, seed=seed, **params):
+        buy_digest.update(buy)
+        rent_digest.update(rent)
+    return buy_digest.quantile(qs), rent_digest.quantile(qs)
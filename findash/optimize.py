@@ -0,0 +1,84 @@
+"""Search for the down payment that maximizes the buy-vs-rent gap for a given loan term.
+
+The objective is ``buy_minus_rent`` from :func:`findash.wealth.buy_vs_rent_wealth`
+for the user's other assumptions, measured at the end of the loan term. Terms
+are not compared with each other: the engine's horizon is the loan term (it
+has no outstanding-balance model), so different terms would be scored at
+different end dates.
+
+For a fixed term the objective is linear in ``down_pct``: the buyer's wealth
+does not depend on it, and the renter's invested down payment and monthly
+savings (instalment minus rent, with the instalment proportional to the
+loan) are both linear in it. The optimum is therefore an end of the feasible
+down-payment interval, which the constraints bound in closed form. A grid of
+the curve over the whole range is returned for plotting.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from findash.wealth import buy_vs_rent_wealth, monthly_mortgage_payment
+
+
+@dataclass
+class FinancingChoice:
+    down_pct: float
+    term_years: int
+    buy_minus_rent: float
+    monthly_payment: float
+    feasible: tuple          # (lowest, highest) down_pct within every limit
+    down_grid: np.ndarray    # curve axis
+    curve: np.ndarray        # objective along down_grid, NaN where infeasible
+    payment: np.ndarray      # monthly instalment along down_grid
+
+
+def optimize_financing(
+    house_price: float,
+    mortgage_rate: float,
+    term_years: int,
+    rent_yield: float,
+    invest_return: float,
+    home_appreciation: float,
+    rent_growth: float = 0.0,
+    down_range=(0.10, 0.90),
+    max_payment: float = None,
+    max_down_cash: float = None,
+    grid_points: int = 81,
+):
+    """Best ``down_pct`` for a ``term_years`` loan under the given constraints.
+
+    ``max_payment`` caps the monthly instalment and ``max_down_cash`` the
+    down payment in RM. Returns a :class:`FinancingChoice`, or ``None`` when
+    no down payment satisfies the constraints.
+    """
+    assumptions = dict(mortgage_rate=mortgage_rate, term_years=term_years, rent_yield=rent_yield,
+                       invest_return=invest_return, home_appreciation=home_appreciation,
+                       rent_growth=rent_growth)
+    lo, hi = down_range
+    per_rm = float(monthly_mortgage_payment(1.0, mortgage_rate, term_years))  # instalment per RM borrowed
+    if max_payment is not None:
+        lo = max(lo, 1.0 - max_payment / (house_price * per_rm))
+    if max_down_cash is not None:
+        hi = min(hi, max_down_cash / house_price)
+    if lo > hi:
+        return None
+
+    # Linear objective: compare the two ends (the lower one wins a tie, tying up less cash).
+    ends = np.array([lo, hi])
+    _, _, diff = buy_vs_rent_wealth(house_price=house_price, down_pct=ends, **assumptions)
+    k = int(np.argmax(diff))
+    down_pct = float(ends[k])
+
+    downs = np.linspace(*down_range, grid_points)
+    _, _, curve = buy_vs_rent_wealth(house_price=house_price, down_pct=downs, **assumptions)
+    inside = (downs >= lo - 1e-12) & (downs <= hi + 1e-12)
+    return FinancingChoice(
+        down_pct=down_pct,
+        term_years=int(term_years),
+        buy_minus_rent=float(diff[k]),
+        monthly_payment=house_price * (1 - down_pct) * per_rm,
+        feasible=(float(lo), float(hi)),
+        down_grid=downs,
+        curve=np.where(inside, curve, np.nan),
+        payment=house_price * (1 - downs) * per_rm,
+    )
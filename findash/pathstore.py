@@ -0,0 +1,165 @@
+"""Memory-mapped float32 storage for full simulation paths.
+
+A path store is one file holding one or more named series of shape
+``(paths, years)``. It starts with a small header (magic bytes, then a
+length-prefixed JSON object with the shape, dtype, series names and
+simulation parameters) padded to 64 bytes, followed by the raw C-order
+array ``(series, paths, years)``. Only the pages being touched are read, so
+slicing a year (``store["rent"][:, 9]``) or a block of paths
+(``store["buy"][:1000]``) returns a view into the map without copying.
+
+Stores are published atomically: :func:`store_chunks` fills a private
+temporary file and ``os.replace``-s it over the target, so a reader that
+already has the old file mapped keeps its (complete) copy and never sees a
+half-written or truncated one.
+
+float32 halves the footprint of float64. For wealth values in the millions
+its ~7 significant digits put the rounding error well below one ringgit per
+thousand.
+"""
+import json
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+MAGIC = b"FDPATHS1"
+ALIGN = 64
+
+
+def _header_bytes(meta: dict) -> bytes:
+    body = json.dumps(meta, sort_keys=True).encode("utf-8")
+    size = len(MAGIC) + 4 + len(body)
+    pad = -size % ALIGN
+    return MAGIC + struct.pack("<I", len(body) + pad) + body + b" " * pad
+
+
+class PathStore:
+    """A path store opened for reading (``"r"``) or writing (``"r+"``)."""
+
+    def __init__(self, filename: str, mode: str = "r"):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{filename} is not a path store")
+            (length,) = struct.unpack("<I", f.read(4))
+            self.meta = json.loads(f.read(length))
+        self.series = list(self.meta["series"])
+        self.params = self.meta.get("params", {})
+        self.data = np.memmap(filename, dtype=self.meta["dtype"], mode=mode,
+                              offset=len(MAGIC) + 4 + length, shape=tuple(self.meta["shape"]))
+
+    @classmethod
+    def create(cls, filename: str, n_paths: int, n_years: int, series=("paths",),
+               dtype="float32", params: dict = None) -> "PathStore":
+        """Allocate a new store of zeros and open it for writing.
+
+        An existing ``filename`` is replaced, not truncated in place, so
+        anyone mapping it keeps the old contents.
+        """
+        meta = {
+            "version": 1,
+            "dtype": np.dtype(dtype).str,
+            "shape": [len(series), int(n_paths), int(n_years)],
+            "series": list(series),
+            "params": params or {},
+        }
+        header = _header_bytes(meta)
+        tmp = _temp_path(filename)
+        try:
+            with open(tmp, "wb") as f:
+                f.write(header)
+                f.truncate(len(header) + int(np.prod(meta["shape"])) * np.dtype(dtype).itemsize)
+            os.replace(tmp, filename)
+        except BaseException:
+            _remove(tmp)
+            raise
+        return cls(filename, mode="r+")
+
+    @property
+    def n_paths(self) -> int:
+        return self.data.shape[1]
+
+    @property
+    def n_years(self) -> int:
+        return self.data.shape[2]
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """The ``(paths, years)`` view of one series."""
+        return self.data[self.series.index(name)]
+
+    def write(self, start: int, **chunks) -> None:
+        """Write ``(rows, years)`` chunks for each named series at path ``start``."""
+        for name, chunk in chunks.items():
+            chunk = np.asarray(chunk)
+            self[name][start:start + chunk.shape[0]] = chunk
+
+    def year(self, name: str, index: int) -> np.ndarray:
+        """All paths of one series at one year (a strided view)."""
+        return self[name][:, index]
+
+    def flush(self) -> None:
+        self.data.flush()
+
+    def close(self) -> None:
+        if self.data is not None:
+            self.data.flush()
+            self.data = None  # the map closes once the last view is released
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _temp_path(filename: str) -> str:
+    """A new, empty, process-private file next to ``filename`` (same filesystem, so ``os.replace`` is atomic)."""
+    folder = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(filename) + ".", suffix=".tmp", dir=folder)
+    os.close(fd)
+    return tmp
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def store_chunks(filename: str, chunks, n_paths: int, n_years: int, series=("paths",),
+                 dtype="float32", params: dict = None) -> PathStore:
+    """Write an iterator of chunks to a new store and reopen it read-only.
+
+    Each chunk is one ``(rows, years)`` array per name in ``series`` (a
+    tuple when there are several), e.g. from
+    :func:`findash.montecarlo.wealth_path_chunks`. The store is built in a
+    temporary file and only replaces ``filename`` once the chunks have filled
+    exactly ``n_paths`` rows; otherwise ``ValueError`` is raised and
+    ``filename`` is left untouched.
+    """
+    tmp = _temp_path(filename)
+    try:
+        store = PathStore.create(tmp, n_paths, n_years, series, dtype, params)
+        start = 0
+        for chunk in chunks:
+            arrays = chunk if isinstance(chunk, tuple) else (chunk,)
+            if start + arrays[0].shape[0] > n_paths:
+                raise ValueError(f"chunks hold more than the {n_paths} paths the store was sized for")
+            store.write(start, **dict(zip(series, arrays)))
+            start += arrays[0].shape[0]
+        store.close()
+        if start != n_paths:
+            raise ValueError(f"chunks filled {start} of {n_paths} paths")
+        os.replace(tmp, filename)
+    except BaseException:
+        _remove(tmp)
+        raise
+    return PathStore(filename)
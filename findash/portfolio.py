@@ -0,0 +1,92 @@
+"""Evaluate, rank and filter a shortlist of properties in one pass.
+
+A portfolio is a table with one row per property. Columns follow
+:mod:`findash.batch` (``house_price``, ``rent`` or ``rent_yield``,
+``down_pct`` or ``down_payment``, ``mortgage_rate``, ``term_years``,
+``home_appreciation``, ``rent_growth``, ``invest_return``); missing columns
+fall back to the engine defaults. :func:`evaluate_portfolio` scores every row
+with a single vectorized call and adds ranking columns. :func:`filter_portfolio`
+applies the screening limits with boolean masks.
+"""
+import numpy as np
+import pandas as pd
+
+from findash.batch import household_inputs, score_chunk
+
+# A few illustrative Klang Valley listings; rates and yields in percent.
+EXAMPLE_PORTFOLIO = pd.DataFrame({
+    "name": ["Mont Kiara condo", "Cheras terrace", "Petaling Jaya apartment", "Bangsar South serviced",
+             "Setia Alam semi-D", "Puchong townhouse"],
+    "house_price": [950_000, 680_000, 520_000, 780_000, 1_250_000, 560_000],
+    "rent": [3_800, 2_300, 1_900, 3_200, 3_900, 1_900],
+    "down_pct": [10.0, 10.0, 10.0, 20.0, 15.0, 10.0],
+    "mortgage_rate": [4.1, 4.0, 4.2, 4.1, 3.9, 4.2],
+    "term_years": [35, 30, 30, 30, 35, 30],
+    "home_appreciation": [1.5, 3.0, 2.5, 1.0, 3.5, 2.5],
+    "rent_growth": [1.0, 2.0, 2.0, 1.0, 2.5, 2.0],
+    "invest_return": [6.0, 6.0, 6.0, 6.0, 6.0, 6.0],
+})
+
+
+def sample_listings(n: int, seed: int = None) -> pd.DataFrame:
+    """``n`` random but plausible listings (rates in percent), for demos and load checks."""
+    rng = np.random.default_rng(seed)
+    price = np.round(rng.lognormal(np.log(650_000), 0.45, n), -3)
+    return pd.DataFrame({
+        "name": [f"Listing {i + 1}" for i in range(n)],
+        "house_price": price,
+        "rent": np.round(price * rng.uniform(0.03, 0.06, n) / 12, -1),
+        "down_pct": rng.choice([10.0, 15.0, 20.0, 30.0], n),
+        "mortgage_rate": np.round(rng.uniform(3.6, 4.8, n), 2),
+        "term_years": rng.choice([25, 30, 35], n),
+        "home_appreciation": np.round(rng.normal(2.5, 1.2, n), 2),
+        "rent_growth": np.round(rng.uniform(0.0, 3.0, n), 2),
+        "invest_return": 6.0,
+    })
+
+
+def evaluate_portfolio(df: pd.DataFrame, percent: bool = True) -> pd.DataFrame:
+    """Score every property and rank by ``buy_minus_rent`` (1 = strongest case to buy).
+
+    ``percent`` says rates, yields and ``down_pct`` are given in percent, as
+    in :data:`EXAMPLE_PORTFOLIO`. Rows with invalid inputs get NaN results
+    and no rank. ``buy_minus_rent`` is measured at the end of each row's own
+    loan term, reported as ``horizon_years``; rows with different terms are
+    compared at different horizons.
+    """
+    scored = score_chunk(df.reset_index(drop=True), percent=percent)
+    p = household_inputs(df, percent)
+    # The numbers actually scored: uploads may carry prices as text, or as ``price``.
+    scored["house_price"] = p["house_price"]
+    scored["horizon_years"] = p["term_years"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        monthly_rent = p["house_price"] * p["rent_yield"] / 12.0
+        scored["gross_yield_pct"] = p["rent_yield"] * 100.0
+        scored["payment_to_rent"] = scored["monthly_payment"].to_numpy() / monthly_rent
+        scored["down_payment_rm"] = p["house_price"] * p["down_pct"]
+
+    diff = scored["buy_minus_rent"].to_numpy()
+    valid = ~np.isnan(diff)
+    rank = np.full(len(diff), np.nan)
+    order = np.flatnonzero(valid)[np.argsort(-diff[valid], kind="stable")]
+    rank[order] = np.arange(1, len(order) + 1)
+    scored["rank"] = pd.array(rank, dtype="Int64")
+    return scored
+
+
+def filter_portfolio(scored: pd.DataFrame, decision: str = None, max_price: float = None,
+                     max_payment: float = None, max_down_payment: float = None,
+                     min_advantage: float = None) -> pd.DataFrame:
+    """Rows of an evaluated portfolio within every given limit, best-ranked first."""
+    mask = np.ones(len(scored), dtype=bool)
+    if decision in ("buy", "rent"):
+        mask &= scored["decision"].to_numpy() == decision
+    if max_price is not None:
+        mask &= scored["house_price"].to_numpy(dtype=float) <= max_price
+    if max_payment is not None:
+        mask &= scored["monthly_payment"].to_numpy() <= max_payment
+    if max_down_payment is not None:
+        mask &= scored["down_payment_rm"].to_numpy() <= max_down_payment
+    if min_advantage is not None:
+        mask &= scored["buy_minus_rent"].to_numpy() >= min_advantage
+    return scored[mask].sort_values("rank", na_position="last")
@@ -0,0 +1,108 @@
+"""Background precomputation with a per-owner result cache.
+
+A :class:`Prefetcher` belongs to one user session. :meth:`Prefetcher.prefetch`
+starts a loader on a shared worker pool; :meth:`Prefetcher.get` returns the
+finished result, waits for one that is still running, or computes it inline
+if nothing was started. Loaders receive a :class:`CancelToken` and should call
+:meth:`CancelToken.check` between stages so :meth:`Prefetcher.cancel_except`
+can stop work the user navigated away from.
+"""
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def shared_executor(max_workers: int = 2) -> ThreadPoolExecutor:
+    """Process-wide pool shared by every session's prefetcher."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="findash-prefetch")
+        return _executor
+
+
+class Cancelled(Exception):
+    """Raised inside a loader whose prefetch was cancelled."""
+
+
+class CancelToken:
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self) -> None:
+        if self._event.is_set():
+            raise Cancelled()
+
+
+class Prefetcher:
+    def __init__(self, executor: ThreadPoolExecutor = None):
+        self._executor = executor or shared_executor()
+        self._lock = threading.Lock()
+        self._results = {}
+        self._running = {}  # key -> (future, token)
+
+    def prefetch(self, key, loader, *args) -> None:
+        """Start ``loader(token, *args)`` in the background unless ``key`` is cached or running."""
+        with self._lock:
+            if key in self._results or key in self._running:
+                return
+            token = CancelToken()
+            future = self._executor.submit(loader, token, *args)
+            self._running[key] = (future, token)
+        future.add_done_callback(lambda f, key=key: self._finish(key, f))
+
+    def _finish(self, key, future) -> None:
+        with self._lock:
+            entry = self._running.get(key)
+            if entry is None or entry[0] is not future:
+                return
+            del self._running[key]
+            if not future.cancelled() and future.exception() is None:
+                self._results[key] = future.result()
+
+    def get(self, key, loader, *args):
+        """The result for ``key``: cached, awaited from a running prefetch, or computed now."""
+        with self._lock:
+            if key in self._results:
+                return self._results[key]
+            entry = self._running.get(key)
+        if entry is not None:
+            try:
+                return entry[0].result()
+            except (Cancelled, CancelledError):
+                pass
+        result = loader(CancelToken(), *args)
+        with self._lock:
+            self._results[key] = result
+        return result
+
+    def cancel_except(self, keys) -> list:
+        """Cancel running prefetches not in ``keys``; returns the cancelled keys."""
+        keys = set(keys)
+        cancelled = []
+        with self._lock:
+            for key, (future, token) in list(self._running.items()):
+                if key not in keys:
+                    token.cancel()
+                    future.cancel()
+                    del self._running[key]
+                    cancelled.append(key)
+        return cancelled
+
+    def is_ready(self, key) -> bool:
+        with self._lock:
+            return key in self._results
+
+    def clear(self) -> None:
+        self.cancel_except(())
+        with self._lock:
+            self._results.clear()
@@ -0,0 +1,150 @@
+"""Indicator series at mixed native frequencies, viewed at any granularity.
+
+An :class:`IndicatorSet` stores each series once at its own frequency
+(annual ``Data.csv`` columns, monthly OPR decisions, quarterly price indices,
+...) on a ``PeriodIndex``. :meth:`IndicatorSet.view` returns a wide table at
+annual (``"Y"``), quarterly (``"Q"``) or monthly (``"M"``) granularity:
+
+* coarser than native: each period is aggregated with the series' method.
+  ``mean`` averages, ``last`` takes the period-end value and ``growth``
+  compounds per-period percentage rates, ``(prod(1 + x/100) - 1) * 100``;
+* finer than native: ``mean``/``last`` values are carried across the
+  sub-periods and ``growth`` rates are de-compounded so they still compound
+  to the native figure.
+
+Views are computed once per :attr:`IndicatorSet.version` (a hash of the
+stored data) and memoized, so switching granularity is a dictionary lookup.
+"""
+import hashlib
+import threading
+
+import numpy as np
+import pandas as pd
+
+from findash.data import clean_indicators, load_indicators
+
+GRANULARITIES = {"Annual": "Y", "Quarterly": "Q", "Monthly": "M"}
+AGGREGATIONS = ("mean", "last", "growth")
+_MONTHS = {"Y": 12, "Q": 3, "M": 1}
+
+# How each Data.csv column aggregates over time.
+DEFAULT_AGGREGATION = {
+    "OPR_avg": "mean",
+    "EPF": "last",
+    "PriceGrowth": "growth",
+    "RentYield": "mean",
+}
+
+
+def _freq_code(index: pd.PeriodIndex) -> str:
+    code = index.freqstr[0].upper()
+    if code == "A":
+        code = "Y"
+    if code not in _MONTHS:
+        raise ValueError(f"unsupported frequency {index.freqstr!r}; use annual, quarterly or monthly")
+    return code
+
+
+def _compound(values: pd.Series) -> float:
+    return (np.prod(1 + values.to_numpy() / 100.0) - 1) * 100.0
+
+
+def resample(series: pd.Series, target: str, how: str = "mean") -> pd.Series:
+    """``series`` (on a ``PeriodIndex``) at ``target`` frequency ``"Y"``, ``"Q"`` or ``"M"``."""
+    if how not in AGGREGATIONS:
+        raise ValueError(f"unknown aggregation {how!r}; expected one of {', '.join(AGGREGATIONS)}")
+    native = _freq_code(series.index)
+    if native == target:
+        return series
+    if _MONTHS[native] < _MONTHS[target]:
+        periods = series.index.asfreq(target)
+        return series.groupby(periods).agg(_compound if how == "growth" else how)
+
+    # Finer than native: fill every sub-period of a contiguous range.
+    full = pd.period_range(series.index.min(), series.index.max(), freq=series.index.freq)
+    series = series.reindex(full)
+    k = _MONTHS[native] // _MONTHS[target]
+    values = np.repeat(series.to_numpy(dtype=float), k)
+    if how == "growth":
+        values = ((1 + values / 100.0) ** (1.0 / k) - 1) * 100.0
+    index = pd.period_range(full[0].asfreq(target, how="start"), full[-1].asfreq(target, how="end"), freq=target)
+    return pd.Series(values, index=index, name=series.name)
+
+
+class IndicatorSet:
+    def __init__(self):
+        self._series = {}   # name -> (series, aggregation)
+        self._views = {}    # (version, target) -> DataFrame
+        self._version = None
+        self._lock = threading.Lock()
+
+    def add(self, name: str, series: pd.Series, how: str = "mean") -> None:
+        """Store ``series`` (``PeriodIndex`` or ``DatetimeIndex`` with a frequency) at its native frequency."""
+        if how not in AGGREGATIONS:
+            raise ValueError(f"unknown aggregation {how!r}; expected one of {', '.join(AGGREGATIONS)}")
+        if isinstance(series.index, pd.DatetimeIndex):
+            freq = series.index.freqstr or pd.infer_freq(series.index)
+            if freq is None:
+                raise ValueError(f"cannot infer the frequency of {name!r}")
+            series = series.to_period(freq[0] if freq[0] != "A" else "Y")
+        series = series.dropna().sort_index().rename(name).astype(float)
+        with self._lock:
+            self._series[name] = (series, how)
+            self._version = None
+
+    @classmethod
+    def from_annual(cls, df: pd.DataFrame, year_col: str = "Year", aggregation: dict = None) -> "IndicatorSet":
+        """Every numeric column of a wide annual table, such as ``Data.csv``."""
+        aggregation = {**DEFAULT_AGGREGATION, **(aggregation or {})}
+        out = cls()
+        index = pd.PeriodIndex(df[year_col].astype(int).astype(str), freq="Y")
+        for col in df.columns.drop(year_col):
+            if pd.api.types.is_numeric_dtype(df[col]):
+                out.add(col, pd.Series(df[col].to_numpy(), index=index), aggregation.get(col, "mean"))
+        return out
+
+    @property
+    def names(self) -> list:
+        return list(self._series)
+
+    def aggregation(self, name: str) -> str:
+        return self._series[name][1]
+
+    def native_frequency(self, name: str) -> str:
+        return _freq_code(self._series[name][0].index)
+
+    @property
+    def version(self) -> str:
+        """Hash of every stored series (values and full period index); changes whenever the data does."""
+        with self._lock:
+            if self._version is None:
+                h = hashlib.sha1()
+                for name, (series, how) in sorted(self._series.items()):
+                    h.update(f"{name}|{how}|{series.index.freqstr}|".encode("utf-8"))
+                    h.update(pd.util.hash_pandas_object(series, index=True).to_numpy().tobytes())
+                self._version = h.hexdigest()
+            return self._version
+
+    def view(self, target: str = "Y") -> pd.DataFrame:
+        """All series at ``target`` granularity, one column each, indexed by period."""
+        target = GRANULARITIES.get(target, target)
+        key = (self.version, target)
+        with self._lock:
+            cached = self._views.get(key)
+        if cached is not None:
+            return cached
+        frame = pd.concat([resample(s, target, how) for s, how in self._series.values()], axis=1)
+        frame.index.name = "Period"
+        with self._lock:
+            self._views = {k: v for k, v in self._views.items() if k[0] == key[0]}
+            self._views[key] = frame
+        return frame
+
+    def views(self) -> dict:
+        """Every granularity at once, keyed by its label in :data:`GRANULARITIES`."""
+        return {label: self.view(code) for label, code in GRANULARITIES.items()}
+
+
+def load_indicator_set(path: str = None) -> IndicatorSet:
+    """``Data.csv`` (or ``path``) as an :class:`IndicatorSet`."""
+    return IndicatorSet.from_annual(clean_indicators(load_indicators(path)))
@@ -0,0 +1,20 @@
+"""Deterministic growth scenarios (baseline / optimistic / pessimistic)."""
+import numpy as np
+
+DEFAULT_SCENARIOS = {
+    "Baseline (5%)": 0.05,
+    "Optimistic (8%)": 0.08,
+    "Pessimistic (3%)": 0.03,
+}
+
+
+def growth_index(rates, n_years: int, base: float = 100.0):
+    """Compounded index per scenario.
+
+    ``rates`` is a scalar or array of annual growth rates; the result has the
+    rate shape plus a trailing year axis of length ``n_years`` whose first
+    entry is one year of growth on ``base``.
+    """
+    rates = np.asarray(rates, dtype=float)
+    steps = np.arange(1, n_years + 1)
+    return base * (1 + rates[..., None]) ** steps
@@ -0,0 +1,27 @@
+"""Sensitivity grids for contributions, returns and the buy-vs-rent inputs."""
+import numpy as np
+
+from findash.wealth import buy_vs_rent_wealth
+
+
+def contribution_growth_grid(contributions, returns, n_years: int):
+    """Cumulative value of a contribution growing at each return.
+
+    Matches the Modelling page: year ``t`` adds ``c * (1 + r) ** t``. Returns
+    an array of shape ``(len(contributions), len(returns), n_years)``.
+    """
+    c = np.asarray(contributions, dtype=float)[:, None, None]
+    r = np.asarray(returns, dtype=float)[None, :, None]
+    t = np.arange(n_years)[None, None, :]
+    return np.cumsum(c * (1 + r) ** t, axis=-1)
+
+
+def one_factor_sweep(param: str, values, **base):
+    """Re-evaluate :func:`buy_vs_rent_wealth` with one input swept over ``values``.
+
+    Other inputs come from ``base`` (or the engine defaults). Returns the
+    ``(buy, rent, diff)`` arrays, each shaped like ``values``.
+    """
+    base = dict(base)
+    base[param] = np.asarray(values, dtype=float)
+    return buy_vs_rent_wealth(**base)
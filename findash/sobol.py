@@ -0,0 +1,146 @@
+"""Variance-based global sensitivity analysis (Sobol indices).
+
+Uses the Saltelli design: two independent sample matrices ``A`` and ``B``
+plus, for each input ``i``, ``AB_i`` (``A`` with column ``i`` taken from
+``B``). First-order indices use the Saltelli (2010) estimator
+``mean(f(B) * (f(AB_i) - f(A))) / V`` and total effects the Jansen estimator
+``mean((f(A) - f(AB_i)) ** 2) / 2V``.
+
+The design is generated and evaluated chunk by chunk, and only running sums
+are kept, so memory is set by the chunk size, not the number of evaluations.
+Each chunk is one vectorized call of the model on ``chunk * (d + 2)`` rows.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from findash.wealth import buy_vs_rent_wealth
+
+Z95 = 1.959963984540054
+
+# Default ranges for the buy-vs-rent inputs.
+WEALTH_BOUNDS = {
+    "house_price": (400_000.0, 1_500_000.0),
+    "down_pct": (0.05, 0.30),
+    "mortgage_rate": (0.025, 0.06),
+    "term_years": (20, 35),
+    "rent_yield": (0.03, 0.06),
+    "invest_return": (0.03, 0.09),
+    "home_appreciation": (0.0, 0.05),
+    "rent_growth": (0.0, 0.04),
+}
+
+
+def wealth_difference(params: dict):
+    """Model for :func:`sobol_indices`: buy-minus-rent wealth."""
+    return buy_vs_rent_wealth(**params)[2]
+
+
+@dataclass
+class SobolResult:
+    names: list
+    first: np.ndarray
+    first_ci: np.ndarray   # 95% half-width
+    total: np.ndarray
+    total_ci: np.ndarray   # 95% half-width
+    variance: float
+    n_base: int
+    n_evaluations: int
+    convergence: list = field(default_factory=list)  # (n_evaluations, first, total) per chunk
+
+
+class _Moments:
+    """Running sum and sum of squares per column."""
+
+    def __init__(self, d: int):
+        self.n = 0
+        self.s = np.zeros(d)
+        self.ss = np.zeros(d)
+
+    def add(self, x: np.ndarray) -> None:
+        self.n += x.shape[0]
+        self.s += x.sum(axis=0)
+        self.ss += np.einsum("ij,ij->j", x, x)
+
+    def mean(self):
+        return self.s / self.n
+
+    def sem(self):
+        var = np.maximum(self.ss / self.n - self.mean() ** 2, 0.0)
+        return np.sqrt(var / max(self.n - 1, 1))
+
+
+def sobol_indices(model=wealth_difference, bounds: dict = None, n_evaluations: int = 100_000,
+                  max_bytes: int = 64 * 2**20, min_chunks: int = 10, integer=("term_years",),
+                  seed: int = None) -> SobolResult:
+    """First-order and total-effect Sobol indices of ``model`` over ``bounds``.
+
+    ``model`` takes a dict of equal-length input arrays and returns one output
+    per row. Inputs are sampled uniformly within ``bounds``; names in
+    ``integer`` are rounded. ``n_evaluations`` is the total model-evaluation
+    budget (``n_base * (d + 2)``) and ``max_bytes`` caps the memory used
+    by one chunk's design matrix. The run is split into at least
+    ``min_chunks`` chunks so ``convergence`` has that many checkpoints.
+    """
+    bounds = dict(WEALTH_BOUNDS if bounds is None else bounds)
+    names = list(bounds)
+    d = len(names)
+    lo = np.array([bounds[n][0] for n in names], dtype=float)
+    hi = np.array([bounds[n][1] for n in names], dtype=float)
+    rounded = np.array([n in integer for n in names])
+
+    n_base = max(2, n_evaluations // (d + 2))
+    # One chunk holds (d + 2) stacked d-column matrices plus the outputs.
+    chunk = max(1, min(int(max_bytes // (8 * (d + 2) * (d + 1))), -(-n_base // min_chunks)))
+    rng = np.random.default_rng(seed)
+
+    shift = None
+    f_moments = _Moments(1)
+    first_terms = _Moments(d)
+    total_terms = _Moments(d)
+    convergence = []
+
+    done = 0
+    while done < n_base:
+        m = min(chunk, n_base - done)
+        A = lo + (hi - lo) * rng.random((m, d))
+        B = lo + (hi - lo) * rng.random((m, d))
+        if rounded.any():
+            A[:, rounded] = np.round(A[:, rounded])
+            B[:, rounded] = np.round(B[:, rounded])
+
+        # Rows: A, B, AB_0 ... AB_{d-1}
+        design = np.empty(((d + 2) * m, d), order="F")  # contiguous input columns
+        design[:m] = A
+        design[m:2 * m] = B
+        for i in range(d):
+            block = design[(i + 2) * m:(i + 3) * m]
+            block[:] = A
+            block[:, i] = B[:, i]
+        y = np.asarray(model({n: design[:, j] for j, n in enumerate(names)}), dtype=float)
+        del design
+
+        fA, fB = y[:m], y[m:2 * m]
+        fAB = y[2 * m:].reshape(d, m).T
+        if shift is None:
+            # Centre on the first chunk's mean to keep the running sums well conditioned.
+            shift = float(np.mean(y[:2 * m]))
+        f_moments.add(np.concatenate([fA, fB])[:, None] - shift)
+        first_terms.add((fB - shift)[:, None] * (fAB - fA[:, None]))
+        total_terms.add(0.5 * (fA[:, None] - fAB) ** 2)
+
+        done += m
+        variance = float(f_moments.ss[0] / f_moments.n - f_moments.mean()[0] ** 2)
+        convergence.append((done * (d + 2), first_terms.mean() / variance, total_terms.mean() / variance))
+
+    return SobolResult(
+        names=names,
+        first=first_terms.mean() / variance,
+        first_ci=Z95 * first_terms.sem() / variance,
+        total=total_terms.mean() / variance,
+        total_ci=Z95 * total_terms.sem() / variance,
+        variance=variance,
+        n_base=n_base,
+        n_evaluations=n_base * (d + 2),
+        convergence=convergence,
+    )
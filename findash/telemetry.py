@@ -0,0 +1,215 @@
+"""Per-page rerun timing.
+
+Pages call :func:`start_rerun` at the top of the script, wrap their expensive
+stages in ``with span("stage"):`` and call :func:`finish_rerun` at the end.
+Finished reruns land in a bounded in-process history and in cumulative
+per-stage totals that can be exported as Prometheus text or JSON lines.
+Other modules count events with :func:`incr`; the counters are exported
+alongside the stage totals.
+
+Recording is off unless ``FINDASH_METRICS`` is set (or :func:`set_enabled` is
+called). While off, :func:`span` returns one shared no-op context manager, so
+an instrumented stage costs a function call and a flag check.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import deque
+
+HISTORY_SIZE = int(os.environ.get("FINDASH_METRICS_HISTORY", "200"))
+
+_enabled = os.environ.get("FINDASH_METRICS", "").lower() not in ("", "0", "false", "no")
+_metrics_file = os.environ.get("FINDASH_METRICS_FILE")
+
+_NULL_SPAN = contextlib.nullcontext()
+_local = threading.local()
+_lock = threading.Lock()
+_history = deque(maxlen=HISTORY_SIZE)
+# (page, stage) -> [count, total_seconds]; stage "" holds whole-rerun totals
+_totals = {}
+_incomplete = {}
+# (metric, sorted label items) -> count, for event counters such as cache hits
+_counters = {}
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(flag: bool = True) -> None:
+    """Turn recording on or off for the whole process."""
+    global _enabled
+    _enabled = bool(flag)
+
+
+class _Span:
+    __slots__ = ("record", "stage", "t0")
+
+    def __init__(self, record: dict, stage: str):
+        self.record = record
+        self.stage = stage
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.record["spans"].append((self.stage, time.perf_counter() - self.t0))
+        return False
+
+
+def span(stage: str):
+    """Context manager timing one stage of the current rerun."""
+    if not _enabled:
+        return _NULL_SPAN
+    record = getattr(_local, "record", None)
+    if record is None:
+        return _NULL_SPAN
+    return _Span(record, stage)
+
+
+def start_rerun(page: str) -> None:
+    """Open a timing record for a page rerun on the calling thread."""
+    if not _enabled:
+        return
+    stale = getattr(_local, "record", None)
+    if stale is not None:
+        # The previous rerun ended early (st.stop() or an exception).
+        _close(stale, complete=False)
+    _local.record = {
+        "page": page,
+        "started": time.time(),
+        "t0": time.perf_counter(),
+        "spans": [],
+    }
+
+
+def finish_rerun():
+    """Close the current rerun record and return it (``None`` if not recording)."""
+    record = getattr(_local, "record", None)
+    if record is None:
+        return None
+    return _close(record, complete=True)
+
+
+def _close(record: dict, complete: bool) -> dict:
+    _local.record = None
+    total = time.perf_counter() - record.pop("t0")
+    record["total"] = total
+    record["complete"] = complete
+    page = record["page"]
+    with _lock:
+        _history.append(record)
+        _add(page, "", total)
+        for stage, seconds in record["spans"]:
+            _add(page, stage, seconds)
+        if not complete:
+            _incomplete[page] = _incomplete.get(page, 0) + 1
+        if _metrics_file:
+            with open(_metrics_file, "a", encoding="utf-8") as fh:
+                fh.write(_record_json(record) + "\n")
+    return record
+
+
+def _add(page: str, stage: str, seconds: float) -> None:
+    entry = _totals.setdefault((page, stage), [0, 0.0])
+    entry[0] += 1
+    entry[1] += seconds
+
+
+def incr(metric: str, n: int = 1, **labels) -> None:
+    """Add ``n`` to a Prometheus counter (e.g. ``incr("findash_cache_requests_total", result="hit")``)."""
+    if not _enabled:
+        return
+    key = (metric, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + n
+
+
+def counters() -> dict:
+    """Current counter values keyed by ``(metric, ((label, value), ...))``."""
+    with _lock:
+        return dict(_counters)
+
+
+def recent(n: int = 20) -> list:
+    """The last ``n`` finished reruns, newest first."""
+    with _lock:
+        records = list(_history)
+    return records[::-1][:n]
+
+
+def reset() -> None:
+    """Drop all recorded history and totals."""
+    with _lock:
+        _history.clear()
+        _totals.clear()
+        _incomplete.clear()
+        _counters.clear()
+
+
+# ----------------------------
+# Exporters
+# ----------------------------
+def _record_json(record: dict) -> str:
+    return json.dumps({
+        "page": record["page"],
+        "started": round(record["started"], 3),
+        "total_s": round(record["total"], 6),
+        "complete": record["complete"],
+        "spans": [{"stage": s, "seconds": round(t, 6)} for s, t in record["spans"]],
+    }, ensure_ascii=False)
+
+
+def to_jsonl(records=None) -> str:
+    """Reruns as JSON lines, oldest first."""
+    if records is None:
+        with _lock:
+            records = list(_history)
+    return "".join(_record_json(r) + "\n" for r in records)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_prometheus() -> str:
+    """Cumulative totals in the Prometheus text exposition format."""
+    with _lock:
+        totals = sorted(_totals.items())
+        incomplete = sorted(_incomplete.items())
+        counts = sorted(_counters.items())
+
+    lines = [
+        "# HELP findash_rerun_seconds Wall time of a full page rerun.",
+        "# TYPE findash_rerun_seconds summary",
+    ]
+    for (page, stage), (count, total) in totals:
+        if stage == "":
+            lines.append(f'findash_rerun_seconds_sum{{page="{_label(page)}"}} {total:.6f}')
+            lines.append(f'findash_rerun_seconds_count{{page="{_label(page)}"}} {count}')
+    lines += [
+        "# HELP findash_stage_seconds Wall time spent in an instrumented page stage.",
+        "# TYPE findash_stage_seconds summary",
+    ]
+    for (page, stage), (count, total) in totals:
+        if stage != "":
+            labels = f'page="{_label(page)}",stage="{_label(stage)}"'
+            lines.append(f"findash_stage_seconds_sum{{{labels}}} {total:.6f}")
+            lines.append(f"findash_stage_seconds_count{{{labels}}} {count}")
+    lines += [
+        "# HELP findash_reruns_incomplete_total Reruns that stopped before finish_rerun().",
+        "# TYPE findash_reruns_incomplete_total counter",
+    ]
+    for page, count in incomplete:
+        lines.append(f'findash_reruns_incomplete_total{{page="{_label(page)}"}} {count}')
+    seen = set()
+    for (metric, labels), count in counts:
+        if metric not in seen:
+            seen.add(metric)
+            lines.append(f"# TYPE {metric} counter")
+        text = ",".join(f'{k}="{_label(str(v))}"' for k, v in labels)
+        lines.append(f"{metric}{{{text}}} {count}" if text else f"{metric} {count}")
+    return "\n".join(lines) + "\n"
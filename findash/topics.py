@@ -0,0 +1,226 @@
+"""Topic clustering of forum text with mini-batch k-means on hashed TF-IDF.
+
+Documents are tokenized with a regular expression, words are hashed into
+``n_features`` buckets (no vocabulary to hold in memory) and each batch
+becomes a CSR matrix of sublinear TF-IDF weights with unit-length rows.
+Document frequencies are running counts, so the IDF keeps up as new posts
+arrive.
+
+:class:`TopicModel` runs mini-batch k-means (Sculley, 2010) on those rows:
+each batch is assigned to the nearest centroid, and every centroid moves
+towards the mean of its new members with a per-centroid learning rate of
+``members / total members seen``. Only the ``(n_topics, n_features)``
+centroids and one batch are in memory at a time, so the corpus size is
+bounded by time, not RAM. :meth:`TopicModel.partial_fit` continues from the
+current centroids.
+"""
+import re
+import zlib
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+FEATURE_CACHE_SIZE = 200_000  # words whose hash is remembered between batches
+TOKEN = re.compile(r"[a-z][a-z0-9']+")
+STOP_WORDS = frozenset("""
+a about above after again against all also am an and any are aren't as at be because been before being
+below between both but by can can't could couldn't did didn't do does doesn't doing don't down during
+each even few for from further get got had hasn't have haven't having he her here hers herself him
+himself his how i i'm i've if in into is isn't it it's its itself just let's like me more most much my
+myself no nor not now of off on once only or other our ours ourselves out over own really same she
+should shouldn't so some still such than that that's the their theirs them themselves then there
+there's these they they're this those through to too under until up us very was wasn't we we're were
+weren't what when where which while who whom why will with won't would wouldn't you you're your yours
+yourself yourselves one two also would could edit http https www com reddit deleted removed
+""".split())
+
+
+def tokenize(text: str) -> list:
+    return [t for t in TOKEN.findall(str(text).lower()) if t not in STOP_WORDS]
+
+
+@dataclass
+class CsrBatch:
+    """Rows of a sparse matrix: row ``i`` is ``data[indptr[i]:indptr[i + 1]]`` at ``indices``."""
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+    def row_ids(self) -> np.ndarray:
+        return np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+
+    def dot(self, dense: np.ndarray) -> np.ndarray:
+        """``self @ dense.T`` for a dense ``(k, n_features)`` array, as ``(n_rows, k)``."""
+        products = dense[:, self.indices] * self.data                  # (k, nnz)
+        out = np.zeros((dense.shape[0], self.n_rows), dtype=dense.dtype)
+        nonempty = np.flatnonzero(np.diff(self.indptr))
+        if len(nonempty):
+            out[:, nonempty] = np.add.reduceat(products, self.indptr[nonempty], axis=1)
+        return out.T
+
+
+class TopicModel:
+    """Mini-batch k-means over hashed TF-IDF vectors; see the module docstring."""
+
+    def __init__(self, n_topics: int = 6, n_features: int = 2**18, batch_size: int = 1024, seed: int = 0):
+        self.n_topics = n_topics
+        self.n_features = n_features
+        self.batch_size = batch_size
+        self.rng = np.random.default_rng(seed)
+        self.doc_freq = np.zeros(n_features, dtype=np.int64)
+        self.n_docs = 0
+        self.terms = {}              # feature -> a word hashed there, for labelling topics
+        self._feature_cache = {}     # word -> feature, bounded by FEATURE_CACHE_SIZE
+        self.centroids = None        # (n_topics, n_features) float32
+        self.counts = np.zeros(n_topics, dtype=np.int64)
+
+    # ---- vectorizing ----
+    def _hash(self, texts):
+        """Raw term counts of ``texts`` as a CSR batch (features sorted within each row)."""
+        tokens, lengths = [], []
+        for text in texts:
+            words = tokenize(text)
+            tokens.extend(words)
+            lengths.append(len(words))
+        lookup = self._feature_cache
+        missing = set(tokens).difference(lookup)
+        if len(lookup) + len(missing) > FEATURE_CACHE_SIZE:
+            lookup.clear()
+            missing = set(tokens)
+        lookup.update((t, zlib.crc32(t.encode("utf-8")) % self.n_features) for t in missing)
+        features = np.fromiter(map(lookup.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+        first = np.unique(features, return_index=True)[1]
+        for f, i in zip(features[first].tolist(), first.tolist()):
+            self.terms.setdefault(f, tokens[i])
+
+        # Count (document, feature) pairs in one pass over the whole batch.
+        doc = np.repeat(np.arange(len(lengths)), lengths)
+        pairs, counts = np.unique(doc * self.n_features + features, return_counts=True)
+        indptr = np.searchsorted(pairs // self.n_features, np.arange(len(lengths) + 1))
+        return CsrBatch(indptr, pairs % self.n_features, counts.astype(np.float32))
+
+    def _update_idf(self, counts: CsrBatch) -> None:
+        np.add.at(self.doc_freq, counts.indices, 1)
+        self.n_docs += counts.n_rows
+
+    def _tfidf(self, counts: CsrBatch) -> CsrBatch:
+        idf = np.log((1.0 + self.n_docs) / (1.0 + self.doc_freq[counts.indices])) + 1.0
+        data = ((1.0 + np.log(counts.data)) * idf).astype(np.float32)
+        rows = counts.row_ids()
+        norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=counts.n_rows))
+        data /= np.where(norms > 0, norms, 1.0)[rows].astype(np.float32)
+        return CsrBatch(counts.indptr, counts.indices, data)
+
+    def vectorize(self, texts) -> CsrBatch:
+        """Unit-length TF-IDF rows for ``texts`` under the current document frequencies."""
+        return self._tfidf(self._hash(texts))
+
+    # ---- clustering ----
+    def _init_centroids(self, x: CsrBatch) -> None:
+        """k-means++ seeding from one batch."""
+        rows = np.flatnonzero(np.diff(x.indptr))
+        self.centroids = np.zeros((self.n_topics, self.n_features), dtype=np.float32)
+        if not len(rows):
+            return
+        chosen = [int(self.rng.choice(rows))]
+        for k in range(self.n_topics):
+            if k:
+                sims = x.dot(self.centroids[:k]).max(axis=1)
+                dist = np.clip(2.0 - 2.0 * sims[rows], 0.0, None)   # squared distance of unit vectors
+                p = dist / dist.sum() if dist.sum() > 0 else None
+                chosen.append(int(self.rng.choice(rows, p=p)))
+            r = chosen[k]
+            span = slice(x.indptr[r], x.indptr[r + 1])
+            self.centroids[k, x.indices[span]] = x.data[span]
+
+    def _assign(self, x: CsrBatch):
+        """Nearest centroid and cosine-style score for each row."""
+        sims = x.dot(self.centroids)
+        sq_norms = np.einsum("ij,ij->i", self.centroids, self.centroids)
+        dist = sq_norms[None, :] - 2.0 * sims                     # + ||x||^2, the same for every centroid
+        labels = dist.argmin(axis=1)
+        return labels, sims[np.arange(x.n_rows), labels]
+
+    def _step(self, x: CsrBatch) -> None:
+        labels, _ = self._assign(x)
+        members = np.bincount(labels, minlength=self.n_topics)
+        total = self.counts + members
+        moved = members > 0
+        # c <- c * (seen / total) + sum(new members) / total
+        scale = np.where(moved, self.counts / np.maximum(total, 1), 1.0).astype(np.float32)
+        self.centroids *= scale[:, None]
+        row_label = labels[x.row_ids()]
+        np.add.at(self.centroids, (row_label, x.indices),
+                  x.data / total[row_label].astype(np.float32))
+        self.counts = total
+
+    def _batches(self, texts):
+        for start in range(0, len(texts), self.batch_size):
+            yield texts[start:start + self.batch_size]
+
+    def partial_fit(self, texts) -> "TopicModel":
+        """Update the document frequencies and centroids with new posts."""
+        texts = list(texts)
+        for batch in self._batches(texts):
+            counts = self._hash(batch)
+            self._update_idf(counts)
+            x = self._tfidf(counts)
+            if self.centroids is None:
+                self._init_centroids(x)
+            self._step(x)
+        return self
+
+    def fit(self, texts, epochs: int = 3) -> "TopicModel":
+        """Count document frequencies in one pass, then ``epochs`` passes of mini-batch k-means."""
+        texts = list(texts)
+        for batch in self._batches(texts):
+            self._update_idf(self._hash(batch))
+        for _ in range(epochs):
+            order = self.rng.permutation(len(texts))
+            shuffled = [texts[i] for i in order]
+            for batch in self._batches(shuffled):
+                x = self.vectorize(batch)
+                if self.centroids is None:
+                    self._init_centroids(x)
+                self._step(x)
+        return self
+
+    def predict(self, texts):
+        """``(labels, scores)``: each text's topic and its similarity to that topic's centroid."""
+        labels, scores = [], []
+        for batch in self._batches(list(texts)):
+            l, s = self._assign(self.vectorize(batch))
+            labels.append(l)
+            scores.append(s)
+        if not labels:
+            return np.zeros(0, dtype=int), np.zeros(0)
+        return np.concatenate(labels), np.concatenate(scores)
+
+    def top_terms(self, n: int = 8) -> list:
+        """The ``n`` heaviest words of each centroid."""
+        if self.centroids is None:
+            return [[] for _ in range(self.n_topics)]
+        top = np.argpartition(-self.centroids, n, axis=1)[:, :n]
+        result = []
+        for k, features in enumerate(top):
+            features = features[np.argsort(-self.centroids[k, features])]
+            result.append([self.terms.get(int(f), f"#{f}") for f in features if self.centroids[k, f] > 0])
+        return result
+
+    def summary(self, texts, n_terms: int = 8, n_examples: int = 3) -> pd.DataFrame:
+        """One row per topic: size, top terms and the posts closest to the centroid."""
+        texts = list(texts)
+        labels, scores = self.predict(texts)
+        terms = self.top_terms(n_terms)
+        rows = []
+        for k in range(self.n_topics):
+            members = np.flatnonzero(labels == k)
+            best = members[np.argsort(-scores[members])[:n_examples]]
+            rows.append({"topic": k + 1, "posts": len(members), "top terms": ", ".join(terms[k]),
+                         "representative posts": [str(texts[i])[:200] for i in best]})
+        return pd.DataFrame(rows).sort_values("posts", ascending=False, ignore_index=True)
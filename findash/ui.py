@@ -0,0 +1,118 @@
+"""Streamlit helpers shared by the pages.
+
+Unlike the rest of :mod:`findash` this module imports Streamlit, so only the
+page scripts should import it.
+"""
+import pandas as pd
+import streamlit as st
+
+from findash import charts, diskcache, export, telemetry, warmup
+from findash.correlation import correlation_view, top_pairs
+
+
+def _debug_requested() -> bool:
+    return st.query_params.get("debug") == "1"
+
+
+def chart_backend() -> str:
+    """Backend for this session's charts: ``?charts=vega-lite`` or ``?charts=matplotlib`` overrides the default."""
+    requested = st.query_params.get("charts")
+    return requested if requested in charts.BACKENDS else charts.DEFAULT_BACKEND
+
+
+def show_chart(chart) -> None:
+    """Render a chart from :mod:`findash.charts`: Vega-Lite specs in the browser, figures as images."""
+    if isinstance(chart, dict):
+        st.vega_lite_chart(chart, use_container_width=True)
+    else:
+        st.pyplot(chart)
+
+
+@st.cache_data(show_spinner=False)
+def _correlation_view(df: pd.DataFrame):
+    # Keyed on the frame's contents, so each data version is computed once.
+    return correlation_view(df)
+
+
+def correlation_panel(df: pd.DataFrame, key: str, backend: str = None, view=None) -> None:
+    """Clustered correlation heatmap with an ``|r|`` filter, plus the top correlated pairs.
+
+    ``view`` is a :func:`~findash.correlation.correlation_view` of ``df``
+    already computed elsewhere (e.g. by a prefetch); otherwise it is cached here.
+    """
+    with telemetry.span("corr"):
+        view = view if view is not None else _correlation_view(df)
+    col1, col2 = st.columns(2)
+    threshold = col1.slider("Hide |r| below", 0.0, 1.0, 0.0, 0.05, key=f"{key}_corr_threshold")
+    k = col2.number_input("Top pairs", 1, 500, 10, key=f"{key}_corr_top")
+    with telemetry.span("figure"):
+        show_chart(charts.correlation_heatmap(view.matrix, view.names, threshold=threshold, backend=backend))
+    st.caption(f"{len(view.names)} indicators, ordered by average-linkage clustering on 1 − |r|.")
+    st.dataframe(top_pairs(view, int(k), threshold), use_container_width=True, hide_index=True)
+
+
+def begin_page(page: str) -> None:
+    """Start timing this rerun. Opening any page with ``?debug=1`` turns recording on."""
+    if not telemetry.enabled() and _debug_requested():
+        telemetry.set_enabled(True)
+    warmup.start_background()  # once per process; returns immediately
+    telemetry.start_rerun(page)
+
+
+def end_page(history: int = 20) -> None:
+    """Close the rerun record and, with ``?debug=1``, show the timing panel."""
+    telemetry.finish_rerun()
+    if not _debug_requested():
+        return
+
+    with st.sidebar.expander("⏱️ Rerun Timings", expanded=False):
+        records = telemetry.recent(history)
+        if not records:
+            st.caption("No reruns recorded yet.")
+            return
+        rows = []
+        for r in records:
+            row = {
+                "Page": r["page"],
+                "Started": pd.Timestamp(r["started"], unit="s").strftime("%H:%M:%S"),
+                "Total (ms)": round(r["total"] * 1000, 1),
+            }
+            for stage, seconds in r["spans"]:
+                key = f"{stage} (ms)"
+                row[key] = round(row.get(key, 0.0) + seconds * 1000, 1)
+            if not r["complete"]:
+                row["Page"] += " (stopped)"
+            rows.append(row)
+        st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+
+        disk = diskcache.default_cache()
+        if disk is not None:
+            info = disk.stats()
+            st.caption(f"Disk cache: {info['hits']} hits, {info['misses']} misses "
+                       f"({info['hit_rate']:.0%}), {info['writes']} writes, {info['evictions']} evicted")
+        warmer = warmup.current()
+        if warmer is not None:
+            st.caption(warmer.report.summary())
+
+        col1, col2 = st.columns(2)
+        col1.download_button(
+            "Prometheus", data=telemetry.to_prometheus, file_name="findash_metrics.prom",
+            mime="text/plain", on_click="ignore",
+        )
+        col2.download_button(
+            "JSON lines", data=telemetry.to_jsonl, file_name="findash_reruns.jsonl",
+            mime="application/x-ndjson", on_click="ignore",
+        )
+
+
+def download_panel(df: pd.DataFrame, label: str, file_stem: str, key: str = None) -> None:
+    """Format picker plus a download button that encodes ``df`` only when clicked."""
+    formats = export.available_formats()
+    col1, col2 = st.columns([1, 3], vertical_alignment="bottom")
+    fmt = col1.selectbox("Format", formats, key=key or f"export_format_{file_stem}",
+                         label_visibility="collapsed")
+    extension, mime = export.FORMATS[fmt]
+    col2.download_button(
+        label, data=lambda: export.export_bytes(df, fmt), file_name=f"{file_stem}.{extension}",
+        mime=mime, on_click="ignore",
+    )
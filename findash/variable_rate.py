@@ -0,0 +1,87 @@
+"""Variable-rate (OPR-linked) mortgage amortization, vectorized across rate paths.
+
+The loan is re-amortized every month over the remaining term at that month's
+rate, which is how a floating BR/OPR-linked loan resets its instalment. With
+``q_t = r_t / ((1 + r_t) ** n_t - 1)`` the instalment is ``B_t * (r_t + q_t)``,
+the principal repaid is ``B_t * q_t`` and the balance carried forward is
+``B_t * (1 - q_t)``. The factor depends only on the month's rate and
+remaining term, so the whole balance schedule is one ``cumprod`` over a
+``(paths, months)`` matrix, with no Python loop over months or paths.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+
+class Amortization(NamedTuple):
+    """Monthly schedules, each shaped ``(paths, months)``."""
+    payment: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    balance: np.ndarray  # after the month's payment
+
+
+def amortize_variable(principal, annual_rates, term_months: int = None) -> Amortization:
+    """Amortize ``principal`` over ``months`` under each path of annual rates.
+
+    ``annual_rates`` is a ``(paths, months)`` array of fractions (0.04), or a
+    1-D array for a single path; the term is its number of columns unless
+    ``term_months`` is longer, in which case only the first ``months`` of
+    that loan are scheduled and ``balance`` ends at the amount outstanding.
+    ``principal`` is a scalar or one value per path.
+    """
+    r = np.atleast_2d(np.asarray(annual_rates, dtype=float)) / 12.0
+    paths, months = r.shape
+    term = months if term_months is None else int(term_months)
+    if term < months:
+        raise ValueError(f"term_months ({term}) is shorter than the {months} months of rates")
+    remaining = np.arange(term, term - months, -1, dtype=float)  # n_t: payments left incl. this one
+
+    # q_t, the share of the opening balance repaid this month (1/n_t at a zero rate).
+    q = (1 + r) ** remaining
+    q -= 1
+    zero = r == 0
+    np.divide(r, q, out=q, where=~zero)
+    if zero.any():
+        q[zero] = np.broadcast_to(1.0 / remaining, r.shape)[zero]
+
+    principal = np.asarray(principal, dtype=float).reshape(-1, 1)
+    opening = np.empty_like(r)
+    opening[:, 0] = 1.0
+    np.cumprod(1 - q[:, :-1], axis=1, out=opening[:, 1:])
+    opening *= principal
+
+    repaid = opening * q
+    interest = opening * r
+    balance = opening - repaid
+    if term == months:
+        balance[:, -1] = 0.0  # exactly zero up to rounding
+    return Amortization(interest + repaid, interest, repaid, balance)
+
+
+def annual_to_monthly(rates_by_year) -> np.ndarray:
+    """Hold each year's rate for 12 months along the last axis."""
+    return np.repeat(np.asarray(rates_by_year, dtype=float), 12, axis=-1)
+
+
+def simulate_opr_paths(history, n_paths: int, years: int, start: float = None,
+                       floor: float = 0.25, cap: float = 6.0, seed: int = None) -> np.ndarray:
+    """Annual OPR paths (percent) by bootstrapping historical year-on-year moves.
+
+    ``history`` is the annual OPR series (e.g. ``Data.csv``'s ``OPR_avg``);
+    paths start from ``start`` (default: its last value) and are clipped to
+    ``[floor, cap]``. Returns ``(n_paths, years)``.
+    """
+    history = np.asarray(history, dtype=float)
+    moves = np.diff(history)
+    if moves.size == 0:
+        moves = np.zeros(1)
+    rng = np.random.default_rng(seed)
+    start = history[-1] if start is None else start
+    steps = rng.choice(moves, size=(n_paths, years))
+    return np.clip(start + np.cumsum(steps, axis=1), floor, cap)
+
+
+def opr_linked_rates(opr_paths, spread: float) -> np.ndarray:
+    """Monthly mortgage rates (fractions) from annual OPR paths (percent) plus a spread (percent)."""
+    return annual_to_monthly((np.asarray(opr_paths, dtype=float) + spread) / 100.0)
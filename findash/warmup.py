@@ -0,0 +1,305 @@
+"""Warm the disk cache after a deploy.
+
+A fresh process starts with empty in-memory caches, so the first visitors
+pay for the Monte Carlo fans, the Sobol analysis and the financing
+optimizer. :class:`Warmer` precomputes a list of requests into the shared
+disk cache (:mod:`findash.diskcache`) on a background thread, so pages
+find the results on their first rerun.
+
+The list is :data:`DEFAULT_REQUESTS` (each page's default inputs) followed
+by the most popular recent requests recorded by earlier processes. Every
+process that started a warmer writes its own most frequent ``cached_call``
+requests back to the popular file (``FINDASH_WARMUP_FILE``, default
+``popular.json`` in the cache directory) when it exits, merged with the
+counts already there under a lock file, so processes exiting together don't
+overwrite each other. Each count carries the time it was last updated and
+halves every ``FINDASH_WARMUP_HALF_LIFE_DAYS`` (default 7), so requests
+nobody makes any more drop out.
+
+Set ``FINDASH_WARMUP=off`` to disable it and ``FINDASH_WARMUP_TOP`` to change
+how many popular requests are kept (default 20). ``python -m findash.warmup``
+runs the same job in the foreground, e.g. from a deploy script.
+"""
+import argparse
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from findash import telemetry
+from findash.diskcache import cache_key, canonical, default_cache
+from findash.montecarlo import index_fan, wealth_fan
+from findash.optimize import optimize_financing
+from findash.scenarios import DEFAULT_SCENARIOS
+from findash.sobol import WEALTH_BOUNDS, sobol_indices
+
+# Namespaces the warmer can compute, with the function the pages call for each.
+TASKS = {
+    "montecarlo.wealth_fan": wealth_fan,
+    "montecarlo.index_fan": index_fan,
+    "sobol": sobol_indices,
+    "optimize_financing": optimize_financing,
+}
+
+# The parameters each page starts with; keep in step with the page widgets.
+DEFAULT_REQUESTS = [
+    ("montecarlo.wealth_fan", {"n_paths": 10_000, "invest_volatility": 0.10, "home_volatility": 0.05, "seed": 42}),
+    *[("montecarlo.index_fan", {"growth": growth, "volatility": 0.12, "n_years": 21, "n_paths": 10_000, "seed": 42})
+      for growth in DEFAULT_SCENARIOS.values()],
+    ("sobol", {"bounds": dict(WEALTH_BOUNDS), "n_evaluations": 100_000, "seed": 0}),
+    ("optimize_financing", {"house_price": 800_000, "mortgage_rate": 0.04, "term_years": 30,
+                            "rent_yield": 0.045, "invest_return": 0.06, "home_appreciation": 0.02,
+                            "rent_growth": 0.0, "max_payment": None, "max_down_cash": None}),
+]
+
+
+@dataclass
+class WarmupReport:
+    requested: int = 0
+    computed: int = 0
+    already_cached: int = 0
+    failed: int = 0
+    started: float = None
+    finished: float = None
+    covered: list = field(default_factory=list)  # namespace of every request now in the cache
+    errors: list = field(default_factory=list)
+
+    @property
+    def running(self) -> bool:
+        return self.started is not None and self.finished is None
+
+    @property
+    def duration(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    def summary(self) -> str:
+        state = "running" if self.running else "done"
+        return (f"Warm-up {state}: {len(self.covered)}/{self.requested} requests in {self.duration:.1f} s "
+                f"({self.computed} computed, {self.already_cached} already cached, {self.failed} failed)")
+
+
+def popular_file(cache=None) -> str:
+    cache = cache or default_cache()
+    return os.environ.get("FINDASH_WARMUP_FILE") or os.path.join(cache.directory, "popular.json")
+
+
+def _jsonable(params: dict) -> bool:
+    try:
+        json.dumps(params)
+        canonical(params)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _half_life() -> float:
+    return float(os.environ.get("FINDASH_WARMUP_HALF_LIFE_DAYS", "7")) * 86400
+
+
+def decayed(entry: dict, now: float = None) -> float:
+    """An entry's count, halved for every half-life since it was last updated."""
+    now = time.time() if now is None else now
+    age = max(0.0, now - entry.get("updated", now))
+    return entry["count"] * 0.5 ** (age / _half_life())
+
+
+def load_popular(path: str) -> list:
+    """``[{"namespace", "params", "count", "updated"}, ...]`` from ``path``, most popular now first.
+
+    Empty if the file is missing or unreadable.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return []
+    entries = [e for e in entries if isinstance(e, dict) and e.get("namespace") in TASKS
+               and isinstance(e.get("params"), dict) and isinstance(e.get("count"), (int, float))]
+    now = time.time()
+    return sorted(entries, key=lambda e: -decayed(e, now))
+
+
+@contextmanager
+def _locked(path: str, timeout: float = 5.0, stale_after: float = 30.0):
+    """Hold ``path + ".lock"`` (created exclusively); a lock older than ``stale_after`` seconds is broken."""
+    lock = path + ".lock"
+    deadline = time.time() + timeout
+    while True:
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock) > stale_after:  # left by a crashed process
+                    os.unlink(lock)
+                    continue
+            except OSError:
+                continue
+            if time.time() > deadline:
+                raise TimeoutError(f"{lock} is held by another process")
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        try:
+            os.unlink(lock)
+        except OSError:
+            pass
+
+
+def save_popular(cache=None, path: str = None, top: int = None) -> int:
+    """Merge this process's most frequent requests into ``path``; returns the number kept.
+
+    The read-merge-write runs under a lock file. Stored counts are decayed
+    to now before this process's counts are added.
+    """
+    cache = cache or default_cache()
+    if cache is None:
+        return 0
+    path = path or popular_file(cache)
+    top = top or int(os.environ.get("FINDASH_WARMUP_TOP", "20"))
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with _locked(path):
+            now = time.time()
+            merged = {}
+            for entry in load_popular(path):
+                merged[cache_key(entry["namespace"], entry["params"])] = {
+                    **entry, "count": decayed(entry, now), "updated": now}
+            for namespace, params, count in cache.popular():
+                if namespace not in TASKS or not _jsonable(params):
+                    continue
+                key = cache_key(namespace, params)
+                entry = merged.setdefault(key, {"namespace": namespace, "params": params,
+                                                "count": 0.0, "updated": now})
+                entry["count"] += count
+            kept = sorted(merged.values(), key=lambda e: -e["count"])[:top]
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(kept, f, indent=1)
+            os.replace(tmp, path)
+    except (OSError, TimeoutError):
+        return 0
+    return len(kept)
+
+
+def warmup_requests(cache=None, top: int = None) -> list:
+    """Page defaults, then the popular requests, without duplicates."""
+    cache = cache or default_cache()
+    top = top or int(os.environ.get("FINDASH_WARMUP_TOP", "20"))
+    requests = list(DEFAULT_REQUESTS)
+    if cache is not None:
+        requests += [(e["namespace"], e["params"]) for e in load_popular(popular_file(cache))[:top]]
+    seen, unique = set(), []
+    for namespace, params in requests:
+        key = cache_key(namespace, params)
+        if key not in seen:
+            seen.add(key)
+            unique.append((namespace, params))
+    return unique
+
+
+class Warmer:
+    """Computes each request into the disk cache on a daemon thread, one at a time."""
+
+    def __init__(self, cache=None, requests: list = None):
+        self.cache = cache or default_cache()
+        self.requests = warmup_requests(self.cache) if requests is None else list(requests)
+        self.report = WarmupReport(requested=len(self.requests))
+        self._thread = None
+
+    def start(self) -> "Warmer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, name="findash-warmup", daemon=True)
+            self._thread.start()
+        return self
+
+    def wait(self, timeout: float = None) -> WarmupReport:
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.report
+
+    def run(self) -> WarmupReport:
+        report = self.report
+        report.started = time.time()
+        # Bring the cache under its size limit before adding to it, off the request path.
+        try:
+            self.cache.evict()
+        except OSError:
+            pass
+        for namespace, params in self.requests:
+            if self.cache.contains(namespace, params):
+                report.already_cached += 1
+                result = "cached"
+            else:
+                try:
+                    self.cache.put(namespace, params, TASKS[namespace](**params))
+                except Exception as e:  # a bad popular entry must not stop the rest
+                    report.failed += 1
+                    report.errors.append(f"{namespace}: {e}")
+                    telemetry.incr("findash_warmup_requests_total", result="failed")
+                    continue
+                report.computed += 1
+                result = "computed"
+            report.covered.append(namespace)
+            telemetry.incr("findash_warmup_requests_total", result=result)
+        report.finished = time.time()
+        return report
+
+
+_warmer = None
+_warmer_lock = threading.Lock()
+
+
+def start_background() -> Warmer:
+    """Start the process's warmer once; later calls return it. ``None`` when disabled."""
+    global _warmer
+    if os.environ.get("FINDASH_WARMUP", "on").lower() in ("off", "0", "false", "no"):
+        return None
+    with _warmer_lock:
+        if _warmer is None:
+            cache = default_cache()
+            if cache is None:
+                return None
+            cache.tracked = frozenset(TASKS)  # count only what the warmer can replay
+            _warmer = Warmer(cache).start()
+            atexit.register(save_popular, cache)
+        return _warmer
+
+
+def current() -> Warmer:
+    """The warmer started by :func:`start_background`, if any."""
+    return _warmer
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m findash.warmup",
+                                     description="Precompute default and popular requests into the disk cache.")
+    parser.add_argument("--top", type=int, default=None, help="popular requests to include")
+    parser.add_argument("--list", action="store_true", help="print the requests without computing them")
+    args = parser.parse_args(argv)
+
+    cache = default_cache()
+    if cache is None:
+        print("Disk cache is disabled (FINDASH_CACHE_DIR=off).")
+        return 1
+    requests = warmup_requests(cache, args.top)
+    if args.list:
+        for namespace, params in requests:
+            print(namespace, json.dumps(canonical(params), sort_keys=True))
+        return 0
+    report = Warmer(cache, requests).run()
+    print(report.summary())
+    for error in report.errors:
+        print("  failed:", error)
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""Buy-vs-rent wealth engine.
+
+Every function accepts scalars or NumPy arrays and broadcasts them against
+each other, so one call can evaluate a single household or a whole grid.
+Scalar inputs give NumPy scalars back.
+"""
+import numpy as np
+
+# Bump whenever a change here (or in the simulation modules) alters results;
+# persisted caches key on it.
+ENGINE_VERSION = 1
+
+
+def _out(x):
+    return x[()] if isinstance(x, np.ndarray) and x.ndim == 0 else x
+
+
+def monthly_mortgage_payment(principal, annual_rate, years):
+    """Calculate monthly mortgage payment."""
+    principal = np.asarray(principal, dtype=float)
+    annual_rate = np.asarray(annual_rate, dtype=float)
+    n = np.asarray(years, dtype=float) * 12
+    r = annual_rate / 12.0
+    zero = annual_rate == 0
+    safe_r = np.where(zero, 1.0, r)
+    growth = (1 + safe_r) ** n
+    pmt = np.where(zero, principal / n, principal * (safe_r * growth) / (growth - 1))
+    return _out(pmt)
+
+
+def fv_lump_sum(pv, annual_rate, years):
+    """Future value of a lump sum investment."""
+    pv = np.asarray(pv, dtype=float)
+    return _out(pv * ((1 + np.asarray(annual_rate, dtype=float)) ** np.asarray(years, dtype=float)))
+
+
+def fv_monthly_annuity(pmt, annual_rate, years):
+    """Future value of monthly contributions."""
+    pmt = np.asarray(pmt, dtype=float)
+    annual_rate = np.asarray(annual_rate, dtype=float)
+    n = np.asarray(years, dtype=float) * 12
+    r = annual_rate / 12.0
+    zero = annual_rate == 0
+    safe_r = np.where(zero, 1.0, r)
+    fv = np.where(zero, pmt * n, pmt * (((1 + safe_r) ** n - 1) / safe_r))
+    return _out(fv)
+
+
+def _annual_blocks(annual_rate, growth):
+    """Per-year quantities for monthly payments that step up once a year.
+
+    Returns the monthly rate ``r``, the effective annual rate ``R`` and the
+    value of one year's 12 payments of 1 at year end (``s12``).
+    """
+    annual_rate = np.asarray(annual_rate, dtype=float)
+    r = annual_rate / 12.0
+    R = (1 + r) ** 12 - 1
+    zero = annual_rate == 0
+    s12 = np.where(zero, 12.0, R / np.where(zero, 1.0, r))
+    return r, R, s12, np.asarray(growth, dtype=float)
+
+
+def fv_growing_annuity(pmt, annual_rate, years, growth):
+    """Future value of monthly contributions that grow by ``growth`` once a year.
+
+    ``pmt`` is the monthly amount in the first year; year ``k`` pays
+    ``pmt * (1 + growth) ** k`` each month. Closed form, no month loop; with
+    ``growth = 0`` this equals :func:`fv_monthly_annuity`.
+    """
+    pmt = np.asarray(pmt, dtype=float)
+    years = np.asarray(years, dtype=float)
+    _, R, s12, g = _annual_blocks(annual_rate, growth)
+    same = np.isclose(R, g, rtol=0.0, atol=1e-12)
+    gap = np.where(same, 1.0, R - g)
+    fv = np.where(
+        same,
+        years * (1 + R) ** np.maximum(years - 1, 0),
+        ((1 + R) ** years - (1 + g) ** years) / gap,
+    )
+    return _out(pmt * s12 * fv)
+
+
+def pv_growing_annuity(pmt, annual_rate, years, growth):
+    """Present value of the payment stream in :func:`fv_growing_annuity`."""
+    years = np.asarray(years, dtype=float)
+    _, R, _, _ = _annual_blocks(annual_rate, growth)
+    return _out(fv_growing_annuity(pmt, annual_rate, years, growth) / (1 + R) ** years)
+
+
+def pv_growing_perpetuity(pmt, annual_rate, growth):
+    """Present value of monthly payments growing once a year forever.
+
+    Finite only when ``growth`` is below the effective annual rate; ``inf``
+    otherwise.
+    """
+    pmt = np.asarray(pmt, dtype=float)
+    _, R, s12, g = _annual_blocks(annual_rate, growth)
+    finite = g < R
+    pv = np.where(finite, pmt * s12 / np.where(finite, R - g, 1.0), np.inf)
+    return _out(pv)
+
+
+def buy_vs_rent_wealth(
+    house_price=800_000.0,
+    down_pct=0.10,
+    mortgage_rate=0.04,
+    term_years=30,
+    rent_yield=0.045,
+    invest_return=0.06,
+    home_appreciation=0.02,
+    rent_growth=0.0,
+):
+    """Compare long-term wealth between buying and renting.
+
+    The renter invests the down payment plus, each month, the mortgage
+    instalment minus rent. Rent escalates by ``rent_growth`` once a year.
+    Returns ``(buy_wealth, rent_wealth, buy_minus_rent)``.
+    """
+    house_price = np.asarray(house_price, dtype=float)
+    down_pct = np.asarray(down_pct, dtype=float)
+    loan = house_price * (1 - down_pct)
+    down = house_price * down_pct
+
+    # Monthly mortgage and rent
+    m_mort = monthly_mortgage_payment(loan, mortgage_rate, term_years)
+    monthly_rent = (house_price * np.asarray(rent_yield, dtype=float)) / 12.0
+
+    # Wealth calculations
+    buy_wealth = fv_lump_sum(house_price, home_appreciation, term_years)
+    rent_wealth = fv_lump_sum(down, invest_return, term_years) + \
+        _fv_contributions(m_mort, monthly_rent, invest_return, term_years, rent_growth)
+    diff = buy_wealth - rent_wealth
+    return _out(buy_wealth), _out(rent_wealth), _out(diff)
+
+
+def _fv_contributions(m_mort, monthly_rent, invest_return, years, rent_growth):
+    rent_growth = np.asarray(rent_growth, dtype=float)
+    if not rent_growth.any():
+        return fv_monthly_annuity(m_mort - monthly_rent, invest_return, years)
+    return fv_monthly_annuity(m_mort, invest_return, years) - \
+        fv_growing_annuity(monthly_rent, invest_return, years, rent_growth)
+
+
+def wealth_trajectory(
+    house_price=800_000.0,
+    down_pct=0.10,
+    mortgage_rate=0.04,
+    term_years=30,
+    rent_yield=0.045,
+    invest_return=0.06,
+    home_appreciation=0.02,
+    rent_growth=0.0,
+):
+    """Year-by-year buy and rent wealth, years ``0..term_years``.
+
+    Inputs broadcast as in :func:`buy_vs_rent_wealth`; ``term_years`` must be
+    a scalar because it sets the length of the returned axis. Returns
+    ``(years, buy, rent)`` where ``buy`` and ``rent`` carry the year axis last.
+    """
+    term_years = int(term_years)
+    years = np.arange(term_years + 1)
+    params = np.broadcast_arrays(*(np.asarray(p, dtype=float) for p in (
+        house_price, down_pct, mortgage_rate, rent_yield, invest_return, home_appreciation, rent_growth)))
+    house_price, down_pct, mortgage_rate, rent_yield, invest_return, home_appreciation, rent_growth = \
+        (p[..., None] for p in params)
+
+    down = house_price * down_pct
+    m_mort = monthly_mortgage_payment(house_price - down, mortgage_rate, term_years)
+    monthly_rent = house_price * rent_yield / 12.0
+
+    buy = fv_lump_sum(house_price, home_appreciation, years)
+    rent = fv_lump_sum(down, invest_return, years) + \
+        _fv_contributions(m_mort, monthly_rent, invest_return, years, rent_growth)
+    return years, buy, rent